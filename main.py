@@ -1,5 +1,6 @@
 """Entry point for the CheckMate desktop application."""
 
+import logging
 import sys
 
 # IMPORTANT: Import easyocr BEFORE PyQt5 to avoid DLL conflicts on Windows
@@ -13,6 +14,7 @@ from PyQt5.QtCore import QTimer
 from omr_software import OMRSoftware
 
 def run_app():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     app = QtWidgets.QApplication(sys.argv)
     window = OMRSoftware()
     window.show()
@@ -1,6 +1,8 @@
 # IMPORTANT: Import easyocr BEFORE PyQt5 to avoid DLL conflicts on Windows
 # Try imports for OCR
 OCR_ENGINE = None
+tesserocr = None
+pytesseract = None
 
 # Try EasyOCR first (must be before PyQt5 imports)
 try:
@@ -9,12 +11,21 @@ try:
     print("EasyOCR loaded successfully")
 except (ImportError, OSError, Exception) as e:
     print(f"Warning: EasyOCR not available ({e})")
-    # Try Tesseract as fallback
+    # Try Tesseract as fallback. tesserocr (optional) runs the Tesseract
+    # library in-process; pytesseract starts the tesseract binary per call
+    try:
+        import tesserocr
+        OCR_ENGINE = "tesseract"
+        print("Using Tesseract (tesserocr)")
+    except (ImportError, OSError, Exception):
+        tesserocr = None
     try:
         import pytesseract
         pytesseract.get_tesseract_version()
         OCR_ENGINE = "tesseract"
         print("Using Tesseract")
+    except ImportError:
+        pytesseract = None
     except:
         pass
 
@@ -28,13 +39,15 @@ from PyQt5.QtWidgets import (
     QDialog, QComboBox, QCheckBox, QTextEdit, QGraphicsRectItem,
     QSpinBox, QGroupBox, QTableWidget, QTableWidgetItem, QSplitter,
     QMessageBox, QInputDialog, QScrollArea, QFrame, QSlider,
-    QGraphicsPixmapItem, QMenu, QAction, QDialogButtonBox, QAbstractItemView
+    QGraphicsPixmapItem, QMenu, QAction, QDialogButtonBox, QAbstractItemView,
+    QProgressDialog, QRadioButton, QLineEdit
 )
 from PyQt5.QtGui import QPixmap, QImage, QPen, QBrush, QColor, QPainter, QFont, QWheelEvent, QCursor, QDesktopServices
-from PyQt5.QtCore import Qt, QRectF, QPointF, QUrl, QObject, QEvent, QThread, pyqtSignal, QSettings, QTimer
+from PyQt5.QtCore import Qt, QRect, QRectF, QPointF, QLineF, QUrl, QObject, QEvent, QThread, pyqtSignal, QSettings, QTimer
 import fitz  # PyMuPDF for PDF rendering
 import sys
 import json
+import logging
 import os
 import re
 import io
@@ -42,20 +55,58 @@ import zipfile
 import shutil
 import cv2
 import numpy as np
-import statistics
-from PIL import Image
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PIL import Image, ImageDraw
 from openpyxl import Workbook
-from openpyxl.styles import Font as XLFont, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font as XLFont, Alignment, PatternFill, NamedStyle
 
 import urllib.request
 import tempfile
 import subprocess
 
+# orjson (optional) speeds up template save/load; falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
 # Mark types
 MARK_TYPE_TEXT = "text"      # Text field (e.g., student name, ID)
 MARK_TYPE_OPTION = "option"  # Answer option (e.g., A, B, C, D)
 MARK_TYPE_ALIGN = "align"    # Alignment reference region
 
+# Shared Excel cell styles. openpyxl styles are immutable, so one instance per
+# category is assigned to every cell and only registered once in the workbook.
+XL_EMPTY_FILL = PatternFill(start_color="FFFFFF00", end_color="FFFFFF00", fill_type="solid")
+XL_MULTI_FILL = PatternFill(start_color="FFFFA500", end_color="FFFFA500", fill_type="solid")
+XL_STATS_FILL = PatternFill(start_color="FF90EE90", end_color="FF90EE90", fill_type="solid")
+XL_HEADER_FONT = XLFont(bold=True)
+XL_CENTER_ALIGN = Alignment(horizontal='center')
+
+
+def _add_xl_named_styles(wb):
+    """Register the answer-highlight and stats styles on wb as named styles.
+
+    Cells then take one style assignment (cell.style = name) instead of a
+    fill, alignment and number format each. Returns (blank, multi, stats)
+    style names.
+    """
+    styles = (
+        NamedStyle(name="OMR Blank", fill=XL_EMPTY_FILL),
+        NamedStyle(name="OMR Multiple", fill=XL_MULTI_FILL),
+        NamedStyle(name="OMR Stats", fill=XL_STATS_FILL, alignment=XL_CENTER_ALIGN,
+                   number_format='0.0"%"'),
+    )
+    for style in styles:
+        wb.add_named_style(style)
+    return tuple(style.name for style in styles)
+
 # Version
 APP_VERSION = "1.6.2"
 
@@ -148,6 +199,44 @@ class UpdateDownloader(QThread):
             if not self._cancelled:
                 self.download_failed.emit(str(e))
 
+class OCRWorker(QThread):
+    """Background thread that OCRs queued text-field crops in batches.
+
+    groups is a list of lists of (p_idx, key, crop); each inner list is OCR'd
+    in OCR_BATCH_SIZE chunks via owner.get_ocr_results_batch. Results are
+    collected in self.results as (p_idx, key, text) for the GUI thread to
+    apply, since the owner's result dict is not touched from here.
+    """
+    progress = pyqtSignal(int, int)   # (crops_done, crops_total)
+
+    def __init__(self, owner, groups, parent=None):
+        super().__init__(parent)
+        self._owner = owner
+        self._groups = groups
+        self._cancelled = False
+        self.results = []
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        total = sum(len(g) for g in self._groups)
+        done = 0
+        for group in self._groups:
+            for start in range(0, len(group), OCR_BATCH_SIZE):
+                if self._cancelled:
+                    return
+                chunk = group[start:start + OCR_BATCH_SIZE]
+                try:
+                    texts = self._owner.get_ocr_results_batch([c for _, _, c in chunk], save_debug=True)
+                except Exception as e:
+                    print(f"  OCR batch failed: {e}")
+                    texts = [""] * len(chunk)
+                self.results.extend((p_idx, key, text) for (p_idx, key, _), text in zip(chunk, texts))
+                done += len(chunk)
+                self.progress.emit(done, total)
+
+
 # ── i18n Translation System ──
 _TRANSLATIONS = {
     "en": {
@@ -158,6 +247,7 @@ _TRANSLATIONS = {
         "chk_first_key": "First page is Answer Key",
         "chk_auto_deskew": "Auto-correct page skew",
         "chk_auto_align": "Auto-align pages (shift)",
+        "chk_gray_preview": "Grayscale page preview (faster)",
         "group_marking": "2. Marking Tools",
         "btn_mark_text": "Mark Text Field",
         "btn_mark_option": "Mark Options",
@@ -259,6 +349,7 @@ _TRANSLATIONS = {
         "menu_settings": "Settings",
         "menu_check_update": "Check for Update",
         "chk_auto_update": "Check for updates on startup",
+        "chk_ocr_heavy_denoise": "Heavy OCR denoising (slower)",
         "update_title": "Update Available",
         "update_msg": "A new version of CheckMate is available!\n\nCurrent version: v{current}\nLatest version: v{latest}",
         "update_whats_new": "What's New",
@@ -283,6 +374,7 @@ _TRANSLATIONS = {
         "chk_first_key": "第一頁為答案",
         "chk_auto_deskew": "自動校正頁面歪斜",
         "chk_auto_align": "自動對齊頁面（位移）",
+        "chk_gray_preview": "灰階預覽頁面（較快）",
         "group_marking": "2. 標記工具",
         "btn_mark_text": "標記文字欄",
         "btn_mark_option": "標記選項",
@@ -384,6 +476,7 @@ _TRANSLATIONS = {
         "menu_settings": "設定",
         "menu_check_update": "檢查更新",
         "chk_auto_update": "啟動時自動檢查更新",
+        "chk_ocr_heavy_denoise": "OCR 強力降噪（較慢）",
         "update_title": "有可用更新",
         "update_msg": "CheckMate 有新版本可用！\n\n目前版本：v{current}\n最新版本：v{latest}",
         "update_whats_new": "更新內容",
@@ -425,45 +518,141 @@ def get_language():
     return _current_lang
 
 
-def deskew_image(img_array):
+def _skew_profile_thumb(gray_small):
+    """Inverted thumbnail (long edge <= 700 px) used for projection profiles;
+    ink is the signal, so white paper becomes 0."""
+    max_dim = max(gray_small.shape[0], gray_small.shape[1])
+    if max_dim > 700:
+        f = 700.0 / max_dim
+        gray_small = cv2.resize(gray_small, None, fx=f, fy=f, interpolation=cv2.INTER_AREA)
+    return cv2.bitwise_not(gray_small)
+
+
+def _profile_score(ink, angle):
+    """Sharpness of the horizontal projection profile of ink rotated by angle.
+    Text lines and table rules aligned with rows give the highest score."""
+    h, w = ink.shape[:2]
+    m = cv2.getRotationMatrix2D((w / 2, h / 2), float(angle), 1.0)
+    rot = cv2.warpAffine(ink, m, (w, h), flags=cv2.INTER_NEAREST,
+                         borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+    proj = rot.sum(axis=1, dtype=np.float32)
+    return float(np.diff(proj).var())
+
+
+def _estimate_skew_profile(ink):
     """
-    Detect and correct skew in scanned page.
-    Returns corrected image and the skew angle.
+    Estimate skew from horizontal projection profiles of a profile thumbnail.
+    Tries angles in [-3, 3] degrees and keeps the one whose row sums change
+    most sharply.
+    Returns the angle, or None if no angle stands out clearly.
     """
-    # Convert to grayscale if needed
-    if len(img_array.shape) == 3:
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-    else:
-        gray = img_array.copy()
+    trial_angles = np.arange(-3, 3.01, 0.2)
+    scores = np.array([_profile_score(ink, ang) for ang in trial_angles])
     
-    # Apply edge detection
-    edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+    mean_score = scores.mean()
+    if mean_score <= 0 or scores.max() / mean_score < 1.3:
+        return None
+    return float(trial_angles[int(scores.argmax())])
+
+
+def _cuda_available():
+    """True if this OpenCV build has CUDA support and a CUDA device."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+_TAN_15_DEG = float(np.tan(np.radians(15.0)))
+
+
+def _estimate_skew_hough(gray_small, scale):
+    """
+    Estimate skew as the median angle of near-horizontal Hough lines.
+    scale is the factor gray_small was reduced by; returns None if no lines.
+    """
+    # Edge map from the vertical derivative only: near-horizontal lines are
+    # all we keep, and a thresholded Sobel skips Canny's NMS/hysteresis
+    gy = cv2.Sobel(gray_small, cv2.CV_16S, 0, 1, ksize=3)
+    edges = cv2.convertScaleAbs(gy)
+    cv2.threshold(edges, 50, 255, cv2.THRESH_BINARY, dst=edges)
     
-    # Detect lines using Hough transform
-    lines = cv2.HoughLinesP(edges, 1, np.pi/180, threshold=100, 
-                            minLineLength=100, maxLineGap=10)
+    # Detect lines using Hough transform (length parameters scaled to match)
+    lines = cv2.HoughLinesP(edges, 1, np.pi/180, threshold=max(1, int(100 * scale)), 
+                            minLineLength=max(1, int(100 * scale)),
+                            maxLineGap=max(1, int(10 * scale)))
     
     if lines is None or len(lines) == 0:
-        return img_array, 0.0
+        return None
     
-    # Calculate angles of detected lines
-    angles = []
-    for line in lines:
-        x1, y1, x2, y2 = line[0]
-        if x2 - x1 != 0:
-            angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
-            # Only consider near-horizontal lines (within 15 degrees)
-            if abs(angle) < 15:
-                angles.append(angle)
+    # Calculate angles of all detected lines at once
+    pts = lines.reshape(-1, 4)
+    dx = pts[:, 2] - pts[:, 0]
+    dy = pts[:, 3] - pts[:, 1]
+    # Only consider near-horizontal lines (within 15 degrees); testing the
+    # slope first means arctan2 only runs on the lines that are kept
+    near_horizontal = (dx > 0) & (np.abs(dy) < _TAN_15_DEG * dx)
+    angles = np.degrees(np.arctan2(dy[near_horizontal], dx[near_horizontal]))
     
-    if not angles:
-        return img_array, 0.0
+    if angles.size == 0:
+        return None
     
     # Get median angle (more robust than mean)
-    skew_angle = np.median(angles)
+    return float(np.median(angles))
+
+
+def detect_skew_angle(img_array):
+    """
+    Detect the skew of a scanned page in degrees.
+    Returns 0.0 for flat pages and angles too small to be worth correcting.
+    """
+    # Convert to grayscale if needed
+    if len(img_array.shape) == 3:
+        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+    else:
+        gray = img_array
+    
+    # Skew angle is scale-invariant, so detect it on a downsampled copy;
+    # only the final rotation below runs at full resolution
+    max_dim = max(gray.shape[0], gray.shape[1])
+    scale = 1.0
+    if max_dim > 1000:
+        scale = 1000.0 / max_dim
+        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
+    # Flat pages are the common case: if the profile at 0 degrees is clearly
+    # sharper than just past the correction threshold, skip the search
+    ink = _skew_profile_thumb(gray)
+    flat_score = _profile_score(ink, 0.0)
+    if flat_score > 0 and flat_score >= 1.3 * max(_profile_score(ink, -0.4), _profile_score(ink, 0.4)):
+        return 0.0
+    
+    # Projection profile first; Hough lines handle weak profiles and larger skews
+    skew_angle = _estimate_skew_profile(ink)
+    if skew_angle is None:
+        skew_angle = _estimate_skew_hough(gray, scale)
+    if skew_angle is None:
+        return 0.0
     
     # Don't correct very small angles
     if abs(skew_angle) < 0.3:
+        return 0.0
+    return skew_angle
+
+
+def deskew_image(img_array, quality="fast", skew_angle=None):
+    """
+    Detect and correct skew in scanned page.
+    quality="fast" rotates with nearest-neighbour sampling, which is enough
+    for bubble scoring and OCR crops; "smooth" uses bilinear sampling for
+    images the user looks at (preview, exported pages).
+    skew_angle skips detection when the page's angle is already known
+    (see OMRSoftware._page_skew_angle).
+    Returns corrected image and the skew angle.
+    """
+    if skew_angle is None:
+        skew_angle = detect_skew_angle(img_array)
+    if skew_angle == 0.0:
         return img_array, 0.0
     
     # Rotate image to correct skew
@@ -482,7 +671,9 @@ def deskew_image(img_array):
     rotation_matrix[1, 2] += (new_h / 2) - center[1]
     
     # Apply rotation with white background
+    interp = cv2.INTER_LINEAR if quality == "smooth" else cv2.INTER_NEAREST
     corrected = cv2.warpAffine(img_array, rotation_matrix, (new_w, new_h), 
+                               flags=interp,
                                borderMode=cv2.BORDER_CONSTANT, 
                                borderValue=(255, 255, 255) if len(img_array.shape) == 3 else 255)
     
@@ -577,6 +768,129 @@ class MovablePixmapItem(QGraphicsPixmapItem):
 # Resize handle size
 RESIZE_HANDLE_SIZE = 10
 
+# Minimum seconds between progress-dialog updates / event pumps in long loops
+PROGRESS_PUMP_INTERVAL = 0.1
+
+# QImage.save quality for exported PNG pages. Qt maps it to a zlib level of
+# (100 - quality) * 9 // 91, so 80 is level 1: several times faster to
+# encode than the default, and only slightly larger on mostly white pages
+EXPORT_PNG_QUALITY = 80
+
+# Number of rendered (and corrected) pages load_page keeps for quick revisits
+PAGE_CACHE_SIZE = 10
+
+# Mark crops recognition keeps in memory instead of writing them out; they are
+# saved when opened from the results table, exported in a debug pack, or
+# evicted from this many
+CROP_CACHE_SIZE = 2000
+
+# Max number of same-sized text-field crops sent to EasyOCR in one batch
+OCR_BATCH_SIZE = 16
+
+# EasyOCR results whose best detection is below this confidence fall through
+# to the next preprocessed variant (gray, then binary) of the crop
+OCR_MIN_CONFIDENCE = 0.55
+
+# Page rendering scale (2x, 144 dpi) shared by display, recognition and
+# export; mark coordinates are in these pixels. Read-only, so one instance
+# serves every render
+RENDER_MATRIX = fitz.Matrix(2, 2)
+
+# 2x2 dilation kernel that thickens Canny edges for alignment template matching
+ALIGN_EDGE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+
+# 3x3 sharpen kernel applied to text-field crops before OCR
+OCR_SHARPEN_KERNEL = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], dtype=np.float32)
+
+# OpenCV's internal thread pool (resize, filters, thresholds): leave one core
+# for the UI thread and PyMuPDF rendering; SIMD code paths stay enabled
+cv2.setNumThreads(max(1, (os.cpu_count() or 1) - 1))
+cv2.setUseOptimized(True)
+
+class _ResultsDict(dict):
+    """Per-page results; a missing page reads as an empty result skeleton."""
+
+    def __missing__(self, p_idx):
+        value = self[p_idx] = {"options": {}, "text": {}, "option_crops": {}, "text_crops": {}}
+        return value
+
+def _load_json_file(path):
+    """Load a template JSON file. Read as bytes so both UTF-8 and the
+    ASCII-escaped output of json.dump load regardless of the locale."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _dump_json_file(data, path):
+    """Write data as indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+# ioctl request number of Linux FICLONE (copy-on-write clone of a whole file)
+# Copy-on-write file clones (optional) for _fast_copy: the FICLONE ioctl on
+# Linux, clonefile() on macOS. _clone_file stays None where neither exists
+_clone_file = None
+if sys.platform.startswith("linux"):
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    if fcntl is not None:
+        _FICLONE = 0x40049409
+
+        def _clone_file(src, dst):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+elif sys.platform == "darwin":
+    try:
+        import ctypes
+        _libc = ctypes.CDLL("libc.dylib", use_errno=True)
+        _libc_clonefile = _libc.clonefile
+    except (ImportError, OSError, AttributeError):
+        _libc_clonefile = None
+    if _libc_clonefile is not None:
+        def _clone_file(src, dst):
+            if os.path.exists(dst):
+                os.remove(dst)  # clonefile refuses to overwrite
+            if _libc_clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), src)
+
+
+def _fast_copy(src, dst):
+    """Copy a file like shutil.copy2, as a copy-on-write clone when the
+    filesystem supports it (Btrfs/XFS on Linux, APFS on macOS), which
+    shares the data blocks instead of reading and writing every byte.
+
+    Hard links are not used: crops are rewritten in place on the next run,
+    which would silently change the exported copy as well.
+    """
+    if _clone_file is not None:
+        try:
+            _clone_file(src, dst)
+            return
+        except OSError:
+            pass  # different filesystems or no clone support
+    shutil.copy2(src, dst)
+
+# Characters replaced when turning crop labels / page names into filenames
+_LABEL_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_FILENAME_RE = re.compile(r'[\\/:*?"<>|\s]+')
+
+# str.translate table deleting every character str.split() treats as whitespace
+_WS_TABLE = dict.fromkeys(i for i in range(0x3001) if chr(i).isspace())
+
+def _normalize_answer(value):
+    """Answer text as compared for grading: whitespace removed, lowercased.
+    Same result as "".join(str(value).split()).lower() without the list
+    and joined temporaries."""
+    return str(value).translate(_WS_TABLE).lower()
+
 class MarkItem(QGraphicsRectItem):
     """A resizable and movable rectangle for marking areas."""
     
@@ -591,6 +905,33 @@ class MarkItem(QGraphicsRectItem):
     HANDLE_LEFT = 7
     HANDLE_RIGHT = 8
     
+    # Paint resources shared by every mark; paint() runs per mark on every
+    # zoom/scroll, so these are created once instead of per frame
+    _PEN_TEXT = QPen(QColor(0, 100, 255), 2)
+    _BRUSH_TEXT = QBrush(QColor(0, 100, 255, 50))
+    _PEN_ALIGN = QPen(QColor(0, 200, 0), 3, Qt.DashLine)
+    _BRUSH_ALIGN = QBrush(QColor(0, 200, 0, 30))
+    _PEN_OPTION = QPen(QColor(255, 0, 0), 2)
+    _BRUSH_OPTION = QBrush(QColor(255, 0, 0, 50))
+    _PEN_DIVIDER = QPen(QColor(255, 0, 0, 150), 1, Qt.DashLine)
+    _PEN_LABEL_DARK = QPen(QColor(100, 0, 0))
+    _PEN_LABEL_ALIGN = QPen(QColor(0, 150, 0))
+    _PEN_BLACK = QPen(Qt.black)
+    _PEN_HANDLE = QPen(QColor(0, 120, 215), 1)
+    _BRUSH_HANDLE = QBrush(QColor(0, 120, 215))
+    _OPT_LABELS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    # Fonts need a running QApplication, so they are built on first paint
+    _FONT_LABEL = None
+    _FONT_Q = None
+    _FONT_ALIGN = None
+    
+    @classmethod
+    def _ensure_fonts(cls):
+        if cls._FONT_LABEL is None:
+            cls._FONT_LABEL = QFont("Segoe UI", 8)
+            cls._FONT_Q = QFont("Segoe UI", 9, QFont.Bold)
+            cls._FONT_ALIGN = QFont("Segoe UI", 10, QFont.Bold)
+    
     def __init__(self, x, y, width, height, mark_type=MARK_TYPE_OPTION, 
                  question_num=1, label="", options_count=4, parent=None, view_ref=None):
         super().__init__(x, y, width, height, parent)
@@ -600,6 +941,9 @@ class MarkItem(QGraphicsRectItem):
         self.options_count = options_count
         self.view_ref = view_ref
         
+        # Handle centers in item coordinates, rebuilt lazily after setRect
+        self._handle_centers = None
+        
         # Resize state
         self.resize_handle = self.HANDLE_NONE
         self.resize_start_rect = None
@@ -614,39 +958,41 @@ class MarkItem(QGraphicsRectItem):
         
     def update_style(self):
         if self.mark_type == MARK_TYPE_TEXT:
-            self.setPen(QPen(QColor(0, 100, 255), 2))
-            self.setBrush(QBrush(QColor(0, 100, 255, 50)))
+            self.setPen(self._PEN_TEXT)
+            self.setBrush(self._BRUSH_TEXT)
         elif self.mark_type == MARK_TYPE_ALIGN:
-            self.setPen(QPen(QColor(0, 200, 0), 3, Qt.DashLine))
-            self.setBrush(QBrush(QColor(0, 200, 0, 30)))
+            self.setPen(self._PEN_ALIGN)
+            self.setBrush(self._BRUSH_ALIGN)
         else:
-            self.setPen(QPen(QColor(255, 0, 0), 2))
-            self.setBrush(QBrush(QColor(255, 0, 0, 50)))
+            self.setPen(self._PEN_OPTION)
+            self.setBrush(self._BRUSH_OPTION)
+    
+    # Handle ids in hit-test priority order (corners before edges)
+    _HANDLE_IDS = (HANDLE_TOP_LEFT, HANDLE_TOP_RIGHT, HANDLE_BOTTOM_LEFT, HANDLE_BOTTOM_RIGHT,
+                   HANDLE_TOP, HANDLE_BOTTOM, HANDLE_LEFT, HANDLE_RIGHT)
+    
+    def setRect(self, *args):
+        self._handle_centers = None
+        super().setRect(*args)
     
     def get_handle_at_pos(self, pos):
         """Determine which resize handle (if any) is at the given position."""
-        rect = self.rect()
-        hs = RESIZE_HANDLE_SIZE
+        if self._handle_centers is None:
+            rect = self.rect()
+            left, right = rect.x(), rect.right()
+            top, bottom = rect.y(), rect.bottom()
+            mid_x = left + rect.width() / 2
+            mid_y = top + rect.height() / 2
+            self._handle_centers = (
+                np.array([left, right, left, right, mid_x, mid_x, left, right]),
+                np.array([top, top, bottom, bottom, top, bottom, mid_y, mid_y]),
+            )
         
-        # Corner handles
-        if QRectF(rect.x() - hs/2, rect.y() - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_TOP_LEFT
-        if QRectF(rect.right() - hs/2, rect.y() - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_TOP_RIGHT
-        if QRectF(rect.x() - hs/2, rect.bottom() - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_BOTTOM_LEFT
-        if QRectF(rect.right() - hs/2, rect.bottom() - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_BOTTOM_RIGHT
-        
-        # Edge handles
-        if QRectF(rect.x() + rect.width()/2 - hs/2, rect.y() - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_TOP
-        if QRectF(rect.x() + rect.width()/2 - hs/2, rect.bottom() - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_BOTTOM
-        if QRectF(rect.x() - hs/2, rect.y() + rect.height()/2 - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_LEFT
-        if QRectF(rect.right() - hs/2, rect.y() + rect.height()/2 - hs/2, hs, hs).contains(pos):
-            return self.HANDLE_RIGHT
+        cx, cy = self._handle_centers
+        half = RESIZE_HANDLE_SIZE / 2
+        hit = (np.abs(cx - pos.x()) <= half) & (np.abs(cy - pos.y()) <= half)
+        if hit.any():
+            return self._HANDLE_IDS[int(hit.argmax())]
         
         return self.HANDLE_NONE
     
@@ -732,67 +1078,89 @@ class MarkItem(QGraphicsRectItem):
             return
         super().mouseReleaseEvent(event)
         
+    def _paint_geometry(self, rect):
+        """Return (dividers, cell_rects, handle_rects) for paint(), cached
+        until the rect or the option count changes."""
+        key = (rect.x(), rect.y(), rect.width(), rect.height(), self.options_count)
+        cached = getattr(self, "_paint_geom", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        dividers = []
+        cell_rects = []
+        if self.mark_type == MARK_TYPE_OPTION:
+            cell_width = rect.width() / self.options_count
+            for i in range(self.options_count):
+                x = rect.x() + i * cell_width
+                if i > 0:
+                    dividers.append(QLineF(int(x), int(rect.y()), int(x), int(rect.y() + rect.height())))
+                cell_rects.append(QRectF(x, rect.y(), cell_width, rect.height()))
+        
+        hs = RESIZE_HANDLE_SIZE
+        mid_x = rect.x() + rect.width()/2
+        mid_y = rect.y() + rect.height()/2
+        handle_rects = [
+            # Corner handles
+            QRect(int(rect.x() - hs/2), int(rect.y() - hs/2), hs, hs),
+            QRect(int(rect.right() - hs/2), int(rect.y() - hs/2), hs, hs),
+            QRect(int(rect.x() - hs/2), int(rect.bottom() - hs/2), hs, hs),
+            QRect(int(rect.right() - hs/2), int(rect.bottom() - hs/2), hs, hs),
+            # Edge handles
+            QRect(int(mid_x - hs/2), int(rect.y() - hs/2), hs, hs),
+            QRect(int(mid_x - hs/2), int(rect.bottom() - hs/2), hs, hs),
+            QRect(int(rect.x() - hs/2), int(mid_y - hs/2), hs, hs),
+            QRect(int(rect.right() - hs/2), int(mid_y - hs/2), hs, hs),
+        ]
+        
+        geom = (dividers, cell_rects, handle_rects)
+        self._paint_geom = (key, geom)
+        return geom
+        
     def paint(self, painter, option, widget):
         super().paint(painter, option, widget)
         rect = self.rect()
+        self._ensure_fonts()
+        dividers, cell_rects, handle_rects = self._paint_geometry(rect)
         
         if self.mark_type == MARK_TYPE_OPTION:
-            # Draw cell divisions for options
-            cell_width = rect.width() / self.options_count
-            option_labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            
-            # Draw vertical dividers
-            painter.setPen(QPen(QColor(255, 0, 0, 150), 1, Qt.DashLine))
-            for i in range(1, self.options_count):
-                x = rect.x() + i * cell_width
-                painter.drawLine(int(x), int(rect.y()), int(x), int(rect.y() + rect.height()))
+            # Draw cell divisions for options in a single call
+            painter.setPen(self._PEN_DIVIDER)
+            if dividers:
+                painter.drawLines(dividers)
             
             # Draw option labels (A, B, C, D...)
-            painter.setPen(QPen(QColor(100, 0, 0)))
-            painter.setFont(QFont("Segoe UI", 8))
-            for i in range(self.options_count):
-                cell_rect = QRectF(rect.x() + i * cell_width, rect.y(), cell_width, rect.height())
-                painter.drawText(cell_rect, Qt.AlignCenter, option_labels[i])
+            painter.setPen(self._PEN_LABEL_DARK)
+            painter.setFont(self._FONT_LABEL)
+            for cell_rect, opt_label in zip(cell_rects, self._OPT_LABELS):
+                painter.drawText(cell_rect, Qt.AlignCenter, opt_label)
             
             # Draw question number at top
-            painter.setPen(QPen(Qt.black))
-            painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+            painter.setPen(self._PEN_BLACK)
+            painter.setFont(self._FONT_Q)
             display_text = f"Q{self.question_num}"
             if self.label:
                 display_text += f" ({self.label})"
             painter.drawText(int(rect.x()), int(rect.y()) - 3, display_text)
         elif self.mark_type == MARK_TYPE_ALIGN:
             # Alignment reference - show label with number
-            painter.setPen(QPen(QColor(0, 150, 0)))
-            painter.setFont(QFont("Segoe UI", 10, QFont.Bold))
+            painter.setPen(self._PEN_LABEL_ALIGN)
+            painter.setFont(self._FONT_ALIGN)
             display_text = f"📍 {tr('align_overlay')} {self.question_num}"
             if self.label:
                 display_text = f"📍 {self.label}"
             painter.drawText(rect, Qt.AlignCenter, display_text)
         else:
             # Text field - just show the label
-            painter.setPen(QPen(Qt.black))
-            painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+            painter.setPen(self._PEN_BLACK)
+            painter.setFont(self._FONT_Q)
             display_text = self.label if self.label else f"Field {self.question_num}"
             painter.drawText(rect, Qt.AlignCenter, display_text)
         
         # Draw resize handles when selected
         if self.isSelected():
-            hs = RESIZE_HANDLE_SIZE
-            painter.setPen(QPen(QColor(0, 120, 215), 1))
-            painter.setBrush(QBrush(QColor(0, 120, 215)))
-            
-            # Corner handles
-            painter.drawRect(int(rect.x() - hs/2), int(rect.y() - hs/2), hs, hs)
-            painter.drawRect(int(rect.right() - hs/2), int(rect.y() - hs/2), hs, hs)
-            painter.drawRect(int(rect.x() - hs/2), int(rect.bottom() - hs/2), hs, hs)
-            painter.drawRect(int(rect.right() - hs/2), int(rect.bottom() - hs/2), hs, hs)
-            
-            # Edge handles
-            painter.drawRect(int(rect.x() + rect.width()/2 - hs/2), int(rect.y() - hs/2), hs, hs)
-            painter.drawRect(int(rect.x() + rect.width()/2 - hs/2), int(rect.bottom() - hs/2), hs, hs)
-            painter.drawRect(int(rect.x() - hs/2), int(rect.y() + rect.height()/2 - hs/2), hs, hs)
-            painter.drawRect(int(rect.right() - hs/2), int(rect.y() + rect.height()/2 - hs/2), hs, hs)
+            painter.setPen(self._PEN_HANDLE)
+            painter.setBrush(self._BRUSH_HANDLE)
+            painter.drawRects(handle_rects)
         
     def contextMenuEvent(self, event):
         menu = QMenu()
@@ -854,6 +1222,7 @@ class MarkingView(QGraphicsView):
         self.current_mark_type = MARK_TYPE_OPTION
         self.start_point = None
         self.current_rect = None
+        self._last_drag_pt = None  # Last viewport position used while drawing a mark
         
         # Counters
         self.option_counter = 1
@@ -871,8 +1240,9 @@ class MarkingView(QGraphicsView):
         self.last_align_size = (200, 80)  # Default alignment region size
         self.align_counter = 1  # Counter for alignment marks
         
-        # Zoom
+        # Zoom (one transform reused for every zoom step)
         self.zoom_factor = 1.0
+        self._zoom_xform = QtGui.QTransform()
         
     def set_marking_mode(self, enabled, mark_type=MARK_TYPE_OPTION):
         self.marking_mode = enabled
@@ -913,19 +1283,24 @@ class MarkingView(QGraphicsView):
         else:
             super().wheelEvent(event)
             
+    def _apply_zoom(self):
+        self._zoom_xform.reset()
+        self._zoom_xform.scale(self.zoom_factor, self.zoom_factor)
+        self.setTransform(self._zoom_xform)
+            
     def zoom_in(self):
         if self.zoom_factor < 10.0:  # Max zoom limit
             self.zoom_factor *= 1.2
-            self.setTransform(QtGui.QTransform().scale(self.zoom_factor, self.zoom_factor))
+            self._apply_zoom()
             
     def zoom_out(self):
         if self.zoom_factor > 0.1:  # Min zoom limit
             self.zoom_factor /= 1.2
-            self.setTransform(QtGui.QTransform().scale(self.zoom_factor, self.zoom_factor))
+            self._apply_zoom()
     
     def zoom_reset(self):
         self.zoom_factor = 1.0
-        self.setTransform(QtGui.QTransform().scale(1.0, 1.0))
+        self._apply_zoom()
     
     def zoom_fit(self):
         """Fit the entire scene in the view"""
@@ -937,6 +1312,7 @@ class MarkingView(QGraphicsView):
     def mousePressEvent(self, event):
         if self.marking_mode and event.button() == Qt.LeftButton:
             self.start_point = self.mapToScene(event.pos())
+            self._last_drag_pt = event.pos()
             
             if self.current_mark_type == MARK_TYPE_TEXT:
                 counter = self.text_counter
@@ -958,6 +1334,11 @@ class MarkingView(QGraphicsView):
             
     def mouseMoveEvent(self, event):
         if self.marking_mode and self.current_rect and self.start_point:
+            # High-rate mice send many sub-pixel moves; only resize the mark
+            # once the cursor has moved at least 2 device pixels
+            if self._last_drag_pt is not None and (event.pos() - self._last_drag_pt).manhattanLength() < 2:
+                return
+            self._last_drag_pt = event.pos()
             current_pos = self.mapToScene(event.pos())
             # Calculate width and height from start point
             dx = current_pos.x() - self.start_point.x()
@@ -1033,9 +1414,25 @@ class MarkingView(QGraphicsView):
             
             self.current_rect = None
             self.start_point = None
+            self._last_drag_pt = None
         else:
             super().mouseReleaseEvent(event)
 
+    # Structured layout for vectorized geometry over many marks
+    MARKS_DTYPE = np.dtype([('type', 'i1'), ('q', 'i4'), ('oc', 'i1'),
+                            ('x', 'f8'), ('y', 'f8'), ('w', 'f8'), ('h', 'f8')])
+    MARK_TYPE_CODES = {MARK_TYPE_TEXT: 0, MARK_TYPE_OPTION: 1, MARK_TYPE_ALIGN: 2}
+
+    def get_marks_array(self, marks):
+        """Snapshot marks' scene bounding rects into a MARKS_DTYPE array,
+        in the same order as the marks list."""
+        arr = np.empty(len(marks), dtype=self.MARKS_DTYPE)
+        for i, mark in enumerate(marks):
+            r = mark.sceneBoundingRect()
+            arr[i] = (self.MARK_TYPE_CODES.get(mark.mark_type, 1), mark.question_num, mark.options_count,
+                      r.x(), r.y(), r.width(), r.height())
+        return arr
+
     def get_all_marks_data(self):
         marks_data = {
             "text_marks": [],
@@ -1079,11 +1476,17 @@ class OMRSoftware(QMainWindow):
         
         # OCR Init
         self.ocr_reader = None
+        self._ocr_reader_lock = threading.Lock()
+        self._crop_store = OrderedDict()
+        self._crop_store_lock = threading.Lock()
+        self.ts_api = None
+        self._ts_api_lock = threading.Lock()
         self.ocr_engine_name = OCR_ENGINE
         self.init_ocr()
         
         # Data
         self.pdf_document = None
+        self.skew_angles = {} # Detected skew per page of the open PDF
         self.current_page = 0
         self.page_offsets = {} # Store (x,y) of image per page
         self.marks_data = {} # Full template data
@@ -1101,40 +1504,73 @@ class OMRSoftware(QMainWindow):
         # Settings (persistent)
         self._settings = QSettings("CheckMate", "CheckMate")
         self._update_thread = None
+        # NL-means denoising before OCR is much slower than the bilateral default
+        self.ocr_heavy_denoise = self._settings.value("ocr_heavy_denoise", False, type=bool)
 
         self.init_ui()
         
     def init_ocr(self):
         if self.ocr_engine_name == "easyocr":
             print("Using EasyOCR")
+            self._start_reader_warmup()
         elif self.ocr_engine_name == "tesseract":
             print("Using Tesseract")
         else:
             print("No OCR engine found")
 
     def _prepare_alignment_gray(self, img_np, target_size=None):
+        """Grayscale, blur and resize img_np for alignment.
+
+        Intermediate and output arrays are kept per thread in self._align_tls
+        and reused while page shapes stay the same, so the returned array is
+        overwritten by the next call on the same thread; copy it if it must
+        outlive that.
+        """
+        tls = self._align_thread_state()
+        buf = getattr(tls, "buf", None)
+        if buf is None:
+            buf = tls.buf = {}
+
+        def _buffer(name, shape):
+            arr = buf.get(name)
+            if arr is None or arr.shape != shape:
+                arr = buf[name] = np.empty(shape, dtype=np.uint8)
+            return arr
+
         if len(img_np.shape) == 3:
-            gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY)
+            gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY, dst=_buffer('gray', img_np.shape[:2]))
         else:
-            gray = img_np.copy()
-
-        gray = cv2.GaussianBlur(gray, (5, 5), 0)
+            gray = img_np
 
+        src_h, src_w = gray.shape[:2]
         if target_size is not None:
             target_w, target_h = target_size
-            scale_x = target_w / gray.shape[1]
-            scale_y = target_h / gray.shape[0]
-            gray = cv2.resize(gray, (target_w, target_h), interpolation=cv2.INTER_AREA)
-            return gray, scale_x, scale_y
-
-        # Normalize size to max dimension 800
-        max_dim = max(gray.shape[0], gray.shape[1])
-        if max_dim > 800:
+        else:
+            # Normalize size to max dimension 800
+            max_dim = max(src_h, src_w)
+            if max_dim <= 800:
+                gray = cv2.GaussianBlur(gray, (5, 5), 0, dst=_buffer('blur', gray.shape[:2]))
+                return gray, 1.0, 1.0
             scale = 800.0 / max_dim
-            gray = cv2.resize(gray, (int(gray.shape[1] * scale), int(gray.shape[0] * scale)), interpolation=cv2.INTER_AREA)
+            target_w, target_h = int(src_w * scale), int(src_h * scale)
+
+        # pyrDown blurs and halves in one pass, so it replaces the Gaussian
+        # blur; only the fractional remainder goes through resize
+        halved = False
+        while gray.shape[1] >= 2 * target_w and gray.shape[0] >= 2 * target_h:
+            gray = cv2.pyrDown(gray)
+            halved = True
+        if not halved:
+            gray = cv2.GaussianBlur(gray, (5, 5), 0, dst=_buffer('blur', gray.shape[:2]))
+        if gray.shape[1] != target_w or gray.shape[0] != target_h:
+            gray = cv2.resize(gray, (target_w, target_h), dst=_buffer('resized', (target_h, target_w)),
+                              interpolation=cv2.INTER_AREA)
+
+        scale_x = target_w / src_w
+        scale_y = target_h / src_h
+        if target_size is None:
             return gray, scale, scale
-
-        return gray, 1.0, 1.0
+        return gray, scale_x, scale_y
 
     def align_image(self, img_np, page_idx=0):
         """
@@ -1146,10 +1582,24 @@ class OMRSoftware(QMainWindow):
         if not hasattr(self, 'check_auto_align') or not self.check_auto_align.isChecked():
             return img_np, (0.0, 0.0), 0.0
 
+        # Check if user defined alignment region(s)
+        use_templates = hasattr(self, 'view') and len(self.view.align_marks) > 0
+        return self._align_page(img_np, page_idx, use_templates)
+
+    def _align_reference_ready(self, use_templates):
+        """True once the reference page of the run has been recorded. After
+        that, aligning a page only reads shared state and may run on a worker
+        thread."""
+        if use_templates:
+            return bool(getattr(self, 'align_templates', None))
+        return getattr(self, 'align_reference_bounds', None) is not None
+
+    def _align_page(self, img_np, page_idx, use_templates):
+        """align_image without the UI checks, so it can be called off the main
+        thread once _align_reference_ready() is True."""
         h, w = img_np.shape[:2]
         
-        # Check if user defined alignment region(s)
-        if hasattr(self, 'view') and len(self.view.align_marks) > 0:
+        if use_templates:
             return self._align_using_template(img_np, page_idx)
         
         # Fall back to automatic table boundary detection
@@ -1232,12 +1682,47 @@ class OMRSoftware(QMainWindow):
         # Subsequent pages: find templates and calculate correction
         return self._align_match_page(img_np, page_idx)
     
+    def _page_skew_angle(self, img_np, p_idx):
+        """Skew angle of page p_idx of the open PDF, detected once per document.
+
+        Recognition, re-recognition, image export and the preview all deskew
+        the same scans; the angle depends only on the page, so later passes
+        skip detection and only rotate. Safe to call from worker threads.
+        self.skew_angles is cleared whenever a PDF is opened.
+        """
+        angle = self.skew_angles.get(p_idx)
+        if angle is None:
+            angle = self.skew_angles[p_idx] = detect_skew_angle(img_np)
+        return angle
+
     def _reset_align_templates(self):
         """Reset all alignment template data. Call before each new recognition run."""
         self.align_templates = []
         self.align_ref_full_gray = None
         self.align_reference_gray = None
         self.align_reference_bounds = None
+        self.align_phase_ref = None
+        self.align_rot_ref_edges = None
+        # Displayed pages were aligned against the old reference
+        self._page_cache = None
+
+    def _align_thread_state(self):
+        """threading.local holding per-thread alignment scratch objects, so
+        pages can be aligned on worker threads concurrently."""
+        tls = getattr(self, '_align_tls', None)
+        if tls is None:
+            tls = self._align_tls = threading.local()
+        return tls
+
+    def _get_align_clahe(self):
+        """CLAHE instance used by template extraction and page matching.
+        Created once per thread (CLAHE objects keep internal buffers); the
+        settings never change between pages or runs."""
+        tls = self._align_thread_state()
+        clahe = getattr(tls, 'clahe', None)
+        if clahe is None:
+            clahe = tls.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        return clahe
 
     def _align_init_template(self, img_np, page_idx):
         """Extract and store alignment templates from the first (reference) page.
@@ -1277,17 +1762,23 @@ class OMRSoftware(QMainWindow):
             
             # Store edge-enhanced template (primary matching target)
             template_edges = cv2.Canny(template_gray, 50, 150)
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-            template_edges = cv2.dilate(template_edges, kernel, iterations=1)
+            template_edges = cv2.dilate(template_edges, ALIGN_EDGE_KERNEL, iterations=1)
             
             # Store CLAHE-enhanced template for secondary verification
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            template_clahe = clahe.apply(template_gray)
+            template_clahe = self._get_align_clahe().apply(template_gray)
+            
+            # Downsampled gray templates (1/2, 1/4) for coarse-to-fine search
+            gray_pyr = []
+            level = template_gray
+            while len(gray_pyr) < 2 and min(level.shape[:2]) >= 32:
+                level = cv2.pyrDown(level)
+                gray_pyr.append(level)
             
             self.align_templates.append({
                 'gray': template_gray,
                 'edges': template_edges,
                 'clahe': template_clahe,
+                'gray_pyr': gray_pyr,
                 'pos': (ref_x, ref_y),
                 'size': (end_x - ref_x, end_y - ref_y),
             })
@@ -1299,8 +1790,29 @@ class OMRSoftware(QMainWindow):
             print("  Template align: No valid alignment regions found")
             return img_np, (0.0, 0.0), 0.0
         
-        # Store full-page reference gray for rotation detection
-        self.align_ref_full_gray = gray.copy()
+        # Upload templates once so each page only transfers its search regions
+        if _cuda_available():
+            try:
+                if getattr(self, '_cuda_matcher', None) is None:
+                    self._cuda_matcher = cv2.cuda.createTemplateMatching(cv2.CV_8UC1, cv2.TM_CCOEFF_NORMED)
+                    self._cuda_match_lock = threading.Lock()
+                for tmpl in self.align_templates:
+                    gpu = {}
+                    for kind in ('edges', 'clahe', 'gray'):
+                        g = cv2.cuda_GpuMat()
+                        g.upload(tmpl[kind])
+                        gpu[kind] = g
+                    tmpl['gpu'] = gpu
+                print("  Template align: Using CUDA template matching")
+            except cv2.error as e:
+                print(f"  Template align: CUDA unavailable ({e}), using CPU")
+                for tmpl in self.align_templates:
+                    tmpl.pop('gpu', None)
+        
+        # Store full-page reference gray for rotation detection; gray is already
+        # our own uint8 array (cvtColor output or a copy), so keep it as is
+        self.align_ref_full_gray = gray
+        self.align_rot_ref_edges = None
         
         print(f"  Template align: {len(self.align_templates)} reference template(s) initialized")
         return img_np, (0.0, 0.0), 1.0
@@ -1339,40 +1851,63 @@ class OMRSoftware(QMainWindow):
                 print(f"  Template align #{t_idx+1}: Search region too small, skipping")
                 continue
             
-            # === Strategy 1: Edge-based matching (primary - most robust) ===
+            # Edge/CLAHE images are built over the whole search region so their
+            # values do not depend on how tightly the window below is cropped
             search_edges = cv2.Canny(search_gray, 50, 150)
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-            search_edges = cv2.dilate(search_edges, kernel, iterations=1)
+            search_edges = cv2.dilate(search_edges, ALIGN_EDGE_KERNEL, iterations=1)
+            
+            # Coarse-to-fine: locate the template on the gray pyramid, then run
+            # the three full-resolution strategies only in a +/-4 px window
+            win_x1, win_y1 = 0, 0
+            win_x2, win_y2 = search_gray.shape[1], search_gray.shape[0]
+            coarse = self._coarse_match_location(search_gray, tmpl)
+            if coarse is not None:
+                cx, cy = coarse
+                win_x1 = max(0, cx - 4)
+                win_y1 = max(0, cy - 4)
+                win_x2 = min(search_gray.shape[1], cx + template_w + 4)
+                win_y2 = min(search_gray.shape[0], cy + template_h + 4)
+                if win_x2 - win_x1 < template_w or win_y2 - win_y1 < template_h:
+                    # Rounding pushed the window off the region; search all of it
+                    win_x1, win_y1 = 0, 0
+                    win_x2, win_y2 = search_gray.shape[1], search_gray.shape[0]
             
-            edge_result = cv2.matchTemplate(search_edges, tmpl['edges'], cv2.TM_CCOEFF_NORMED)
+            # === Strategy 1: Edge-based matching (primary - most robust) ===
+            edge_result = self._match_template(search_edges[win_y1:win_y2, win_x1:win_x2], tmpl, 'edges')
             _, edge_max_val, _, edge_max_loc = cv2.minMaxLoc(edge_result)
+            candidates = [("edge", edge_max_val, edge_max_loc, edge_result)]
+            
+            # The secondary strategies only run when the edge match is not
+            # already confident, and gray only when edge and CLAHE disagree
+            if edge_max_val < 0.5:
+                # === Strategy 2: CLAHE-enhanced matching (secondary verification) ===
+                search_clahe = self._get_align_clahe().apply(search_gray)
+                clahe_result = self._match_template(search_clahe[win_y1:win_y2, win_x1:win_x2], tmpl, 'clahe')
+                _, clahe_max_val, _, clahe_max_loc = cv2.minMaxLoc(clahe_result)
+                candidates.append(("clahe", clahe_max_val, clahe_max_loc, clahe_result))
+                
+                agree = (abs(edge_max_loc[0] - clahe_max_loc[0]) +
+                         abs(edge_max_loc[1] - clahe_max_loc[1])) <= 5
+                if not agree:
+                    # === Strategy 3: Raw grayscale matching (fallback) ===
+                    gray_result = self._match_template(search_gray[win_y1:win_y2, win_x1:win_x2], tmpl, 'gray')
+                    _, gray_max_val, _, gray_max_loc = cv2.minMaxLoc(gray_result)
+                    candidates.append(("gray", gray_max_val, gray_max_loc, gray_result))
             
-            # === Strategy 2: CLAHE-enhanced matching (secondary verification) ===
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            search_clahe = clahe.apply(search_gray)
-            
-            clahe_result = cv2.matchTemplate(search_clahe, tmpl['clahe'], cv2.TM_CCOEFF_NORMED)
-            _, clahe_max_val, _, clahe_max_loc = cv2.minMaxLoc(clahe_result)
-            
-            # === Strategy 3: Raw grayscale matching (fallback) ===
-            gray_result = cv2.matchTemplate(search_gray, tmpl['gray'], cv2.TM_CCOEFF_NORMED)
-            _, gray_max_val, _, gray_max_loc = cv2.minMaxLoc(gray_result)
-            
-            print(f"  Template align #{t_idx+1}: Page {page_idx+1}, confidence - edge={edge_max_val:.3f}, clahe={clahe_max_val:.3f}, gray={gray_max_val:.3f}")
+            print(f"  Template align #{t_idx+1}: Page {page_idx+1}, confidence - " +
+                  ", ".join(f"{name}={val:.3f}" for name, val, _, _ in candidates))
             
             # === Select best result with cross-validation ===
-            candidates = [
-                ("edge", edge_max_val, edge_max_loc, edge_result),
-                ("clahe", clahe_max_val, clahe_max_loc, clahe_result),
-                ("gray", gray_max_val, gray_max_loc, gray_result),
-            ]
-            
             candidates.sort(key=lambda c: c[1], reverse=True)
             
             best_name, best_val, best_loc, best_result = candidates[0]
-            second_name, second_val, second_loc, _ = candidates[1]
-            
-            loc_diff = abs(best_loc[0] - second_loc[0]) + abs(best_loc[1] - second_loc[1])
+            if len(candidates) > 1:
+                second_name, second_val, second_loc, _ = candidates[1]
+                loc_diff = abs(best_loc[0] - second_loc[0]) + abs(best_loc[1] - second_loc[1])
+            else:
+                # Edge alone was confident: nothing to cross-check against
+                second_val = 0.0
+                loc_diff = 0
             
             if best_val < 0.3:
                 print(f"  Template align #{t_idx+1}: Low confidence (best={best_val:.3f}), skipping this mark")
@@ -1388,8 +1923,8 @@ class OMRSoftware(QMainWindow):
             sub_px, sub_py = self._subpixel_refine(best_result, px, py)
             
             # Convert to full image coordinates
-            match_x = search_x1 + sub_px
-            match_y = search_y1 + sub_py
+            match_x = search_x1 + win_x1 + sub_px
+            match_y = search_y1 + win_y1 + sub_py
             
             # Calculate translation shift
             t_dx = ref_x - match_x
@@ -1485,6 +2020,123 @@ class OMRSoftware(QMainWindow):
         
         return aligned, (dx, dy), effective_confidence
     
+    def _coarse_match_location(self, search_gray, tmpl):
+        """Estimate the template's top-left in search_gray with a gray-image
+        pyramid: full search at the coarsest level, then +/-8 px refinement
+        per level. Returns (x, y) at full resolution, or None if the template
+        has no pyramid or the coarse match is weak."""
+        pyr = tmpl.get('gray_pyr') or []
+        if not pyr:
+            return None
+        
+        tmpl_levels = [tmpl['gray']] + pyr
+        search_levels = [search_gray]
+        for _ in pyr:
+            search_levels.append(cv2.pyrDown(search_levels[-1]))
+        
+        top = len(pyr)
+        s_img, t_img = search_levels[top], tmpl_levels[top]
+        if s_img.shape[0] < t_img.shape[0] or s_img.shape[1] < t_img.shape[1]:
+            return None
+        _, max_val, _, (x, y) = cv2.minMaxLoc(cv2.matchTemplate(s_img, t_img, cv2.TM_CCOEFF_NORMED))
+        if max_val < 0.3:
+            return None
+        
+        for lvl in range(top - 1, 0, -1):
+            x, y = x * 2, y * 2
+            s_img, t_img = search_levels[lvl], tmpl_levels[lvl]
+            x1 = max(0, x - 8)
+            y1 = max(0, y - 8)
+            x2 = min(s_img.shape[1], x + t_img.shape[1] + 8)
+            y2 = min(s_img.shape[0], y + t_img.shape[0] + 8)
+            window = s_img[y1:y2, x1:x2]
+            if window.shape[0] < t_img.shape[0] or window.shape[1] < t_img.shape[1]:
+                return None
+            _, _, _, (lx, ly) = cv2.minMaxLoc(cv2.matchTemplate(window, t_img, cv2.TM_CCOEFF_NORMED))
+            x, y = x1 + lx, y1 + ly
+        
+        return x * 2, y * 2
+
+    def _match_template(self, search, tmpl, kind):
+        """TM_CCOEFF_NORMED match of tmpl[kind] in search, on the GPU when the
+        template was uploaded by _align_init_template, otherwise on the CPU.
+        CPU results live in a per-thread buffer that the next call with the
+        same kind and size overwrites.
+
+        All three kinds, including the edge maps (Canny + dilate, already
+        binary 0/255 uint8), use CCOEFF: the 0.3/0.5 confidence thresholds in
+        _align_match_page are calibrated on its scale, and CCORR_NORMED on
+        sparse edge maps scores background windows higher."""
+        gpu = tmpl.get('gpu')
+        if gpu is not None:
+            try:
+                # One matcher/stream is shared by all alignment threads
+                with self._cuda_match_lock:
+                    g_search = cv2.cuda_GpuMat()
+                    g_search.upload(np.ascontiguousarray(search))
+                    return self._cuda_matcher.match(g_search, gpu[kind]).download()
+            except cv2.error as e:
+                print(f"  Template align: CUDA match failed ({e}), falling back to CPU")
+                tmpl['gpu'] = None
+        th, tw = tmpl[kind].shape[:2]
+        rh, rw = search.shape[0] - th + 1, search.shape[1] - tw + 1
+        if th * tw >= 64 * 64 and rh * rw >= 64 * 64:
+            # Full-region search with a large template: correlate in the
+            # frequency domain, reusing the template's spectrum across pages
+            return self._fft_ccoeff_normed(search, tmpl, kind)
+        # Result maps are reused across pages, per thread and keyed on kind and
+        # size (each template's window keeps the same size from page to page)
+        results = getattr(self._align_thread_state(), 'tm_results', None)
+        if results is None:
+            results = self._align_thread_state().tm_results = {}
+        buf = results.get((kind, rh, rw))
+        if buf is None:
+            buf = results[(kind, rh, rw)] = np.empty((rh, rw), dtype=np.float32)
+        return cv2.matchTemplate(search, tmpl[kind], cv2.TM_CCOEFF_NORMED, result=buf)
+    
+    @staticmethod
+    def _fft_ccoeff_normed(search, tmpl, kind):
+        """TM_CCOEFF_NORMED of tmpl[kind] over search via cv2.dft.
+
+        The zero-mean template is padded and transformed once per DFT size and
+        kept in tmpl['fft'], so each page costs one forward and one inverse
+        DFT of the search region. Window means and energies come from an
+        integral image. Windows with no variance score 0.
+        """
+        sh, sw = search.shape[:2]
+        th, tw = tmpl[kind].shape[:2]
+        dft_h, dft_w = cv2.getOptimalDFTSize(sh), cv2.getOptimalDFTSize(sw)
+        cache = tmpl.setdefault('fft', {})
+        entry = cache.get((kind, dft_h, dft_w))
+        if entry is None:
+            t = tmpl[kind].astype(np.float32)
+            t -= t.mean()
+            padded = np.zeros((dft_h, dft_w), dtype=np.float32)
+            padded[:th, :tw] = t
+            spectrum = cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT)
+            entry = cache[(kind, dft_h, dft_w)] = (spectrum, float(np.sqrt(np.square(t, dtype=np.float64).sum())))
+        t_spectrum, t_norm = entry
+        
+        padded = np.zeros((dft_h, dft_w), dtype=np.float32)
+        padded[:sh, :sw] = search
+        s_spectrum = cv2.dft(padded, flags=cv2.DFT_COMPLEX_OUTPUT)
+        corr = cv2.idft(cv2.mulSpectrums(s_spectrum, t_spectrum, 0, conjB=True),
+                        flags=cv2.DFT_REAL_OUTPUT | cv2.DFT_SCALE)
+        rh, rw = sh - th + 1, sw - tw + 1
+        # Template is zero-mean, so this is already sum((s - mean_s) * t)
+        num = corr[:rh, :rw].astype(np.float64)
+        
+        s_sum, s_sqsum = cv2.integral2(search, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        win_sum = s_sum[th:, tw:] - s_sum[:-th, tw:] - s_sum[th:, :-tw] + s_sum[:-th, :-tw]
+        win_sq = s_sqsum[th:, tw:] - s_sqsum[:-th, tw:] - s_sqsum[th:, :-tw] + s_sqsum[:-th, :-tw]
+        win_var = np.maximum(win_sq - win_sum * win_sum / (th * tw), 0.0)
+        denom = np.sqrt(win_var) * t_norm
+        
+        result = np.zeros((rh, rw), dtype=np.float32)
+        valid = denom > 1e-6
+        result[valid] = np.clip(num[valid] / denom[valid], -1.0, 1.0)
+        return result
+    
     def _subpixel_refine(self, result, px, py):
         """
         Sub-pixel refinement using 2D quadratic surface fitting.
@@ -1496,24 +2148,28 @@ class OMRSoftware(QMainWindow):
         if not (1 <= px < rw - 1 and 1 <= py < rh - 1):
             return float(px), float(py)
         
-        # Extract 3x3 neighborhood
-        patch = result[py-1:py+2, px-1:px+2].astype(np.float64)
+        # Read the centre and its 4-neighbours as Python floats; the diagonals
+        # of the 3x3 neighbourhood are not used, so no patch copy is made
+        c = float(result[py, px])
+        l = float(result[py, px - 1])
+        r = float(result[py, px + 1])
+        u = float(result[py - 1, px])
+        d = float(result[py + 1, px])
         
         # Fit 2D quadratic: f(x,y) = a*x^2 + b*y^2 + c*x*y + d*x + e*y + f
-        # Using the 9 points in the 3x3 patch
         # Simplified: compute dx and dy offsets from center
         
         # Horizontal offset (using center row)
-        denom_x = 2.0 * (patch[1, 0] + patch[1, 2] - 2.0 * patch[1, 1])
+        denom_x = 2.0 * (l + r - 2.0 * c)
         if abs(denom_x) > 1e-7:
-            offset_x = -(patch[1, 2] - patch[1, 0]) / denom_x
+            offset_x = -(r - l) / denom_x
         else:
             offset_x = 0.0
         
         # Vertical offset (using center column)
-        denom_y = 2.0 * (patch[0, 1] + patch[2, 1] - 2.0 * patch[1, 1])
+        denom_y = 2.0 * (u + d - 2.0 * c)
         if abs(denom_y) > 1e-7:
-            offset_y = -(patch[2, 1] - patch[0, 1]) / denom_y
+            offset_y = -(d - u) / denom_y
         else:
             offset_y = 0.0
         
@@ -1565,30 +2221,37 @@ class OMRSoftware(QMainWindow):
         ref_region = ref_gray[rry1:rry2, rrx1:rrx2]
         
         # First apply the translation, then test rotation
-        # Shift the current gray to approximate translation correction
-        M_translate = np.float32([[1, 0, dx], [0, 1, dy]])
-        shifted_gray = cv2.warpAffine(gray, M_translate, (w, h),
-                                       borderMode=cv2.BORDER_CONSTANT,
-                                       borderValue=255)
-        
-        cur_region = shifted_gray[ry1:ry2, rx1:rx2]
+        # Shift the current gray to approximate translation correction; only the
+        # region is rendered (offset folded into the matrix), not the whole page
+        M_translate = np.float32([[1, 0, dx - rx1], [0, 1, dy - ry1]])
+        cur_region = cv2.warpAffine(gray, M_translate, (rx2 - rx1, ry2 - ry1),
+                                     borderMode=cv2.BORDER_CONSTANT,
+                                     borderValue=255)
         
         if cur_region.shape != ref_region.shape:
             # Resize to match
             cur_region = cv2.resize(cur_region, (ref_region.shape[1], ref_region.shape[0]))
         
-        # Test small rotation angles: -1.0° to +1.0° in 0.1° steps
-        angles_to_test = [a * 0.1 for a in range(-10, 11)]
-        best_angle = 0.0
-        best_score = -1.0
-        
         region_h, region_w = cur_region.shape[:2]
         center = (region_w / 2.0, region_h / 2.0)
         
-        # Use edge images for rotation matching (more sensitive to angular changes)
-        ref_edges = cv2.Canny(ref_region, 50, 150)
+        # Use edge images for rotation matching (more sensitive to angular changes).
+        # A Sobel gradient magnitude is enough for correlation scoring; Canny's
+        # NMS/hysteresis stages only cost time here. The reference page is fixed
+        # for the run, so its edge map is computed once and reused while the
+        # region stays the same
+        ref_key = (rrx1, rry1, rrx2, rry2)
+        cached = getattr(self, 'align_rot_ref_edges', None)
+        if cached is not None and cached[0] == ref_key:
+            ref_edges = cached[1]
+        else:
+            ref_edges = self._gradient_magnitude(ref_region)
+            self.align_rot_ref_edges = (ref_key, ref_edges)
+        if ref_edges.min() == ref_edges.max():
+            # No reference edges: every angle would score None
+            return 0.0
         
-        for angle in angles_to_test:
+        def score_angle(angle):
             if abs(angle) < 0.01:
                 rotated = cur_region
             else:
@@ -1597,27 +2260,41 @@ class OMRSoftware(QMainWindow):
                                           borderMode=cv2.BORDER_CONSTANT,
                                           borderValue=255)
             
-            cur_edges = cv2.Canny(rotated, 50, 150)
+            cur_edges = self._gradient_magnitude(rotated)
             
             # Score: normalized cross-correlation of edge images
-            if np.std(ref_edges) > 0 and np.std(cur_edges) > 0:
-                score = np.corrcoef(ref_edges.ravel().astype(float), 
-                                    cur_edges.ravel().astype(float))[0, 1]
+            if cur_edges.min() == cur_edges.max():
+                return None
+            # Pearson correlation of the edge maps (TM_CCOEFF_NORMED on equal sizes)
+            return float(cv2.matchTemplate(cur_edges, ref_edges, cv2.TM_CCOEFF_NORMED)[0, 0])
+        
+        # Search -1.0° to +1.0° for the best angle. The score is smooth and
+        # unimodal over this range, so a golden-section search reaches 0.1°
+        # resolution in ~9 evaluations instead of a 21-point grid. Pages are
+        # already aligned in parallel, so the evaluations run serially here
+        def search_score(angle):
+            score = score_angle(angle)
+            return 0.0 if score is None else score
+        
+        inv_phi = (5 ** 0.5 - 1) / 2
+        lo, hi = -1.0, 1.0
+        a = hi - inv_phi * (hi - lo)
+        b = lo + inv_phi * (hi - lo)
+        fa, fb = search_score(a), search_score(b)
+        while hi - lo > 0.1:
+            if fa >= fb:
+                hi, b, fb = b, a, fa
+                a = hi - inv_phi * (hi - lo)
+                fa = search_score(a)
             else:
-                score = 0.0
-            
-            if score > best_score:
-                best_score = score
-                best_angle = angle
+                lo, a, fa = a, b, fb
+                b = lo + inv_phi * (hi - lo)
+                fb = search_score(b)
+        best_angle, best_score = (a, fa) if fa >= fb else (b, fb)
         
         # Only apply rotation if it's clearly better than 0°
-        zero_idx = angles_to_test.index(0.0) if 0.0 in angles_to_test else 10
-        zero_angle_score = -1.0
-        # Recalculate score at 0°
-        cur_edges_0 = cv2.Canny(cur_region, 50, 150)
-        if np.std(ref_edges) > 0 and np.std(cur_edges_0) > 0:
-            zero_angle_score = np.corrcoef(ref_edges.ravel().astype(float),
-                                            cur_edges_0.ravel().astype(float))[0, 1]
+        score_0 = score_angle(0.0)
+        zero_angle_score = score_0 if score_0 is not None else -1.0
         
         improvement = best_score - zero_angle_score
         
@@ -1627,6 +2304,13 @@ class OMRSoftware(QMainWindow):
         else:
             return 0.0
 
+    @staticmethod
+    def _gradient_magnitude(gray):
+        """uint8 |dI/dx|/2 + |dI/dy|/2 from 3x3 Sobel, used as a cheap edge map."""
+        gx = cv2.convertScaleAbs(cv2.Sobel(gray, cv2.CV_16S, 1, 0, ksize=3))
+        gy = cv2.convertScaleAbs(cv2.Sobel(gray, cv2.CV_16S, 0, 1, ksize=3))
+        return cv2.addWeighted(gx, 0.5, gy, 0.5, 0)
+
     def _align_phase_correlation_fallback(self, img_np, gray, page_idx):
         """
         Fallback alignment using phase correlation on the alignment region
@@ -1652,40 +2336,47 @@ class OMRSoftware(QMainWindow):
         if common_h < 100 or common_w < 100:
             return None
         
-        ref_crop = ref_gray[:common_h, :common_w].astype(np.float64)
-        cur_crop = gray[:common_h, :common_w].astype(np.float64)
-        
-        # Apply window function to reduce edge effects
-        hann_rows = np.hanning(common_h)
-        hann_cols = np.hanning(common_w)
-        window = np.outer(hann_rows, hann_cols)
-        
-        ref_windowed = ref_crop * window
-        cur_windowed = cur_crop * window
-        
-        # Phase correlation
-        f_ref = np.fft.fft2(ref_windowed)
-        f_cur = np.fft.fft2(cur_windowed)
-        
-        cross_power = (f_ref * np.conj(f_cur))
-        denom = np.abs(cross_power)
-        denom[denom < 1e-10] = 1e-10
-        cross_power_norm = cross_power / denom
-        
-        correlation = np.fft.ifft2(cross_power_norm).real
+        # Phase correlation runs on a thumbnail (max side 800) for speed; the
+        # coarse shift is refined at full resolution further below
+        thumb_scale = min(1.0, 800.0 / max(common_h, common_w))
+        thumb_w = max(1, int(common_w * thumb_scale))
+        thumb_h = max(1, int(common_h * thumb_scale))
+        
+        # Reference spectrum and window only depend on the reference page
+        cache_key = (common_w, common_h)
+        cached = getattr(self, 'align_phase_ref', None)
+        if cached is None or cached[0] != cache_key:
+            ref_small, _, _ = self._prepare_alignment_gray(ref_gray[:common_h, :common_w], (thumb_w, thumb_h))
+            window = cv2.createHanningWindow((thumb_w, thumb_h), cv2.CV_32F)
+            f_ref = cv2.dft(ref_small.astype(np.float32) * window, flags=cv2.DFT_COMPLEX_OUTPUT)
+            cached = self.align_phase_ref = (cache_key, f_ref, window)
+        _, f_ref, window = cached
+        
+        cur_small, _, _ = self._prepare_alignment_gray(gray[:common_h, :common_w], (thumb_w, thumb_h))
+        f_cur = cv2.dft(cur_small.astype(np.float32) * window, flags=cv2.DFT_COMPLEX_OUTPUT)
+        
+        # Phase correlation, kept in float32 (cv2.dft spectra are 2-channel
+        # float32; np.fft would promote everything to complex128)
+        cross_power = cv2.mulSpectrums(f_ref, f_cur, 0, conjB=True)
+        denom = cv2.magnitude(cross_power[:, :, 0], cross_power[:, :, 1])
+        np.maximum(denom, 1e-10, out=denom)
+        cross_power /= denom[:, :, None]
+        
+        correlation = cv2.idft(cross_power, flags=cv2.DFT_REAL_OUTPUT | cv2.DFT_SCALE)
         
         # Find peak
         max_loc = np.unravel_index(np.argmax(correlation), correlation.shape)
         peak_y, peak_x = max_loc
         
         # Convert to signed shift (handle wrap-around)
-        if peak_y > common_h // 2:
-            peak_y -= common_h
-        if peak_x > common_w // 2:
-            peak_x -= common_w
+        if peak_y > thumb_h // 2:
+            peak_y -= thumb_h
+        if peak_x > thumb_w // 2:
+            peak_x -= thumb_w
         
-        dx = float(peak_x)
-        dy = float(peak_y)
+        # Back to full-resolution pixels
+        dx = float(peak_x) * common_w / thumb_w
+        dy = float(peak_y) * common_h / thumb_h
         
         # Check peak strength (ratio of peak to mean)
         peak_val = correlation[max_loc]
@@ -1704,6 +2395,10 @@ class OMRSoftware(QMainWindow):
             print(f"  Phase correlation: Shift too large ({dx:.1f},{dy:.1f}), skipping")
             return None
         
+        # Refine the coarse shift by template matching in a small window
+        # around each template's predicted position
+        dx, dy = self._refine_shift_with_templates(gray, dx, dy)
+        
         # Skip negligible shifts
         if abs(dx) < 1.0 and abs(dy) < 1.0:
             return None
@@ -1730,6 +2425,44 @@ class OMRSoftware(QMainWindow):
         print(f"  Phase correlation: ✓ Applied dx={dx:.1f}, dy={dy:.1f} (verified conf={confidence:.3f})")
         return aligned, (dx, dy), confidence
 
+    def _refine_shift_with_templates(self, gray, dx, dy, margin=30):
+        """Refine a coarse (dx, dy) page shift using the alignment templates.
+        Each template is matched within +/-margin px of where the coarse shift
+        puts it; confident matches are averaged. Returns the coarse shift
+        unchanged if no template matches well."""
+        h, w = gray.shape[:2]
+        estimates = []
+        
+        for tmpl in getattr(self, 'align_templates', []):
+            ref_x, ref_y = tmpl['pos']
+            template_h, template_w = tmpl['gray'].shape[:2]
+            
+            # Predicted template position in the unaligned page
+            pred_x = int(round(ref_x - dx))
+            pred_y = int(round(ref_y - dy))
+            sx1 = max(0, pred_x - margin)
+            sy1 = max(0, pred_y - margin)
+            sx2 = min(w, pred_x + template_w + margin)
+            sy2 = min(h, pred_y + template_h + margin)
+            
+            search_region = gray[sy1:sy2, sx1:sx2]
+            if search_region.shape[0] < template_h or search_region.shape[1] < template_w:
+                continue
+            
+            result = cv2.matchTemplate(search_region, tmpl['gray'], cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if max_val < 0.3:
+                continue
+            sub_px, sub_py = self._subpixel_refine(result, max_loc[0], max_loc[1])
+            estimates.append((ref_x - (sx1 + sub_px), ref_y - (sy1 + sub_py), max_val))
+        
+        if not estimates:
+            return dx, dy
+        
+        total = sum(conf for _, _, conf in estimates)
+        return (sum(ex * conf for ex, _, conf in estimates) / total,
+                sum(ey * conf for _, ey, conf in estimates) / total)
+
     def _verify_alignment_quality(self, aligned_img, page_idx):
         """Verify alignment quality by matching all templates in the corrected image."""
         if not hasattr(self, 'align_templates') or not self.align_templates:
@@ -1779,13 +2512,26 @@ class OMRSoftware(QMainWindow):
         else:
             gray = img_np.copy()
         
-        h, w = gray.shape
+        # On large pages contours are found at half resolution and the box is
+        # scaled back up, so its edges can be off by up to 2 px (and the
+        # bounds-based shift in _align_page by as much). The morphology
+        # kernel shrinks with the image to bridge the same gaps
+        if min(gray.shape[:2]) >= 800:
+            work = cv2.pyrDown(gray)
+            scale = 2
+            ksize = 3
+        else:
+            work = gray
+            scale = 1
+            ksize = 5
+        
+        h, w = work.shape
         
         # Apply edge detection
-        edges = cv2.Canny(gray, 50, 150)
+        edges = cv2.Canny(work, 50, 150)
         
         # Apply morphological operations to connect edges
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (ksize, ksize))
         edges = cv2.dilate(edges, kernel, iterations=2)
         edges = cv2.erode(edges, kernel, iterations=1)
         
@@ -1820,7 +2566,10 @@ class OMRSoftware(QMainWindow):
             return self._find_bounds_by_projection(gray)
         
         x, y, bw, bh = cv2.boundingRect(best_contour)
-        return (x, y, x + bw, y + bh)
+        x1, y1 = x * scale, y * scale
+        x2 = min(gray.shape[1], (x + bw) * scale)
+        y2 = min(gray.shape[0], (y + bh) * scale)
+        return (x1, y1, x2, y2)
     
     def _find_bounds_by_projection(self, gray):
         """
@@ -1842,33 +2591,20 @@ class OMRSoftware(QMainWindow):
         h_thresh = np.max(h_proj) * 0.1
         v_thresh = np.max(v_proj) * 0.1
         
-        # Find top edge
-        y1 = 0
-        for i in range(h):
-            if h_proj[i] > h_thresh:
-                y1 = i
-                break
-        
-        # Find bottom edge
-        y2 = h - 1
-        for i in range(h - 1, -1, -1):
-            if h_proj[i] > h_thresh:
-                y2 = i
-                break
-        
-        # Find left edge
-        x1 = 0
-        for i in range(w):
-            if v_proj[i] > v_thresh:
-                x1 = i
-                break
-        
-        # Find right edge
-        x2 = w - 1
-        for i in range(w - 1, -1, -1):
-            if v_proj[i] > v_thresh:
-                x2 = i
-                break
+        # First/last crossing on each axis; an axis with no crossing keeps the
+        # full extent, as the old scanning loops did
+        mask_h = h_proj > h_thresh
+        mask_v = v_proj > v_thresh
+        if mask_h.any():
+            y1 = int(np.argmax(mask_h))
+            y2 = h - 1 - int(np.argmax(mask_h[::-1]))
+        else:
+            y1, y2 = 0, h - 1
+        if mask_v.any():
+            x1 = int(np.argmax(mask_v))
+            x2 = w - 1 - int(np.argmax(mask_v[::-1]))
+        else:
+            x1, x2 = 0, w - 1
         
         # Validate bounds
         if x2 - x1 < w * 0.3 or y2 - y1 < h * 0.3:
@@ -1887,23 +2623,21 @@ class OMRSoftware(QMainWindow):
         - Any colored marks
         
         Args:
-            image: PIL Image of the option area
+            image: PIL Image or RGB NumPy array of the option area
             options_count: Number of options (default 4 for A,B,C,D)
             save_debug: Whether to save debug images
             
         Returns:
             String like "A", "B", "C", "D" or "AB" for multiple selections, or "" if none
         """
-        import numpy as np
-        import os
-        
-        img_np = np.array(image)
+        # Read-only use below, so no private copy of the crop is needed
+        img_np = np.asarray(image)
         
         height, width = img_np.shape[:2]
         cell_width = width // options_count
         
         if cell_width < 5:
-            print(f"  Warning: Cell width too small ({cell_width}px)")
+            log.debug("Cell width too small (%dpx)", cell_width)
             return ""
         
         # Option labels
@@ -1912,115 +2646,112 @@ class OMRSoftware(QMainWindow):
         # Prepare different analysis channels
         if len(img_np.shape) == 3:
             # RGB image - analyze multiple ways
-            gray = np.mean(img_np, axis=2)
-            
-            # Extract color channels
-            r_channel = img_np[:, :, 0].astype(float)
-            g_channel = img_np[:, :, 1].astype(float)
-            b_channel = img_np[:, :, 2].astype(float)
-            
-            # Calculate color saturation (how "colorful" vs gray)
-            max_rgb = np.maximum(np.maximum(r_channel, g_channel), b_channel)
-            min_rgb = np.minimum(np.minimum(r_channel, g_channel), b_channel)
-            saturation = max_rgb - min_rgb
-            
-            # Blue detection: high B, low R
-            blue_score_img = b_channel - r_channel
+            # Work on contiguous planes: OpenCV's element-wise ops are SIMD,
+            # whereas NumPy reductions over the short channel axis are not
+            channels = cv2.split(img_np)
+            r_channel, g_channel, b_channel = channels[:3]
+            
+            # Channel sum in uint16; gray is this divided by the channel count
+            # (the plain average, not cvtColor's weighted luma, which the score
+            # thresholds were not tuned for), applied to the reduced statistics
+            # rather than per pixel
+            gray_sum = cv2.add(channels[0], channels[1], dtype=cv2.CV_16U)
+            for extra in channels[2:]:
+                gray_sum = cv2.add(gray_sum, extra, dtype=cv2.CV_16U)
+            gray_div = float(len(channels))
+            
+            # Calculate color saturation (how "colorful" vs gray): max - min
+            # over the channels, which stays uint8
+            saturation = cv2.subtract(cv2.max(cv2.max(r_channel, g_channel), b_channel),
+                                      cv2.min(cv2.min(r_channel, g_channel), b_channel))
+            
+            # Only column sums of saturation and blue (B - R) are needed below;
+            # blue's are the difference of channel column sums, so no per-pixel
+            # blue image is built
+            col_sat = saturation.sum(axis=0, dtype=np.float64)
+            col_blue = (b_channel.sum(axis=0, dtype=np.float64)
+                        - r_channel.sum(axis=0, dtype=np.float64))
             
             has_color = True
         else:
-            gray = img_np
-            saturation = np.zeros_like(gray)
-            blue_score_img = np.zeros_like(gray)
+            gray_sum = img_np
+            gray_div = 1.0
             has_color = False
         
-        # Overall statistics
-        overall_gray_mean = np.mean(gray)
-        overall_sat_mean = np.mean(saturation) if has_color else 0
-        
-        # Apply contrast enhancement for light mark detection
-        # This helps detect very faint pencil marks
-        gray_enhanced = gray.copy()
-        gray_min, gray_max = np.min(gray), np.max(gray)
+        # Overall statistics; the column sums are reused for the per-cell
+        # means below, so the mean costs no extra pass over the pixels
+        col_gray = gray_sum.sum(axis=0, dtype=np.float64) / gray_div
+        overall_gray_mean = col_gray.sum() / (height * width)
+        overall_sat_mean = col_sat.sum() / (height * width) if has_color else 0
+        
+        # Contrast range, used to scale darkness for very faint pencil marks
+        # (min and max found in one pass)
+        gray_min, gray_max, _, _ = cv2.minMaxLoc(gray_sum)
+        gray_min, gray_max = gray_min / gray_div, gray_max / gray_div
+        
+        log.debug("Image size: %dx%d, %d options, cell width: %dpx", width, height, options_count, cell_width)
+        log.debug("Overall: gray_mean=%.1f, saturation_mean=%.1f, contrast_range=%.1f",
+                  overall_gray_mean, overall_sat_mean, gray_max - gray_min)
+        
+        # Analyze all cells at once: each cell spans the full crop height, so
+        # per-cell sums are column sums reduced over the cell boundaries
+        # (the 1-D form of a summed-area table)
+        starts = np.arange(options_count) * cell_width
+        cell_widths = np.diff(np.append(starts, width))
+        cell_areas = cell_widths * height
+        
+        col_gray_sq = np.square(gray_sum, dtype=np.uint32).sum(axis=0, dtype=np.float64) / (gray_div * gray_div)
+        cell_gray_means = np.add.reduceat(col_gray, starts) / cell_areas
+        cell_gray_var = np.add.reduceat(col_gray_sq, starts) / cell_areas - np.square(cell_gray_means)
+        cell_gray_stds = np.sqrt(np.maximum(cell_gray_var, 0.0))
+        
+        # Darkness score (lower mean = darker)
+        darkness_scores = overall_gray_mean - cell_gray_means
+        
+        # Enhanced darkness: the contrast stretch is linear, so the difference
+        # of stretched means is the plain difference scaled by 255/range
         if gray_max > gray_min:
-            # Stretch contrast to full range
-            gray_enhanced = ((gray - gray_min) / (gray_max - gray_min) * 255).astype(np.float64)
+            enhanced_darkness_scores = darkness_scores * (255.0 / (gray_max - gray_min))
+        else:
+            enhanced_darkness_scores = darkness_scores
         
-        print(f"  Image size: {width}x{height}, {options_count} options, cell width: {cell_width}px")
-        print(f"  Overall: gray_mean={overall_gray_mean:.1f}, saturation_mean={overall_sat_mean:.1f}, contrast_range={gray_max-gray_min:.1f}")
+        # Local contrast: high std means there's a mark
+        local_contrast_scores = cell_gray_stds / 10.0  # Normalize
         
-        # Analyze each cell
-        cell_scores = []
+        # Color-based scores
+        if has_color:
+            cell_sat_means = np.add.reduceat(col_sat, starts) / cell_areas
+            cell_blue_means = np.add.reduceat(col_blue, starts) / cell_areas
+            # Saturation difference from overall
+            sat_scores = cell_sat_means - overall_sat_mean
+        else:
+            cell_sat_means = np.zeros(options_count)
+            cell_blue_means = np.zeros(options_count)
+            sat_scores = np.zeros(options_count)
+        
+        # Combined score: weighted sum of different indicators
+        # Higher score = more likely to be filled
+        # Enhanced scoring for light marks
+        combined_scores = (
+            darkness_scores * 1.0 +                     # Weight for darkness
+            enhanced_darkness_scores * 0.5 +            # Weight for enhanced contrast darkness
+            local_contrast_scores * 0.3 +               # Weight for local contrast (marks have texture)
+            sat_scores * 0.5 +                          # Weight for saturation (colored marks)
+            np.maximum(0, cell_blue_means) * 0.3        # Weight for blue specifically
+        )
         
-        for i in range(options_count):
-            left = i * cell_width
-            right = (i + 1) * cell_width if i < options_count - 1 else width
-            
-            cell_gray = gray[:, left:right]
-            cell_gray_enhanced = gray_enhanced[:, left:right]
-            cell_gray_mean = np.mean(cell_gray)
-            cell_gray_std = np.std(cell_gray)
-            
-            # Darkness score (lower mean = darker)
-            darkness_score = overall_gray_mean - cell_gray_mean
-            
-            # Enhanced darkness score using contrast-stretched image
-            enhanced_mean = np.mean(cell_gray_enhanced)
-            enhanced_overall = np.mean(gray_enhanced)
-            enhanced_darkness = enhanced_overall - enhanced_mean
-            
-            # Local contrast: high std means there's a mark
-            local_contrast_score = cell_gray_std / 10.0  # Normalize
-            
-            # Color-based scores
-            if has_color:
-                cell_sat = saturation[:, left:right]
-                cell_sat_mean = np.mean(cell_sat)
-                
-                cell_blue = blue_score_img[:, left:right]
-                cell_blue_mean = np.mean(cell_blue)
-                
-                # Saturation difference from overall
-                sat_score = cell_sat_mean - overall_sat_mean
-            else:
-                cell_sat_mean = 0
-                cell_blue_mean = 0
-                sat_score = 0
-            
-            # Combined score: weighted sum of different indicators
-            # Higher score = more likely to be filled
-            # Enhanced scoring for light marks
-            combined_score = (
-                darkness_score * 1.0 +          # Weight for darkness
-                enhanced_darkness * 0.5 +       # Weight for enhanced contrast darkness
-                local_contrast_score * 0.3 +    # Weight for local contrast (marks have texture)
-                sat_score * 0.5 +               # Weight for saturation (colored marks)
-                max(0, cell_blue_mean) * 0.3    # Weight for blue specifically
-            )
-            
-            cell_scores.append({
-                'option': option_labels[i],
-                'gray_mean': cell_gray_mean,
-                'gray_std': cell_gray_std,
-                'darkness': darkness_score,
-                'enhanced_dark': enhanced_darkness,
-                'local_contrast': local_contrast_score,
-                'saturation': cell_sat_mean,
-                'sat_score': sat_score,
-                'blue_score': cell_blue_mean,
-                'combined': combined_score
-            })
-            
-            print(f"    Option {option_labels[i]}: gray={cell_gray_mean:.1f}, dark={darkness_score:.1f}, enh_dark={enhanced_darkness:.1f}, contrast={local_contrast_score:.1f}, combined={combined_score:.1f}")
+        if log.isEnabledFor(logging.DEBUG):
+            for i in range(options_count):
+                log.debug("  Option %s: gray=%.1f, dark=%.1f, enh_dark=%.1f, contrast=%.1f, combined=%.1f",
+                          option_labels[i], cell_gray_means[i], darkness_scores[i],
+                          enhanced_darkness_scores[i], local_contrast_scores[i], combined_scores[i])
         
         # Save debug image with cell divisions and scores
         if save_debug:
-            from PIL import ImageDraw, ImageFont
             debug_dir = "debug_crops"
             os.makedirs(debug_dir, exist_ok=True)
-            import time
             
-            debug_img = image.copy()
+            debug_img = Image.fromarray(img_np)
             draw = ImageDraw.Draw(debug_img)
             
             # Draw vertical lines to show cell divisions
@@ -2029,29 +2760,27 @@ class OMRSoftware(QMainWindow):
                 draw.line([(x, 0), (x, height)], fill=(255, 0, 0), width=2)
             
             # Draw scores on each cell
-            for i, score in enumerate(cell_scores):
+            for i in range(options_count):
                 x = i * cell_width + 2
-                draw.text((x, 2), f"{score['combined']:.0f}", fill=(255, 0, 0))
+                draw.text((x, 2), f"{combined_scores[i]:.0f}", fill=(255, 0, 0))
             
             debug_path = os.path.join(debug_dir, f"option_{int(time.time()*1000)}.png")
             debug_img.save(debug_path)
-            print(f"  Saved debug image: {debug_path}")
+            log.debug("Saved debug image: %s", debug_path)
         
         # Determine which option(s) are filled using combined score
         filled_options = []
         
-        if cell_scores:
-            combined_vals = [s['combined'] for s in cell_scores]
-            max_combined = max(combined_vals)
-            min_combined = min(combined_vals)
+        if options_count > 0:
+            max_combined = float(combined_scores.max())
+            min_combined = float(combined_scores.min())
             score_range = max_combined - min_combined
-            mean_combined = sum(combined_vals) / max(1, len(combined_vals))
-            std_combined = (sum((v - mean_combined) ** 2 for v in combined_vals) / max(1, len(combined_vals))) ** 0.5
             
             # Get the max darkness score (actual gray difference from overall mean)
-            max_darkness = max(s['darkness'] for s in cell_scores)
+            max_darkness = float(darkness_scores.max())
             
-            print(f"  Score range: {min_combined:.1f} to {max_combined:.1f} (range={score_range:.1f}), max_darkness={max_darkness:.1f}")
+            log.debug("Score range: %.1f to %.1f (range=%.1f), max_darkness=%.1f",
+                      min_combined, max_combined, score_range, max_darkness)
             
             # SMART DETECTION: Focus on RELATIVE differences between options
             # Key insight: A filled mark should stand out clearly from other options
@@ -2077,29 +2806,37 @@ class OMRSoftware(QMainWindow):
             )
             
             if is_clearly_blank:
-                print(f"  No option filled: clearly blank (range={score_range:.1f}, max={max_combined:.1f})")
+                log.debug("No option filled: clearly blank (range=%.1f, max=%.1f)", score_range, max_combined)
             else:
                 # Multi-select friendly: any option above minimum thresholds is counted
-                for score in cell_scores:
-                    if (score['combined'] >= MIN_COMBINED_THRESHOLD and
-                        score['darkness'] >= MIN_DARKNESS_THRESHOLD):
-                        filled_options.append(score['option'])
+                filled_mask = ((combined_scores >= MIN_COMBINED_THRESHOLD) &
+                               (darkness_scores >= MIN_DARKNESS_THRESHOLD))
+                filled_options = [option_labels[i] for i in np.flatnonzero(filled_mask)]
                 if filled_options:
-                    print(f"  Selected by minimum thresholds (min_comb={MIN_COMBINED_THRESHOLD}, min_dark={MIN_DARKNESS_THRESHOLD})")
+                    log.debug("Selected by minimum thresholds (min_comb=%s, min_dark=%s)",
+                              MIN_COMBINED_THRESHOLD, MIN_DARKNESS_THRESHOLD)
                 else:
-                    print(f"  No option filled: scores below minimum (min_comb={MIN_COMBINED_THRESHOLD}, min_dark={MIN_DARKNESS_THRESHOLD})")
+                    log.debug("No option filled: scores below minimum (min_comb=%s, min_dark=%s)",
+                              MIN_COMBINED_THRESHOLD, MIN_DARKNESS_THRESHOLD)
         
         # Remove duplicates while preserving order (avoid outputs like CDCD)
-        seen = set()
-        unique_options = []
-        for opt in filled_options:
-            if opt not in seen:
-                unique_options.append(opt)
-                seen.add(opt)
-        result = "".join(unique_options)
-        print(f"  Detected filled option(s): {result if result else '(none)'}")
+        result = "".join(dict.fromkeys(filled_options))
+        log.debug("Detected filled option(s): %s", result or "(none)")
 
         try:
+            # Per-cell score dicts are only needed for the debug record
+            cell_scores = [{
+                'option': option_labels[i],
+                'gray_mean': float(cell_gray_means[i]),
+                'gray_std': float(cell_gray_stds[i]),
+                'darkness': float(darkness_scores[i]),
+                'enhanced_dark': float(enhanced_darkness_scores[i]),
+                'local_contrast': float(local_contrast_scores[i]),
+                'saturation': float(cell_sat_means[i]),
+                'sat_score': float(sat_scores[i]),
+                'blue_score': float(cell_blue_means[i]),
+                'combined': float(combined_scores[i])
+            } for i in range(options_count)] if hasattr(self, "debug_records") else []
             record = {
                 "context": context or {},
                 "options_count": options_count,
@@ -2120,40 +2857,259 @@ class OMRSoftware(QMainWindow):
 
         return result
 
+    def _start_reader_warmup(self):
+        """Build the EasyOCR reader on a background thread so loading the
+        model weights does not block the first OCR call or the UI."""
+        def warm_up():
+            try:
+                self._get_easyocr_reader()
+            except Exception as e:
+                print(f"Warning: EasyOCR warm-up failed ({e})")
+        threading.Thread(target=warm_up, daemon=True).start()
+
+    def _get_easyocr_reader(self):
+        """Create the EasyOCR reader on first use and return it.
+        Waits for the background warm-up if it is still running."""
+        if self.ocr_reader is None:
+            with self._ocr_reader_lock:
+                if self.ocr_reader is None:
+                    # Pick the device explicitly: CUDA inference is roughly 10x
+                    # faster per crop, and an explicit CPU choice avoids
+                    # EasyOCR's GPU probe and warning on machines without one
+                    try:
+                        import torch
+                        use_gpu = torch.cuda.is_available()
+                    except ImportError:
+                        use_gpu = False
+                    # Initialize for English and Traditional Chinese
+                    print(f"  Initializing EasyOCR reader on {'GPU' if use_gpu else 'CPU'} (this may take a moment)...")
+                    self.ocr_reader = easyocr.Reader(['en', 'ch_tra'], gpu=use_gpu, verbose=False)
+        return self.ocr_reader
+
+    def _get_tesseract_api(self):
+        """Create the tesserocr API on first use and return it.
+        The language models are loaded once and kept for every later read."""
+        if self.ts_api is None:
+            try:
+                self.ts_api = tesserocr.PyTessBaseAPI(
+                    lang='eng+chi_tra', psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY)
+            except RuntimeError:
+                # chi_tra traineddata not installed: fall back to English only
+                self.ts_api = tesserocr.PyTessBaseAPI(
+                    lang='eng', psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY)
+        return self.ts_api
+
+    def get_ocr_results_batch(self, images, save_debug=False):
+        """OCR a list of PIL crops and return their texts in order.
+        Crops should be of similar size; smaller ones are padded to the largest.
+
+        With EasyOCR the crops go through one readtext_batched call; crops
+        that come back empty or below OCR_MIN_CONFIDENCE are retried via
+        get_ocr_result (gray/binary).
+        With pytesseract the crops are stacked into one image and read by a
+        single tesseract run (see _tesseract_read_stacked).
+        Other engines run get_ocr_result per crop.
+        """
+        if len(images) >= 2 and self.ocr_engine_name == "tesseract" and tesserocr is None:
+            return self._tesseract_read_stacked(images, save_debug=save_debug)
+        if self.ocr_engine_name != "easyocr" or len(images) < 2:
+            return [self.get_ocr_result(img, save_debug=save_debug) for img in images]
+
+        reader = self._get_easyocr_reader()
+        arrays = [np.asarray(img) for img in images]
+        h = max(a.shape[0] for a in arrays)
+        w = max(a.shape[1] for a in arrays)
+        if any(a.shape[:2] != (h, w) for a in arrays):
+            # Mixed sizes: pad with white at the bottom/right so every crop
+            # keeps its scale (readtext_batched would otherwise stretch them)
+            padded = []
+            for a in arrays:
+                canvas = np.full((h, w) + a.shape[2:], 255, dtype=a.dtype)
+                canvas[:a.shape[0], :a.shape[1]] = a
+                padded.append(canvas)
+            arrays = padded
+        batched = reader.readtext_batched(
+            arrays,
+            n_width=w,
+            n_height=h,
+            detail=1,
+            paragraph=False,
+            contrast_ths=0.1,
+            adjust_contrast=0.6,
+            text_threshold=0.5,
+            low_text=0.35,
+            link_threshold=0.4
+        )
+
+        texts = []
+        for img, result in zip(images, batched):
+            text = " ".join(det[1] for det in result) if result else ""
+            conf = max((float(det[2]) for det in result), default=0.0) if result else 0.0
+            if text and conf >= OCR_MIN_CONFIDENCE:
+                log.debug("EasyOCR detected: '%s' (batch)", text)
+                if save_debug:
+                    debug_dir = "debug_crops"
+                    os.makedirs(debug_dir, exist_ok=True)
+                    img.save(os.path.join(debug_dir, f"crop_{int(time.time()*1000)}.png"))
+            else:
+                text = self.get_ocr_result(img, save_debug=save_debug)
+            texts.append(text)
+        return texts
+
+    def _tesseract_read_stacked(self, images, save_debug=False):
+        """OCR several crops with one pytesseract call.
+
+        Every pytesseract call starts a tesseract process and loads its
+        models, which costs more than reading a small crop. The crops are
+        pasted one below the other on a white sheet and read once with
+        image_to_data; each word goes back to the crop whose band contains
+        its centre. Crops with no words or a mean word confidence below
+        OCR_MIN_CONFIDENCE are retried via get_ocr_result.
+        """
+        pad = 20
+        sheet = Image.new("RGB", (max(img.width for img in images) + 2 * pad,
+                                  sum(img.height for img in images) + pad * (len(images) + 1)), "white")
+        tops = []
+        y = pad
+        for img in images:
+            sheet.paste(img.convert("RGB"), (pad, y))
+            tops.append(y)
+            y += img.height + pad
+        # Each crop owns its rows plus half of the padding around it
+        band_starts = np.array(tops) - pad // 2
+
+        try:
+            data = pytesseract.image_to_data(sheet, lang='eng+chi_tra', config="--oem 1 --psm 6",
+                                             output_type=pytesseract.Output.DICT)
+        except pytesseract.TesseractError:
+            data = pytesseract.image_to_data(sheet, lang='eng', config="--oem 1 --psm 6",
+                                             output_type=pytesseract.Output.DICT)
+
+        words = [[] for _ in images]
+        confs = [[] for _ in images]
+        for word, conf, top, height in zip(data["text"], data["conf"], data["top"], data["height"]):
+            word = word.strip()
+            if not word:
+                continue
+            idx = int(np.searchsorted(band_starts, top + height / 2, side="right")) - 1
+            if idx >= 0:
+                words[idx].append(word)
+                confs[idx].append(float(conf))
+
+        texts = []
+        for img, crop_words, crop_confs in zip(images, words, confs):
+            if crop_words and sum(crop_confs) / len(crop_confs) >= OCR_MIN_CONFIDENCE * 100:
+                text = " ".join(crop_words)
+                log.debug("Tesseract detected: '%s' (stacked)", text)
+                if save_debug:
+                    debug_dir = "debug_crops"
+                    os.makedirs(debug_dir, exist_ok=True)
+                    img.save(os.path.join(debug_dir, f"crop_{int(time.time()*1000)}.png"))
+            else:
+                text = self.get_ocr_result(img, save_debug=save_debug)
+            texts.append(text)
+        return texts
+
+    def _ocr_pending_text(self, pending, progress=None):
+        """Fill in text-field results collected during a recognition run.
+
+        pending holds (p_idx, key, crop) tuples; crops of the same size (the
+        same field on different pages) are OCR'd together in batches. Sizes
+        seen only once (e.g. the fields of a single re-recognized page) are
+        batched with others of similar height, padded to a common size.
+
+        OCR runs on an OCRWorker thread so the UI keeps repainting; progress
+        (a QProgressDialog) shows the count and can cancel the remainder,
+        which leaves those fields empty.
+        """
+        by_size = {}
+        for p_idx, key, crop in pending:
+            by_size.setdefault(crop.size, []).append((p_idx, key, crop))
+
+        groups = [g for g in by_size.values() if len(g) > 1]
+        singles = sorted((g[0] for g in by_size.values() if len(g) == 1),
+                         key=lambda item: item[2].size[1])
+        bucket = []
+        for item in singles:
+            # Keep padding modest: heights in a bucket stay within 1.5x
+            if bucket and item[2].size[1] > 1.5 * bucket[0][2].size[1]:
+                groups.append(bucket)
+                bucket = []
+            bucket.append(item)
+        if bucket:
+            groups.append(bucket)
+
+        # No parent, like UpdateChecker: the worker (and every crop it
+        # holds) is freed when this method drops it, not kept by the window
+        worker = OCRWorker(self, groups)
+        loop = QtCore.QEventLoop()
+        worker.finished.connect(loop.quit)
+        if progress is not None:
+            worker.progress.connect(lambda done, total: progress.setLabelText(
+                f"Recognizing text fields... ({done}/{total})"))
+            # A dialog already cancelled during the page loop still gets the
+            # scanned pages' fields OCR'd, as before; only a new cancel stops it
+            progress.canceled.connect(worker.cancel)
+        worker.start()
+        loop.exec_()
+        worker.wait()
+        if progress is not None:
+            progress.canceled.disconnect(worker.cancel)
+
+        for p_idx, key, text in worker.results:
+            if p_idx in self.results:
+                self.results[p_idx]["text"][key] = text
+
     def get_ocr_result(self, image, save_debug=False):
-        """Perform OCR on the given PIL image and return text with confidence info."""
-        import numpy as np
-        import cv2
-        from PIL import Image
+        """Perform OCR on the given PIL image or NumPy crop and return text with confidence info."""
+        # NumPy crops are wrapped for PIL only where an API needs it (debug
+        # save, tesserocr); EasyOCR and pytesseract read the array as it is
+        needs_pil = save_debug or (self.ocr_engine_name == "tesseract" and tesserocr is not None)
+        if needs_pil and isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
         
         # Debug: Save cropped image to see what's being recognized
         if save_debug:
-            import os
             debug_dir = "debug_crops"
             os.makedirs(debug_dir, exist_ok=True)
-            import time
             debug_path = os.path.join(debug_dir, f"crop_{int(time.time()*1000)}.png")
             image.save(debug_path)
-            print(f"  Saved debug image: {debug_path}")
+            log.debug("Saved debug image: %s", debug_path)
         
-        # Check if image is valid
-        img_np = np.array(image)
-        print(f"  Image shape: {img_np.shape}, dtype: {img_np.dtype}")
+        # Check if image is valid. asarray: the crop is only read, so the
+        # array is converted once here and reused by the preprocessing below
+        img_np = np.asarray(image)
+        log.debug("Image shape: %s, dtype: %s", img_np.shape, img_np.dtype)
         
         if img_np.size == 0:
             print("  ERROR: Empty image!")
             return "[Empty Image]"
         
         # Preprocess for better OCR (contrast, denoise, resize, threshold)
-        def preprocess_for_ocr(pil_img):
-            arr = np.array(pil_img)
+        def preprocess_for_ocr(arr):
             if len(arr.shape) == 3:
                 gray = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
             else:
-                gray = arr.copy()
-
-            # Normalize contrast
-            gray = cv2.normalize(gray, None, 0, 255, cv2.NORM_MINMAX)
+                # Every step below writes a new array, so no copy is needed
+                gray = arr
+
+            # Normalize contrast: stretch [min, max] to [0, 255] through a
+            # 256-entry lookup table, one pass over the crop after minMaxLoc.
+            # Rounded to nearest before the cast, as cv2.normalize does
+            mn, mx = cv2.minMaxLoc(gray)[:2]
+            if mx > mn:
+                lut = np.rint(np.clip((np.arange(256) - mn) * (255.0 / (mx - mn)), 0, 255)).astype(np.uint8)
+                gray = cv2.LUT(gray, lut)
+
+            # Denoise: edge-preserving bilateral filter by default; NL-means
+            # (far slower) only when enabled in Settings. Runs at native
+            # resolution, before upscaling: scanner noise is a property of
+            # the source pixels, and filtering interpolated ones costs more
+            # without removing anything extra
+            if self.ocr_heavy_denoise:
+                gray = cv2.fastNlMeansDenoising(gray, None, h=12, templateWindowSize=7, searchWindowSize=21)
+            else:
+                gray = cv2.bilateralFilter(gray, 5, 40, 40)
 
             # Upscale small crops for better OCR
             h, w = gray.shape
@@ -2162,40 +3118,41 @@ class OMRSoftware(QMainWindow):
             if scale > 1.0:
                 gray = cv2.resize(gray, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_CUBIC)
 
-            # Denoise
-            gray = cv2.fastNlMeansDenoising(gray, None, h=12, templateWindowSize=7, searchWindowSize=21)
-
             # Sharpen
-            kernel = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]])
-            gray = cv2.filter2D(gray, -1, kernel)
+            gray = cv2.filter2D(gray, -1, OCR_SHARPEN_KERNEL)
 
-            # Adaptive threshold (binary)
+            # Adaptive threshold (binary); both block sizes are already odd.
+            # Local mean rather than Gaussian weighting: OpenCV computes it with
+            # a running box sum, O(1) per pixel instead of a 31x31 convolution
             block_size = 31 if gray.shape[0] >= 31 else 15
-            if block_size % 2 == 0:
-                block_size += 1
             binary = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, 11
+                gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, block_size, 11
             )
 
-            return arr, gray, binary
+            return gray, binary
+
+        # The gray/binary variants are only read by the fallbacks (and debug
+        # output), so they are built on first use; a confident read of the
+        # original crop skips the whole preprocessing chain
+        prepared = []
 
-        orig_np, gray_np, bin_np = preprocess_for_ocr(image)
+        def preprocessed():
+            if not prepared:
+                prepared.extend(preprocess_for_ocr(img_np))
+            return prepared
+
+        orig_np = img_np
 
         if save_debug:
-            import os
             debug_dir = "debug_crops"
             os.makedirs(debug_dir, exist_ok=True)
-            import time
             base = int(time.time()*1000)
+            gray_np, bin_np = preprocessed()
             Image.fromarray(gray_np).save(os.path.join(debug_dir, f"crop_gray_{base}.png"))
             Image.fromarray(bin_np).save(os.path.join(debug_dir, f"crop_bin_{base}.png"))
 
         if self.ocr_engine_name == "easyocr":
-            if self.ocr_reader is None:
-                import easyocr
-                # Initialize for English and Traditional Chinese
-                print("  Initializing EasyOCR reader (this may take a moment)...")
-                self.ocr_reader = easyocr.Reader(['en', 'ch_tra'], verbose=False) 
+            self._get_easyocr_reader()
 
             def run_easyocr(np_img, label):
                 result = self.ocr_reader.readtext(
@@ -2209,42 +3166,69 @@ class OMRSoftware(QMainWindow):
                     link_threshold=0.4
                 )
                 if not result:
-                    print(f"  EasyOCR: No text detected ({label})")
-                    return ""
+                    log.debug("EasyOCR: No text detected (%s)", label)
+                    return "", 0.0
                 texts = []
+                best_conf = 0.0
                 for detection in result:
                     bbox, text, confidence = detection
-                    print(f"  EasyOCR detected: '{text}' (confidence: {confidence:.2%}, {label})")
+                    log.debug("EasyOCR detected: '%s' (confidence: %.2f%%, %s)", text, confidence * 100, label)
                     texts.append(text)
-                return " ".join(texts)
-
-            # Try original, then preprocessed grayscale, then binary
-            text = run_easyocr(orig_np, "orig")
-            if not text:
-                text = run_easyocr(cv2.cvtColor(gray_np, cv2.COLOR_GRAY2RGB), "gray")
-            if not text:
-                text = run_easyocr(cv2.cvtColor(bin_np, cv2.COLOR_GRAY2RGB), "binary")
+                    best_conf = max(best_conf, float(confidence))
+                return " ".join(texts), best_conf
+
+            # Try original, then preprocessed grayscale, then binary, stopping
+            # at the first confident read and otherwise keeping the most
+            # confident one. readtext takes single-channel arrays as they are,
+            # so the gray/binary crops are not expanded to RGB here
+            text, conf = run_easyocr(orig_np, "orig")
+            for variant, label in ((0, "gray"), (1, "binary")):
+                if conf >= OCR_MIN_CONFIDENCE:
+                    break
+                alt_text, alt_conf = run_easyocr(preprocessed()[variant], label)
+                if alt_text and alt_conf > conf:
+                    text, conf = alt_text, alt_conf
             return text
         
-        elif self.ocr_engine_name == "tesseract":
-            import pytesseract
+        elif self.ocr_engine_name == "tesseract" and tesserocr is not None:
+            # One in-process API for every crop; try original, gray, then
+            # binary (as a single line), stopping at the first confident read
+            # and otherwise keeping the most confident one
+            with self._ts_api_lock:
+                api = self._get_tesseract_api()
+                text, conf = "", -1
+                for variant, psm in ((None, tesserocr.PSM.SINGLE_BLOCK),
+                                     (0, tesserocr.PSM.SINGLE_BLOCK),
+                                     (1, tesserocr.PSM.SINGLE_LINE)):
+                    api.SetPageSegMode(psm)
+                    api.SetImage(image if variant is None else Image.fromarray(preprocessed()[variant]))
+                    alt_text = api.GetUTF8Text().strip()
+                    alt_conf = api.MeanTextConf()
+                    if alt_text and alt_conf > conf:
+                        text, conf = alt_text, alt_conf
+                    if conf >= OCR_MIN_CONFIDENCE * 100:
+                        break
+            log.debug("Tesseract detected: '%s' (confidence: %d%%)", text, max(conf, 0))
+            return text
+
+        elif self.ocr_engine_name == "tesseract" and pytesseract is not None:
             # Default to eng+chi_tra
             try:
                 config_main = "--oem 1 --psm 6"
                 text = pytesseract.image_to_string(image, lang='eng+chi_tra', config=config_main).strip()
                 if not text:
-                    text = pytesseract.image_to_string(Image.fromarray(gray_np), lang='eng+chi_tra', config=config_main).strip()
+                    text = pytesseract.image_to_string(Image.fromarray(preprocessed()[0]), lang='eng+chi_tra', config=config_main).strip()
                 if not text:
-                    text = pytesseract.image_to_string(Image.fromarray(bin_np), lang='eng+chi_tra', config="--oem 1 --psm 7").strip()
-                print(f"  Tesseract detected: '{text}'")
+                    text = pytesseract.image_to_string(Image.fromarray(preprocessed()[1]), lang='eng+chi_tra', config="--oem 1 --psm 7").strip()
+                log.debug("Tesseract detected: '%s'", text)
                 return text
             except:
                 text = pytesseract.image_to_string(image, lang='eng', config="--oem 1 --psm 6").strip()
                 if not text:
-                    text = pytesseract.image_to_string(Image.fromarray(gray_np), lang='eng', config="--oem 1 --psm 6").strip()
+                    text = pytesseract.image_to_string(Image.fromarray(preprocessed()[0]), lang='eng', config="--oem 1 --psm 6").strip()
                 if not text:
-                    text = pytesseract.image_to_string(Image.fromarray(bin_np), lang='eng', config="--oem 1 --psm 7").strip()
-                print(f"  Tesseract detected: '{text}'")
+                    text = pytesseract.image_to_string(Image.fromarray(preprocessed()[1]), lang='eng', config="--oem 1 --psm 7").strip()
+                log.debug("Tesseract detected: '%s'", text)
                 return text
         
         return "OCR Error: No Engine"
@@ -2275,6 +3259,11 @@ class OMRSoftware(QMainWindow):
         self.act_auto_update.setChecked(self._settings.value("check_update_on_startup", True, type=bool))
         self.act_auto_update.triggered.connect(self._toggle_auto_update)
         settings_menu.addAction(self.act_auto_update)
+        self.act_ocr_heavy_denoise = QAction(tr("chk_ocr_heavy_denoise"), self)
+        self.act_ocr_heavy_denoise.setCheckable(True)
+        self.act_ocr_heavy_denoise.setChecked(self.ocr_heavy_denoise)
+        self.act_ocr_heavy_denoise.triggered.connect(self._toggle_ocr_heavy_denoise)
+        settings_menu.addAction(self.act_ocr_heavy_denoise)
 
         # Help menu
         help_menu = menubar.addMenu(tr("menu_help"))
@@ -2324,6 +3313,12 @@ class OMRSoftware(QMainWindow):
         self.check_auto_align = QCheckBox(tr("chk_auto_align"))
         self.check_auto_align.setChecked(False)
         f_layout.addWidget(self.check_auto_align)
+
+        self.check_gray_preview = QCheckBox(tr("chk_gray_preview"))
+        self.check_gray_preview.setChecked(False)
+        self.check_gray_preview.stateChanged.connect(
+            lambda _: self.load_page(self.current_page) if getattr(self, 'pdf_document', None) else None)
+        f_layout.addWidget(self.check_gray_preview)
         
         left_layout.addWidget(file_grp)
         
@@ -2619,6 +3614,10 @@ class OMRSoftware(QMainWindow):
     def _toggle_auto_update(self, checked):
         self._settings.setValue("check_update_on_startup", checked)
 
+    def _toggle_ocr_heavy_denoise(self, checked):
+        self.ocr_heavy_denoise = checked
+        self._settings.setValue("ocr_heavy_denoise", checked)
+
     def _check_for_update(self, silent=True):
         """Launch background update check.  silent=True suppresses 'no update' / 'failed' dialogs."""
         if self._update_thread is not None and self._update_thread.isRunning():
@@ -2642,7 +3641,6 @@ class OMRSoftware(QMainWindow):
 
         if body.strip():
             dlg_layout.addWidget(QLabel(f"\n<b>{tr('update_whats_new')}:</b>"))
-            from PyQt5.QtWidgets import QTextEdit
             notes_box = QTextEdit()
             notes_box.setReadOnly(True)
             notes_box.setMarkdown(body)
@@ -2883,6 +3881,7 @@ class OMRSoftware(QMainWindow):
             try:
                 self.pdf_path = fname
                 self.pdf_document = fitz.open(fname)
+                self.skew_angles = {}
                 self.current_page = 0
                 # Reset all alignment references when loading new PDF
                 self._reset_align_templates()
@@ -2902,19 +3901,61 @@ class OMRSoftware(QMainWindow):
 
     def _safe_crop_label(self, label):
         label = str(label) if label is not None else ""
-        label = re.sub(r"[^A-Za-z0-9_-]+", "_", label).strip("_")
+        label = _LABEL_RE.sub("_", label).strip("_")
         return label or "item"
 
     def _save_crop_image(self, image, page_idx, label, kind):
-        """Save a crop image and return the file path."""
-        debug_dir = "debug_crops"
-        os.makedirs(debug_dir, exist_ok=True)
+        """Register a crop image (PIL Image or RGB array) and return its file path.
+
+        The PNG is not written here: crops are only looked at when opened from
+        the results table or exported in a debug pack, so they wait in
+        self._crop_store until _materialize_crop / _flush_crop_store (or
+        eviction past CROP_CACHE_SIZE) writes them.
+        """
         safe_label = self._safe_crop_label(label)
         filename = f"page_{page_idx+1}_{kind}_{safe_label}.png"
-        path = os.path.join(debug_dir, filename)
-        image.save(path)
+        path = os.path.join("debug_crops", filename)
+        if isinstance(image, np.ndarray):
+            # Detach from the page buffer the crop may be a view of
+            image = image.copy()
+        with self._crop_store_lock:
+            self._crop_store[path] = image
+            self._crop_store.move_to_end(path)
+            evicted = []
+            while len(self._crop_store) > CROP_CACHE_SIZE:
+                evicted.append(self._crop_store.popitem(last=False))
+        for old_path, old_image in evicted:
+            self._write_crop_image(old_image, old_path)
         return path
 
+    @staticmethod
+    def _write_crop_image(image, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if isinstance(image, np.ndarray):
+            # OpenCV's PNG encoder is faster than PIL's; encode in memory and
+            # write with tofile() so non-ASCII paths work on Windows
+            bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR) if image.ndim == 3 else image
+            cv2.imencode(".png", bgr)[1].tofile(path)
+        else:
+            image.save(path)
+
+    def _materialize_crop(self, path):
+        """Write the crop for path if it is still held in memory.
+        Returns True if the file exists afterwards."""
+        with self._crop_store_lock:
+            image = self._crop_store.pop(path, None)
+        if image is not None:
+            self._write_crop_image(image, path)
+        return os.path.exists(path)
+
+    def _flush_crop_store(self):
+        """Write every crop still held in memory."""
+        with self._crop_store_lock:
+            pending = list(self._crop_store.items())
+            self._crop_store.clear()
+        for path, image in pending:
+            self._write_crop_image(image, path)
+
     def _get_page_filename(self, page_idx):
         """Return a filename stem (no extension) for the exported image of page_idx.
         - Answer key page → 'answer_key'
@@ -2940,26 +3981,25 @@ class OMRSoftware(QMainWindow):
         else:
             return f"page_{page_idx + 1:03d}"
         # Sanitise for use as a filesystem name
-        safe = re.sub(r'[\\/:*?"<>|\s]+', '_', raw).strip('_')
+        safe = _FILENAME_RE.sub('_', raw).strip('_')
         return safe if safe else f"page_{page_idx + 1:03d}"
 
     def _get_all_questions(self):
         questions = set()
         if hasattr(self, "view") and getattr(self.view, "option_marks", None):
-            for mark in self.view.option_marks:
-                questions.add(mark.question_num)
+            questions = {mark.question_num for mark in self.view.option_marks}
         if hasattr(self, "results"):
-            for res in self.results.values():
-                questions.update(res.get("options", {}).keys())
+            questions.update(q for res in self.results.values() for q in res.get("options", {}))
         return sorted(questions)
 
     def _get_text_field_labels(self):
-        labels = []
+        # Insertion-ordered dict as an ordered set: O(1) duplicate checks
+        labels = {}
 
         def add_label(val):
             val = str(val).strip() if val is not None else ""
-            if val and val not in labels:
-                labels.append(val)
+            if val:
+                labels.setdefault(val, None)
 
         for default_label in [tr("field_class"), tr("field_student_no"), tr("field_name")]:
             add_label(default_label)
@@ -2970,28 +4010,16 @@ class OMRSoftware(QMainWindow):
 
         if hasattr(self, "results"):
             for res in self.results.values():
-                for key in res.get("text", {}).keys():
+                for key in res.get("text", {}):
                     add_label(key)
 
-        return labels
+        return list(labels)
 
     def _ensure_results_for_pages(self):
-        if not hasattr(self, "results") or self.results is None:
-            self.results = {}
-        total_pages = len(self.pdf_document) if self.pdf_document else 0
-        for p_idx in range(total_pages):
-            if p_idx not in self.results:
-                self.results[p_idx] = {
-                    "options": {},
-                    "text": {},
-                    "option_crops": {},
-                    "text_crops": {}
-                }
-            else:
-                self.results[p_idx].setdefault("options", {})
-                self.results[p_idx].setdefault("text", {})
-                self.results[p_idx].setdefault("option_crops", {})
-                self.results[p_idx].setdefault("text_crops", {})
+        # Pages without results get their empty skeleton on first access
+        # (_ResultsDict.__missing__), so there is nothing to pre-populate
+        if not isinstance(getattr(self, "results", None), _ResultsDict):
+            self.results = _ResultsDict(getattr(self, "results", None) or {})
 
     def edit_student_info(self):
         if not self.pdf_document:
@@ -3296,55 +4324,104 @@ class OMRSoftware(QMainWindow):
 
         dialog.exec_()
 
-    def load_page(self, p_idx, apply_corrections=True):
-        if not self.pdf_document: return
-        
-        # Save current image offset
-        if self.current_pixmap_item:
-            self.page_offsets[self.current_page] = self.current_pixmap_item.get_offset()
-            
-        self.current_page = p_idx
-        self.lbl_page.setText(tr("lbl_page", current=p_idx+1, total=len(self.pdf_document)))
+    def _render_page_cached(self, p_idx, apply_corrections):
+        """Render page p_idx for display, with deskew/align corrections applied
+        when enabled. Returns (QPixmap, width, height, correction_info).
+
+        Results are kept in a small LRU keyed on everything that changes the
+        output (page, corrections, preview mode, alignment marks), so flipping
+        back to a recently viewed page skips rasterization, corrections and
+        the QImage -> QPixmap conversion.
+        The cache is dropped when the document changes or the alignment
+        reference is reset.
+        """
+        gray_preview = hasattr(self, 'check_gray_preview') and self.check_gray_preview.isChecked()
+        deskew = hasattr(self, 'check_auto_deskew') and self.check_auto_deskew.isChecked()
+        align = (hasattr(self, 'check_auto_align') and self.check_auto_align.isChecked()
+                 and hasattr(self, 'view') and len(self.view.align_marks) > 0)
+        align_rects = tuple(
+            (r.x(), r.y(), r.width(), r.height())
+            for r in (m.sceneBoundingRect() for m in self.view.align_marks)
+        ) if align else ()
+        key = (p_idx, bool(apply_corrections), gray_preview, deskew, align, align_rects)
+        
+        cache = getattr(self, '_page_cache', None)
+        if cache is None or getattr(self, '_page_cache_doc', None) is not self.pdf_document:
+            cache = self._page_cache = OrderedDict()
+            self._page_cache_doc = self.pdf_document
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+            return hit
         
         # Render PDF
         page = self.pdf_document[p_idx]
-        mat = fitz.Matrix(2, 2)
-        pix = page.get_pixmap(matrix=mat)
+        # Grayscale preview renders one byte per pixel instead of three
+        if gray_preview:
+            pix = page.get_pixmap(matrix=RENDER_MATRIX, colorspace=fitz.csGRAY)
+        else:
+            pix = page.get_pixmap(matrix=RENDER_MATRIX)
         
-        # Convert to numpy array for processing
-        img_pil = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        img_np = np.array(img_pil)
+        # Zero-copy NumPy view of the pixmap; pix must outlive img_np, which
+        # holds because both stay in scope until the QPixmap below is built
+        img_np = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+        if gray_preview:
+            img_np = img_np[:, :, 0]
         
         correction_info = []
         
         # Apply corrections if enabled
         if apply_corrections:
             # Apply auto-deskew if enabled
-            if hasattr(self, 'check_auto_deskew') and self.check_auto_deskew.isChecked():
-                img_np, skew_angle = deskew_image(img_np)
+            if deskew:
+                img_np, skew_angle = deskew_image(img_np, quality="smooth",
+                                                  skew_angle=self._page_skew_angle(img_np, p_idx))
                 if skew_angle != 0.0:
                     correction_info.append(f"Deskew: {skew_angle:.2f}°")
             
             # Apply auto-align (shift) if enabled and alignment mark(s) exist
-            if hasattr(self, 'check_auto_align') and self.check_auto_align.isChecked():
-                if hasattr(self, 'view') and len(self.view.align_marks) > 0:
-                    # Page 0 initializes the template, other pages get aligned
-                    img_np, (dx, dy), confidence = self.align_image(img_np, p_idx)
-                    if p_idx == 0:
-                        correction_info.append("Alignment reference set")
-                    elif dx != 0.0 or dy != 0.0:
-                        correction_info.append(f"Shift correction: dx={dx:.1f}, dy={dy:.1f}")
+            if align:
+                # Page 0 initializes the template, other pages get aligned
+                img_np, (dx, dy), confidence = self.align_image(img_np, p_idx)
+                if p_idx == 0:
+                    correction_info.append("Alignment reference set")
+                elif dx != 0.0 or dy != 0.0:
+                    correction_info.append(f"Shift correction: dx={dx:.1f}, dy={dy:.1f}")
         
         # Convert back to QImage
         h, w = img_np.shape[:2]
-        img = QImage(img_np.data, w, h, img_np.strides[0], QImage.Format_RGB888).copy()
+        img_np = np.ascontiguousarray(img_np)
+        fmt = QImage.Format_Grayscale8 if img_np.ndim == 2 else QImage.Format_RGB888
+        # No copy: the QImage only wraps img_np's memory for the conversion;
+        # QPixmap.fromImage makes the one copy Qt keeps, so the cache holds
+        # just the display-ready pixmap, not the source buffers
+        img = QImage(img_np.data, w, h, img_np.strides[0], fmt)
+        pixmap = QPixmap.fromImage(img)
+        
+        cache[key] = (pixmap, w, h, correction_info)
+        while len(cache) > PAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return pixmap, w, h, correction_info
+
+    def load_page(self, p_idx, apply_corrections=True, prefetch=True):
+        if not self.pdf_document: return
+        
+        # Save current image offset
+        if self.current_pixmap_item:
+            self.page_offsets[self.current_page] = self.current_pixmap_item.get_offset()
+            
+        # Direction of travel, used to prefetch the likely next page first
+        prefetch_steps = (-1, 1) if p_idx < self.current_page else (1, -1)
+        self.current_page = p_idx
+        self.lbl_page.setText(tr("lbl_page", current=p_idx+1, total=len(self.pdf_document)))
+        
+        pix_item, w, h, correction_info = self._render_page_cached(p_idx, apply_corrections)
         
         # Remove only the pixmap item, not the marks
         if self.current_pixmap_item is not None:
             self.scene.removeItem(self.current_pixmap_item)
         
         # Add Image
-        pix_item = QPixmap.fromImage(img)
         self.current_pixmap_item = MovablePixmapItem(pix_item)
         
         # Restore offset
@@ -3383,6 +4460,43 @@ class OMRSoftware(QMainWindow):
         # Update student info label for current page
         self._update_student_info_label()
 
+        # Warm the page cache with the neighbours once the event loop is idle;
+        # reloads of the same page (e.g. after toggling an option) reuse a
+        # prefetch that is still queued rather than starting a second one
+        prefetch_key = (p_idx, apply_corrections)
+        if prefetch and getattr(self, '_prefetch_pending', None) != prefetch_key:
+            self._prefetch_pending = prefetch_key
+            QTimer.singleShot(0, lambda: self._prefetch_neighbor_pages(p_idx, apply_corrections, prefetch_steps))
+
+    def _prefetch_neighbor_pages(self, p_idx, apply_corrections, steps=(1, -1)):
+        """Render the pages next to p_idx into the page cache, one per
+        event-loop turn, so paging back and forth finds them ready.
+
+        PyMuPDF must not be used from several threads, so this runs on the
+        GUI thread in idle time rather than on a QThreadPool; it stops as
+        soon as the user has moved to another page.
+        """
+        def finish():
+            if getattr(self, '_prefetch_pending', None) == (p_idx, apply_corrections):
+                self._prefetch_pending = None
+
+        if not self.pdf_document or self.current_page != p_idx or not steps:
+            finish()
+            return
+        if (apply_corrections and hasattr(self, 'check_auto_align') and self.check_auto_align.isChecked()
+                and not self._align_reference_ready(len(self.view.align_marks) > 0)):
+            # The first aligned page rendered becomes the reference; leave that
+            # to the page the user actually opens
+            finish()
+            return
+        n = p_idx + steps[0]
+        if 0 <= n < len(self.pdf_document):
+            self._render_page_cached(n, apply_corrections)
+        if len(steps) > 1:
+            QTimer.singleShot(0, lambda: self._prefetch_neighbor_pages(p_idx, apply_corrections, steps[1:]))
+        else:
+            finish()
+
     def _update_student_info_label(self):
         """Update the student info label for the current page from student_order."""
         if not hasattr(self, 'lbl_student_info'):
@@ -3425,18 +4539,32 @@ class OMRSoftware(QMainWindow):
         
         last_mark = self.view.mark_history.pop()
         
-        if last_mark in self.view.text_marks:
-            self.view.text_marks.remove(last_mark)
+        # Dispatch on the mark's own type instead of scanning every list; the
+        # mark just undone is normally the last one in its list, so check the
+        # end first and only fall back to a search (e.g. after reordering)
+        marks = {
+            MARK_TYPE_TEXT: self.view.text_marks,
+            MARK_TYPE_OPTION: self.view.option_marks,
+            MARK_TYPE_ALIGN: self.view.align_marks,
+        }.get(last_mark.mark_type, [])
+        if marks and marks[-1] is last_mark:
+            marks.pop()
+        elif last_mark in marks:
+            marks.remove(last_mark)
+        else:
+            # Not in any list: only the scene item is left to remove
+            self.scene.removeItem(last_mark)
+            return
+        
+        if last_mark.mark_type == MARK_TYPE_TEXT:
             # Restore counter to the removed item's question number
             self.view.text_counter = last_mark.question_num
             print(f"Undo: Removed text mark Q{last_mark.question_num} ('{last_mark.label}'), counter reset to {self.view.text_counter}")
-        elif last_mark in self.view.option_marks:
-            self.view.option_marks.remove(last_mark)
+        elif last_mark.mark_type == MARK_TYPE_OPTION:
             # Restore counter to the removed item's question number
             self.view.option_counter = last_mark.question_num
             print(f"Undo: Removed option mark Q{last_mark.question_num} ('{last_mark.label}'), counter reset to {self.view.option_counter}")
-        elif last_mark in self.view.align_marks:
-            self.view.align_marks.remove(last_mark)
+        else:
             # Also reset alignment template
             self._reset_align_templates()
             print("Undo: Removed alignment mark")
@@ -3462,14 +4590,12 @@ class OMRSoftware(QMainWindow):
         data = self.view.get_all_marks_data()
         fname, _ = QFileDialog.getSaveFileName(self, "Save Template", "", "JSON (*.json)")
         if fname:
-            with open(fname, 'w') as f:
-                json.dump(data, f, indent=2)
+            _dump_json_file(data, fname)
 
     def import_template(self):
         fname, _ = QFileDialog.getOpenFileName(self, "Load Template", "", "JSON (*.json)")
         if fname:
-            with open(fname, 'r') as f:
-                data = json.load(f)
+            data = _load_json_file(fname)
             self.clear_all_marks()
             
             for m in data.get("text_marks", []):
@@ -3501,6 +4627,162 @@ class OMRSoftware(QMainWindow):
                 self.scene.addItem(item)
                 self.view.align_counter = max(self.view.align_counter, ad.get('question', 1) + 1)
 
+    @staticmethod
+    def _mark_crop_boxes(marks_arr, off_x, off_y, img_w, img_h):
+        """Image-space crop boxes for a marks array as a list of
+        (left, top, right, bottom), clipped to the image. Coordinates are
+        truncated like int() so crops match the per-mark computation."""
+        x = marks_arr['x'] - off_x
+        y = marks_arr['y'] - off_y
+        boxes = np.empty((len(marks_arr), 4), dtype=np.int64)
+        boxes[:, 0] = np.maximum(0, np.trunc(x))
+        boxes[:, 1] = np.maximum(0, np.trunc(y))
+        boxes[:, 2] = np.minimum(img_w, np.trunc(x + marks_arr['w']))
+        boxes[:, 3] = np.minimum(img_h, np.trunc(y + marks_arr['h']))
+        return boxes.tolist()
+
+    @staticmethod
+    def _boxes_bbox(box_lists):
+        """Bounding box (left, top, right, bottom) of the non-empty boxes in
+        box_lists (lists of crop boxes), or None if there are none."""
+        boxes = [b for boxes in box_lists for b in boxes if b[2] > b[0] and b[3] > b[1]]
+        if not boxes:
+            return None
+        arr = np.array(boxes)
+        return (int(arr[:, 0].min()), int(arr[:, 1].min()),
+                int(arr[:, 2].max()), int(arr[:, 3].max()))
+
+    def _page_crop_boxes(self, box_cache, marks_arrs, off_x, off_y, img_w, img_h):
+        """_mark_crop_boxes() for each array in marks_arrs, memoized per run.
+
+        Boxes only depend on the page offset and image size, which are the
+        same for most pages (the image is rarely moved), so box_cache (a
+        dict owned by the caller's page loop) reuses them across pages.
+        The returned lists are shared and must not be modified.
+        """
+        key = (off_x, off_y, img_w, img_h)
+        boxes = box_cache.get(key)
+        if boxes is None:
+            boxes = box_cache[key] = [self._mark_crop_boxes(arr, off_x, off_y, img_w, img_h)
+                                      for arr in marks_arrs]
+        return boxes
+
+    @staticmethod
+    def _option_mark_specs(option_marks):
+        """Snapshot option marks as (question_num, options_count, label) tuples
+        for _score_option_marks, built once per recognition run."""
+        return [(m.question_num, m.options_count, f"Q{m.question_num}") for m in option_marks]
+
+    def _score_option_marks(self, p_idx, img_np, option_specs, option_boxes):
+        """Crop, save and score the option marks of one page (an RGB array).
+
+        option_specs comes from _option_mark_specs(). Returns (options,
+        option_crops) keyed by question number. No mark items are touched,
+        so recognition runs this on worker threads while the next page is
+        prepared.
+        """
+        options, option_crops = {}, {}
+        for (q_num, options_count, label), (left, top, right, bottom) in zip(option_specs, option_boxes):
+            if right > left and bottom > top:
+                crop = img_np[top:bottom, left:right]  # view, no copy
+                crop_path = self._save_crop_image(crop, p_idx, label, "option")
+                text = self.detect_filled_option(crop, options_count, save_debug=True,
+                    context={"page": p_idx + 1, "question": q_num, "label": label})
+            else:
+                text = "[Out of bounds]"
+                crop_path = ""
+            options[q_num] = text
+            option_crops[q_num] = crop_path
+        return options, option_crops
+
+    @staticmethod
+    def _collect_scored_options(scored, max_pending):
+        """Fill in page results from finished _score_option_marks futures.
+
+        scored is a list of (page_res, future), oldest first. Waits until at
+        most max_pending pages are still being scored, which also bounds the
+        number of page images held in memory. Returns the number of option
+        results filled in, for the run's running total.
+        """
+        collected = 0
+        while len(scored) > max_pending:
+            page_res, fut = scored.pop(0)
+            page_res["options"], page_res["option_crops"] = fut.result()
+            collected += len(page_res["options"])
+        return collected
+
+    def _iter_recognition_pages(self, page_indices, deskew, align=False, gray=False,
+                                deskew_quality="fast"):
+        """Yield (p_idx, img_np, skew_angle, aligned) for each page, rendered at 2x.
+
+        gray renders single-channel pages (one byte per pixel instead of
+        three); callers set it when the template has no option marks, since
+        only bubble scoring needs colour. deskew_quality is passed on to
+        deskew_image(); image export uses "smooth".
+
+        aligned is align_image()'s (img, (dx, dy), response) tuple, or None
+        when align is False. Deskew and alignment run on worker threads while
+        the caller recognizes earlier pages. Rendering stays on this thread
+        (PyMuPDF is not thread-safe). Alignment also stays here until the
+        reference page has been recorded; after that it only reads shared
+        state, so later pages are aligned on the workers in parallel.
+
+        This is the first stage of the recognition pipeline: the callers
+        score option marks on a second pool (_score_option_marks) and OCR
+        text fields in batches on an OCRWorker thread, so rendering, image
+        correction, scoring and OCR of different pages overlap. Each stage
+        holds only a few pages at a time.
+        """
+        # With option marks, pages are rendered in RGB even though OCR and
+        # alignment work in gray: detect_filled_option scores blue ink by
+        # saturation. Gray conversions happen per crop or on downsampled
+        # copies, where they are cheap. Text-only templates render in gray
+        # at source; deskew, alignment and both OCR engines take 2-D arrays
+        colorspace = fitz.csGRAY if gray else fitz.csRGB
+        use_templates = align and len(self.view.align_marks) > 0
+        workers = max(1, min(4, os.cpu_count() or 1))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for p_idx in page_indices:
+                pix = self.pdf_document[p_idx].get_pixmap(matrix=RENDER_MATRIX, colorspace=colorspace)
+                # pix.samples is the page's one copy: the array outlives pix
+                # (worker threads and option scoring keep using it), so it
+                # cannot view samples_mv; the NumPy array itself is a view
+                img_np = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+                if gray:
+                    img_np = img_np[:, :, 0]
+                align_here = align and self._align_reference_ready(use_templates)
+                if deskew or align_here:
+                    fut = pool.submit(self._prepare_recognition_page, img_np, p_idx,
+                                      deskew, align_here, use_templates, deskew_quality)
+                else:
+                    fut = None
+                pending.append((p_idx, img_np, fut, align and not align_here, use_templates))
+                if len(pending) > workers:
+                    yield self._finish_recognition_page(pending.popleft())
+            while pending:
+                yield self._finish_recognition_page(pending.popleft())
+
+    def _prepare_recognition_page(self, img_np, p_idx, deskew, align, use_templates,
+                                  deskew_quality="fast"):
+        """Worker-thread part of _iter_recognition_pages."""
+        skew_angle = 0.0
+        if deskew:
+            img_np, skew_angle = deskew_image(img_np, quality=deskew_quality,
+                                              skew_angle=self._page_skew_angle(img_np, p_idx))
+        aligned = self._align_page(img_np, p_idx, use_templates) if align else None
+        return img_np, skew_angle, aligned
+
+    def _finish_recognition_page(self, item):
+        p_idx, img_np, fut, align_now, use_templates = item
+        skew_angle, aligned = 0.0, None
+        if fut is not None:
+            img_np, skew_angle, aligned = fut.result()
+        if align_now:
+            # Reference not recorded yet when this page was submitted
+            aligned = self._align_page(img_np, p_idx, use_templates)
+        return p_idx, img_np, skew_angle, aligned
+
     def run_recognition_all(self):
         if not self.pdf_document: 
             QMessageBox.warning(self, "Warning", tr("msg_no_pdf"))
@@ -3509,7 +4791,7 @@ class OMRSoftware(QMainWindow):
             QMessageBox.warning(self, "Warning", tr("msg_no_marks"))
             return
             
-        self.results = {}
+        self.results = _ResultsDict()
         self.debug_records = []
         
         # Save current page's image offset before processing
@@ -3528,35 +4810,54 @@ class OMRSoftware(QMainWindow):
         # Get marks data once (they are the same for all pages)
         # Marks are in scene coordinates. We need to map them relative to image position.
         
-        for p_idx in range(len(self.pdf_document)):
-            QtWidgets.QApplication.processEvents()
+        # Text-field crops are OCR'd in batches after all pages are scanned
+        pending_text = []
+        
+        # Mark geometry and attributes are fixed for the whole run; snapshot
+        # them once instead of querying the mark items on every page
+        option_marks = list(self.view.option_marks)
+        option_arr = self.view.get_marks_array(option_marks)
+        option_specs = self._option_mark_specs(option_marks)
+        text_arr = self.view.get_marks_array(self.view.text_marks)
+        # (key, crop label) per text mark; key is the label, else "Field X"
+        text_specs = [(m.label or f"Field {m.question_num}", m.label or f"Field_{m.question_num}")
+                      for m in self.view.text_marks]
+        
+        # Option marks are scored on worker threads while this thread moves
+        # on to the next page
+        workers = max(1, min(4, os.cpu_count() or 1))
+        scoring = ThreadPoolExecutor(max_workers=workers)
+        scored = []
+        total_options = 0  # running count for the summary message
+        box_cache = {}  # crop boxes per (offset, image size), see _page_crop_boxes
+        
+        # Pages arrive rendered (deskewed and aligned if enabled) from a small pipeline
+        pages = self._iter_recognition_pages(range(len(self.pdf_document)),
+                                             self.check_auto_deskew.isChecked(),
+                                             self.check_auto_align.isChecked(),
+                                             gray=not option_marks)
+        last_pump = 0.0
+        for p_idx, img_np, skew_angle, aligned in pages:
+            # Throttle progress updates; setValue on the modal dialog also
+            # processes pending events, so no separate processEvents() call
+            now = time.monotonic()
+            if now - last_pump >= PROGRESS_PUMP_INTERVAL:
+                last_pump = now
+                progress.setLabelText(f"Recognizing page {p_idx + 1} of {len(self.pdf_document)}...")
+                progress.setValue(p_idx)
             if progress.wasCanceled(): 
                 break
-            progress.setValue(p_idx)
-            progress.setLabelText(f"Recognizing page {p_idx + 1} of {len(self.pdf_document)}...")
-            
-            # Render page
-            page = self.pdf_document[p_idx]
-            mat = fitz.Matrix(2, 2)
-            pix = page.get_pixmap(matrix=mat)
-            img_pil = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
             
-            # Apply auto-deskew if enabled
-            skew_angle = 0.0
-            if self.check_auto_deskew.isChecked():
-                img_np = np.array(img_pil)
-                img_corrected, skew_angle = deskew_image(img_np)
-                if skew_angle != 0.0:
-                    print(f"Page {p_idx + 1}: Corrected skew angle: {skew_angle:.2f}°")
-                    img_pil = Image.fromarray(img_corrected)
+            if skew_angle != 0.0:
+                print(f"Page {p_idx + 1}: Corrected skew angle: {skew_angle:.2f}°")
 
-            # Apply auto-align (shift) if enabled
-            if self.check_auto_align.isChecked():
-                img_np = np.array(img_pil)
-                img_aligned, (dx, dy), response = self.align_image(img_np, p_idx)
+            # Apply auto-align (shift) if enabled; computed by the page pipeline
+            if aligned is not None:
+                img_aligned, (dx, dy), response = aligned
                 if dx != 0.0 or dy != 0.0:
                     print(f"Page {p_idx + 1}: Aligned shift dx={dx:.1f}, dy={dy:.1f} (score={response:.3f})")
-                    img_pil = Image.fromarray(img_aligned)
+                    img_np = img_aligned
+            img_h, img_w = img_np.shape[:2]
             
             # Get Image Offset for this page (where the image was positioned in the scene)
             # If user moved the image, marks are relative to scene origin (0,0)
@@ -3571,72 +4872,51 @@ class OMRSoftware(QMainWindow):
                 "text_crops": {}
             }
             
-            # Helper to process a list of marks
-            def process_marks(marks_list, target_dict):
-                for mark in marks_list:
-                    rect = mark.sceneBoundingRect()
-                    # Convert scene coordinates to image coordinates
-                    # The image is positioned at (off_x, off_y) in the scene
-                    # So image coordinate = scene coordinate - image offset
-                    img_x = rect.x() - off_x
-                    img_y = rect.y() - off_y
-                    
-                    print(f"Mark Q{mark.question_num}: scene=({rect.x():.0f},{rect.y():.0f}), offset=({off_x:.0f},{off_y:.0f}), img=({img_x:.0f},{img_y:.0f}), size=({rect.width():.0f}x{rect.height():.0f})")
-                    
-                    # Ensure crop is within image bounds
-                    left = max(0, int(img_x))
-                    top = max(0, int(img_y))
-                    right = min(img_pil.width, int(img_x + rect.width()))
-                    bottom = min(img_pil.height, int(img_y + rect.height()))
-                    
-                    print(f"  Crop: ({left},{top})-({right},{bottom}), img size: {img_pil.width}x{img_pil.height}")
-                    
-                    if right > left and bottom > top:
-                        crop = img_pil.crop((left, top, right, bottom))
-                        crop_label = f"Q{mark.question_num}" if mark.mark_type == MARK_TYPE_OPTION else (mark.label or f"Field_{mark.question_num}")
-                        crop_path = self._save_crop_image(crop, p_idx, crop_label, "option" if mark.mark_type == MARK_TYPE_OPTION else "text")
-                        
-                        if mark.mark_type == MARK_TYPE_OPTION:
-                            # Use bubble detection for options
-                            text = self.detect_filled_option(
-                                crop,
-                                mark.options_count,
-                                save_debug=True,
-                                context={
-                                    "page": p_idx + 1,
-                                    "question": mark.question_num,
-                                    "label": f"Q{mark.question_num}"
-                                }
-                            )
-                        else:
-                            # Use OCR for text fields
-                            text = self.get_ocr_result(crop, save_debug=True)
-                    else:
-                        text = f"[Out of bounds]"
-                        print(f"  Out of bounds!")
-                        crop_path = ""
-                    
-                    if mark.mark_type == MARK_TYPE_OPTION:
-                        target_dict[mark.question_num] = text
-                        page_res["option_crops"][mark.question_num] = crop_path
-                    else:
-                        # For text fields, use label as key if exists, else "Field X"
-                        key = mark.label if mark.label else f"Field {mark.question_num}"
-                        target_dict[key] = text
-                        page_res["text_crops"][key] = crop_path
-            
-            process_marks(self.view.option_marks, page_res["options"])
-            process_marks(self.view.text_marks, page_res["text"])
+            # Convert scene coordinates to image coordinates
+            # The image is positioned at (off_x, off_y) in the scene
+            # So image coordinate = scene coordinate - image offset
+            # Crops are clipped to the image bounds and taken as NumPy views
+            option_boxes, text_boxes = self._page_crop_boxes(box_cache, (option_arr, text_arr),
+                                                             off_x, off_y, img_w, img_h)
+            scored.append((page_res, scoring.submit(self._score_option_marks, p_idx, img_np,
+                                                    option_specs, option_boxes)))
+            
+            for (key, crop_label), geom, (left, top, right, bottom) in zip(text_specs, text_arr, text_boxes):
+                log.debug("Mark Q%s: scene=(%.0f,%.0f), offset=(%.0f,%.0f), img=(%.0f,%.0f), size=(%.0fx%.0f)",
+                          geom['q'], geom['x'], geom['y'], off_x, off_y,
+                          geom['x'] - off_x, geom['y'] - off_y, geom['w'], geom['h'])
+                log.debug("  Crop: (%d,%d)-(%d,%d), img size: %dx%d",
+                          left, top, right, bottom, img_w, img_h)
+                if right > left and bottom > top:
+                    crop = img_np[top:bottom, left:right]
+                    crop_path = self._save_crop_image(crop, p_idx, crop_label, "text")
+                    # Queue OCR for text fields; filled in after the page loop
+                    pending_text.append((p_idx, key, Image.fromarray(crop)))
+                    text = ""
+                else:
+                    text = f"[Out of bounds]"
+                    log.debug("  Out of bounds!")
+                    crop_path = ""
+                
+                page_res["text"][key] = text
+                page_res["text_crops"][key] = crop_path
             
             # Store
             self.results[p_idx] = page_res
+            total_options += self._collect_scored_options(scored, workers)
+        pages.close()  # stop the page pipeline if cancelled early
+        total_options += self._collect_scored_options(scored, 0)
+        scoring.shutdown()
+            
+        if pending_text:
+            progress.setLabelText("Recognizing text fields...")
+            self._ocr_pending_text(pending_text, progress)
             
         progress.setValue(len(self.pdf_document))
         progress.close()
         
         # Show summary
         total_pages = len(self.results)
-        total_options = sum(len(r.get("options", {})) for r in self.results.values())
         QMessageBox.information(self, tr("msg_recognition_title"), 
             tr("msg_recognition_complete", pages=total_pages, options=total_options))
         
@@ -3666,7 +4946,6 @@ class OMRSoftware(QMainWindow):
 
         dlg_layout.addWidget(QLabel(tr("dlg_recognize_prompt")))
 
-        from PyQt5.QtWidgets import QRadioButton, QLineEdit
         rb_current = QRadioButton(tr("dlg_recognize_current") + f" ({self.current_page + 1})")
         rb_current.setChecked(True)
         rb_all = QRadioButton(tr("dlg_recognize_all_pages"))
@@ -3707,7 +4986,7 @@ class OMRSoftware(QMainWindow):
 
         # Ensure results dict exists
         if not hasattr(self, 'results') or self.results is None:
-            self.results = {}
+            self.results = _ResultsDict()
 
         # Save current page's image offset
         if self.current_pixmap_item:
@@ -3724,30 +5003,36 @@ class OMRSoftware(QMainWindow):
         progress.show()
 
         processed_count = 0
-        for idx, p_idx in enumerate(pages_to_process):
-            QtWidgets.QApplication.processEvents()
+        pending_text = []
+        option_marks = list(self.view.option_marks)
+        option_arr = self.view.get_marks_array(option_marks)
+        option_specs = self._option_mark_specs(option_marks)
+        text_arr = self.view.get_marks_array(self.view.text_marks)
+        text_keys = [m.label or f"Field {m.question_num}" for m in self.view.text_marks]
+        workers = max(1, min(4, os.cpu_count() or 1))
+        scoring = ThreadPoolExecutor(max_workers=workers)
+        scored = []
+        total_options = 0  # running count for the summary message
+        box_cache = {}  # crop boxes per (offset, image size), see _page_crop_boxes
+        pages = self._iter_recognition_pages(pages_to_process, self.check_auto_deskew.isChecked(),
+                                             self.check_auto_align.isChecked(),
+                                             gray=not option_marks)
+        last_pump = 0.0
+        for idx, (p_idx, img_np, skew_angle, aligned) in enumerate(pages):
+            # Throttle progress updates (setValue also processes events)
+            now = time.monotonic()
+            if now - last_pump >= PROGRESS_PUMP_INTERVAL:
+                last_pump = now
+                progress.setLabelText(f"Re-recognizing page {p_idx + 1}...")
+                progress.setValue(idx)
             if progress.wasCanceled():
                 break
-            progress.setValue(idx)
-            progress.setLabelText(f"Re-recognizing page {p_idx + 1}...")
-
-            # Render page
-            page = self.pdf_document[p_idx]
-            mat = fitz.Matrix(2, 2)
-            pix = page.get_pixmap(matrix=mat)
-            img_pil = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-            if self.check_auto_deskew.isChecked():
-                img_np = np.array(img_pil)
-                img_corrected, skew_angle = deskew_image(img_np)
-                if skew_angle != 0.0:
-                    img_pil = Image.fromarray(img_corrected)
 
-            if self.check_auto_align.isChecked():
-                img_np = np.array(img_pil)
-                img_aligned, (dx, dy), response = self.align_image(img_np, p_idx)
+            if aligned is not None:
+                img_aligned, (dx, dy), response = aligned
                 if dx != 0.0 or dy != 0.0:
-                    img_pil = Image.fromarray(img_aligned)
+                    img_np = img_aligned
+            img_h, img_w = img_np.shape[:2]
 
             off_x, off_y = self.page_offsets.get(p_idx, (0, 0))
 
@@ -3764,40 +5049,17 @@ class OMRSoftware(QMainWindow):
             else:
                 existing_texts = {}
 
-            for mark in self.view.option_marks:
-                rect = mark.sceneBoundingRect()
-                img_x = rect.x() - off_x
-                img_y = rect.y() - off_y
-                left = max(0, int(img_x))
-                top = max(0, int(img_y))
-                right = min(img_pil.width, int(img_x + rect.width()))
-                bottom = min(img_pil.height, int(img_y + rect.height()))
-
-                if right > left and bottom > top:
-                    crop = img_pil.crop((left, top, right, bottom))
-                    crop_path = self._save_crop_image(crop, p_idx, f"Q{mark.question_num}", "option")
-                    text = self.detect_filled_option(crop, mark.options_count, save_debug=True,
-                        context={"page": p_idx + 1, "question": mark.question_num, "label": f"Q{mark.question_num}"})
-                else:
-                    text = "[Out of bounds]"
-                    crop_path = ""
-                page_res["options"][mark.question_num] = text
-                page_res["option_crops"][mark.question_num] = crop_path
-
-            for mark in self.view.text_marks:
-                rect = mark.sceneBoundingRect()
-                img_x = rect.x() - off_x
-                img_y = rect.y() - off_y
-                left = max(0, int(img_x))
-                top = max(0, int(img_y))
-                right = min(img_pil.width, int(img_x + rect.width()))
-                bottom = min(img_pil.height, int(img_y + rect.height()))
-                key = mark.label if mark.label else f"Field {mark.question_num}"
+            option_boxes, text_boxes = self._page_crop_boxes(box_cache, (option_arr, text_arr),
+                                                             off_x, off_y, img_w, img_h)
+            scored.append((page_res, scoring.submit(self._score_option_marks, p_idx, img_np,
+                                                    option_specs, option_boxes)))
 
+            for key, (left, top, right, bottom) in zip(text_keys, text_boxes):
                 if right > left and bottom > top:
-                    crop = img_pil.crop((left, top, right, bottom))
+                    crop = img_np[top:bottom, left:right]
                     crop_path = self._save_crop_image(crop, p_idx, key, "text")
-                    text = self.get_ocr_result(crop, save_debug=True)
+                    pending_text.append((p_idx, key, Image.fromarray(crop)))
+                    text = ""
                 else:
                     text = "[Out of bounds]"
                     crop_path = ""
@@ -3811,11 +5073,18 @@ class OMRSoftware(QMainWindow):
 
             self.results[p_idx] = page_res
             processed_count += 1
+            total_options += self._collect_scored_options(scored, workers)
+        pages.close()  # stop the page pipeline if cancelled early
+        total_options += self._collect_scored_options(scored, 0)
+        scoring.shutdown()
+
+        if pending_text:
+            progress.setLabelText("Recognizing text fields...")
+            self._ocr_pending_text(pending_text, progress)
 
         progress.setValue(len(pages_to_process))
         progress.close()
 
-        total_options = sum(len(self.results.get(p, {}).get("options", {})) for p in pages_to_process if p in self.results)
         QMessageBox.information(self, tr("msg_recognition_title"),
             tr("msg_recognition_complete", pages=processed_count, options=total_options))
 
@@ -3871,41 +5140,42 @@ class OMRSoftware(QMainWindow):
         # Options only (text/student fields are managed via the Student Info dialog)
         sorted_qs = sorted(opts.keys())
         total_score = 0
+        # Key answers normalized once per refresh rather than once per row
+        key_clean = {q: _normalize_answer(a) for q, a in self.answer_key.items()}
         
         for q_num in sorted_qs:
             detected = opts[q_num]
             correct = self.answer_key.get(q_num, "")
             
-            # Normalize for comparison
-            is_correct = False
-            if correct and detected:
-                # remove spaces, lowercase
-                d_clean = "".join(detected.split()).lower()
-                c_clean = "".join(str(correct).split()).lower()
-                if d_clean == c_clean: is_correct = True
+            # Normalize for comparison (remove spaces, lowercase)
+            is_correct = bool(correct and detected) and _normalize_answer(detected) == key_clean[q_num]
             
             points = 1 if is_correct else 0
             if is_correct: total_score += 1
             
-            self.table.setItem(current_row, 0, QTableWidgetItem(f"Q{q_num}"))
-            self.table.setItem(current_row, 1, QTableWidgetItem(str(detected)))
-            self.table.setItem(current_row, 2, QTableWidgetItem(str(correct)))
-            self.table.setItem(current_row, 3, QTableWidgetItem(str(points)))
-            crop_item = QTableWidgetItem("Open") if option_crops.get(q_num) else QTableWidgetItem("-")
+            # The question number rides along on the header item so
+            # on_table_edit does not have to parse it back out of "Q12"
+            self._set_table_cell(current_row, 0, f"Q{q_num}").setData(Qt.UserRole, q_num)
+            self._set_table_cell(current_row, 1, str(detected))
+            self._set_table_cell(current_row, 2, str(correct))
+            self._set_table_cell(current_row, 3, str(points))
+            crop_path = option_crops.get(q_num, "")
+            crop_item = self._set_table_cell(current_row, 4, "Open" if crop_path else "-")
             crop_item.setFlags(Qt.ItemIsEnabled)
             crop_item.setForeground(QColor("#007bff"))
-            crop_item.setData(Qt.UserRole, option_crops.get(q_num, ""))
-            self.table.setItem(current_row, 4, crop_item)
+            crop_item.setData(Qt.UserRole, crop_path)
             
             # Color code similar to Excel: empty, multiple, correct/incorrect
             detected_str = str(detected).strip()
             if detected_str == "":
-                self.table.item(current_row, 1).setBackground(QColor("#fff3cd"))
+                background = QBrush(QColor("#fff3cd"))
             elif len(detected_str) > 1:
-                self.table.item(current_row, 1).setBackground(QColor("#ffe5b4"))
+                background = QBrush(QColor("#ffe5b4"))
             elif correct:
-                color = QColor("#d4edda") if is_correct else QColor("#f8d7da")
-                self.table.item(current_row, 1).setBackground(color)
+                background = QBrush(QColor("#d4edda") if is_correct else QColor("#f8d7da"))
+            else:
+                background = QBrush()  # reused items may carry an old color
+            self.table.item(current_row, 1).setBackground(background)
             
             current_row += 1
         
@@ -3937,34 +5207,35 @@ class OMRSoftware(QMainWindow):
 
         self.table.blockSignals(False)
 
+    def _set_table_cell(self, row, col, text):
+        """Show text in a result-table cell and return its item.
+        Existing items are reused (and only touched when the text changes),
+        so refreshing the table does not reallocate every cell."""
+        item = self.table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(text)
+            self.table.setItem(row, col, item)
+        elif item.text() != text:
+            item.setText(text)
+        return item
+
     def on_table_edit(self, row, col):
+        if col not in (1, 2):
+            return
+        item_header = self.table.item(row, 0)
+        if not item_header:
+            return
+        # Set by update_result_table on every question row
+        q_num = item_header.data(Qt.UserRole)
+        if q_num is None:
+            return
+        new_val = self.table.item(row, col).text()
         if col == 1:
-            item_header = self.table.item(row, 0)
-            if not item_header:
-                return
-            header_text = item_header.text()
-            new_val = self.table.item(row, 1).text()
-            if header_text.startswith("Q"):
-                try:
-                    q_num = int(header_text.replace("Q", ""))
-                    if self.current_page in self.results:
-                        self.results[self.current_page]["options"][q_num] = new_val
-                except:
-                    pass
-            self.update_result_table()
-        elif col == 2: # Correct Answer column
-            item_header = self.table.item(row, 0)
-            if not item_header:
-                return
-            header_text = item_header.text()
-            if header_text.startswith("Q"):
-                try:
-                    q_num = int(header_text.replace("Q", ""))
-                    new_ans = self.table.item(row, 2).text()
-                    self.answer_key[q_num] = new_ans
-                    self.update_result_table()
-                except:
-                    pass
+            if self.current_page in self.results:
+                self.results[self.current_page]["options"][q_num] = new_val
+        else:  # Correct Answer column
+            self.answer_key[q_num] = new_val
+        self.update_result_table()
 
     def open_crop_from_table(self, row, col):
         if col != 4:
@@ -3973,7 +5244,7 @@ class OMRSoftware(QMainWindow):
         if not item:
             return
         path = item.data(Qt.UserRole)
-        if path and os.path.exists(path):
+        if path and self._materialize_crop(path):
             QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
     def open_crop_context_menu(self, pos):
@@ -3984,7 +5255,7 @@ class OMRSoftware(QMainWindow):
         if not item:
             return
         path = item.data(Qt.UserRole)
-        if not path or not os.path.exists(path):
+        if not path or not self._materialize_crop(path):
             return
 
         menu = QMenu(self)
@@ -4007,7 +5278,8 @@ class OMRSoftware(QMainWindow):
 
     def export_excel(self):
         """Export Excel to a user-chosen file."""
-        if not hasattr(self, 'results'):
+        if not getattr(self, 'results', None):
+            QMessageBox.warning(self, "Error", tr("msg_no_results"))
             return
         prefix = self._get_pdf_prefix()
         timestamp = self._get_timestamp()
@@ -4015,12 +5287,14 @@ class OMRSoftware(QMainWindow):
         fname, _ = QFileDialog.getSaveFileName(self, "Export Excel", default_name, "Excel (*.xlsx)")
         if not fname:
             return
-        self._export_excel_internal(fname)
+        if not self._export_excel_internal(fname):
+            QMessageBox.warning(self, "Error", tr("msg_no_results"))
+            return
         QMessageBox.information(self, "Done", tr("msg_export_done", folder=os.path.dirname(fname)))
 
     def export_results_bundle(self):
         """Export Excel (and optionally images) to a user-chosen folder."""
-        if not hasattr(self, 'results'):
+        if not getattr(self, 'results', None):
             QMessageBox.warning(self, "Error", tr("msg_no_results"))
             return
         if not hasattr(self, 'pdf_path') or not self.pdf_path:
@@ -4042,7 +5316,6 @@ class OMRSoftware(QMainWindow):
         include_images = self.check_export_images.isChecked()
         total_steps = 1 + (len(self.pdf_document) if include_images else 0)
 
-        from PyQt5.QtWidgets import QProgressDialog
         progress = QProgressDialog(tr("progress_exporting"), "Cancel", 0, total_steps, self)
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
@@ -4053,7 +5326,15 @@ class OMRSoftware(QMainWindow):
         progress.setLabelText(tr("progress_exporting_excel"))
         QtWidgets.QApplication.processEvents()
         excel_path = os.path.join(export_folder, f"{prefix}_{timestamp}.xlsx")
-        self._export_excel_internal(excel_path)
+        if not self._export_excel_internal(excel_path):
+            # Nothing recognized: don't export images or report success
+            progress.close()
+            try:
+                os.rmdir(export_folder)  # only removed while still empty
+            except OSError:
+                pass
+            QMessageBox.warning(self, "Error", tr("msg_no_results"))
+            return
         progress.setValue(1)
         if progress.wasCanceled():
             return
@@ -4067,6 +5348,264 @@ class OMRSoftware(QMainWindow):
         progress.close()
         QMessageBox.information(self, "Done", tr("msg_export_done", folder=export_folder))
     
+    def _iter_export_qimages(self, page_indices):
+        """Yield (page_idx, QImage) for each page, rendered at 2x scale for
+        image export; each QImage is private to the caller and free to paint on.
+
+        With deskew and align both disabled the QImage paints straight into
+        the pixmap's memory, with no copy. Otherwise pages come through the
+        recognition page pipeline, so the corrections of upcoming pages run on
+        worker threads while the caller draws the overlay of the current one;
+        rendering itself stays on this thread. Corrected arrays are wrapped
+        without a copy as well.
+        """
+        deskew = self.check_auto_deskew.isChecked()
+        align = self.check_auto_align.isChecked()
+        if not deskew and not align:
+            for page_idx in page_indices:
+                pix = self.pdf_document[page_idx].get_pixmap(matrix=RENDER_MATRIX)
+                # Wrap the (writable) pixmap memory without copying; Qt does
+                # not own the buffer, so the pixmap rides along on the QImage
+                # wrapper and lives as long as the image, including a save
+                # still queued on the export pool
+                qimg = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+                qimg._pix = pix
+                yield page_idx, qimg
+            return
+        
+        pages = self._iter_recognition_pages(page_indices, deskew, align, deskew_quality="smooth")
+        try:
+            for page_idx, img_np, skew_angle, aligned in pages:
+                if skew_angle != 0.0:
+                    log.debug("Export page %d: Corrected skew angle: %.2f°", page_idx + 1, skew_angle)
+                if aligned is not None:
+                    img_np, (dx, dy), response = aligned
+                    if dx != 0.0 or dy != 0.0:
+                        log.debug("Export page %d: Aligned shift dx=%.1f, dy=%.1f (score=%.3f)",
+                                  page_idx + 1, dx, dy, response)
+                h, w = img_np.shape[:2]
+                # Corrected pages are fresh arrays the overlay can paint into
+                # directly; an uncorrected page is still a read-only view of
+                # pix.samples and is the only case that needs a copy
+                if not (img_np.flags.writeable and img_np.flags.c_contiguous):
+                    img_np = np.array(img_np)
+                qimg = QImage(img_np.data, w, h, img_np.strides[0], QImage.Format_RGB888)
+                qimg._img_np = img_np  # keep the buffer alive, as with _pix above
+                yield page_idx, qimg
+        finally:
+            pages.close()  # stop the page pipeline if the caller stops early
+
+    def _get_overlay_sprites(self):
+        """Return (dot, cross) pixmaps for the answer overlay, rendered once.
+
+        Blitting these is much cheaper than rasterizing an antialiased
+        ellipse/cross path for every option cell on every page.
+        """
+        sprites = getattr(self, "_overlay_sprites", None)
+        if sprites is not None:
+            return sprites
+        
+        # Correct-answer dot: 16px red disc with a 2px red outline
+        dot = QPixmap(20, 20)
+        dot.fill(Qt.transparent)
+        p = QPainter(dot)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setBrush(QBrush(QColor(255, 0, 0)))
+        p.setPen(QPen(QColor(255, 0, 0), 2))
+        p.drawEllipse(2, 2, 16, 16)
+        p.end()
+        
+        # Wrong-answer cross: two 16px diagonals with a 3px red pen
+        cross = QPixmap(22, 22)
+        cross.fill(Qt.transparent)
+        p = QPainter(cross)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(QPen(QColor(255, 0, 0), 3))
+        p.drawLine(3, 3, 19, 19)
+        p.drawLine(19, 3, 3, 19)
+        p.end()
+        
+        self._overlay_sprites = (dot, cross)
+        return self._overlay_sprites
+
+    def _get_overlay_styles(self):
+        """Pens and fonts of the answer overlay, created once.
+
+        The painter of each exported page is fresh and ended after the
+        overlay, so state is simply set per section; there is nothing to
+        save() and restore().
+        """
+        styles = getattr(self, "_overlay_styles", None)
+        if styles is None:
+            styles = self._overlay_styles = {
+                "border": QPen(QColor(0, 100, 255), 2),
+                "blank_rect": QPen(QColor(255, 193, 7), 3),
+                "multi_rect": QPen(QColor(255, 140, 0), 3),
+                "marker_blank": QPen(QColor(255, 193, 7), 2),
+                "marker_multi": QPen(QColor(255, 140, 0), 2),
+                "marker_correct": QPen(QColor(40, 167, 69), 2),
+                "marker_wrong": QPen(QColor(220, 53, 69), 2),
+                "label": QPen(QColor(0, 0, 0), 1),
+                "score": QPen(QColor(0, 0, 0), 2),
+                "marker_font": QFont("Arial", 11, QFont.Bold),
+                "label_font": QFont("Arial", 10, QFont.Bold),
+                "score_font": QFont("Arial", 14, QFont.Bold),
+            }
+        return styles
+
+    def _option_mark_geometry(self):
+        """Snapshot option marks for _paint_answer_overlay as tuples of
+        (question_num, str key, scene x, scene y, width, height, cell width,
+        {lowercase option letter: cell index}, "Qn" label).
+
+        Marks and their options do not change during an export, so this is
+        built once and reused for every page instead of querying the scene
+        and rebuilding the per-question values on every page.
+        """
+        geom = []
+        for mark in self.view.option_marks:
+            rect = mark.sceneBoundingRect()
+            if not rect:
+                continue
+            q_num = mark.question_num
+            num_options = getattr(mark, "options_count", 4)
+            mw = int(rect.width())
+            option_index = {c: i for i, c in enumerate("abcdefghijklmnopqrstuvwxyz"[:num_options])}
+            geom.append((q_num, str(q_num), rect.x(), rect.y(), mw, int(rect.height()),
+                         mw // num_options, option_index, f"Q{q_num}"))
+        return geom
+
+    def _paint_answer_overlay(self, painter, opts, off_x, off_y, img_w, answer_key_norm, mark_geom):
+        """Draw answer marks and the page score onto an exported page image.
+
+        Geometry is collected for every option mark first and then drawn in
+        grouped passes, so the painter's pen/brush/font only change a handful
+        of times per page instead of several times per question.
+        answer_key_norm maps str question keys to _normalize_answer()'d key
+        answers and mark_geom comes from _option_mark_geometry(); both are
+        built once per export.
+        Returns (page_score, page_total).
+        """
+        page_score = 0
+        page_total = 0
+        
+        # Question keys may be int or str depending on where results came from
+        opts_norm = {str(k): _normalize_answer(v) for k, v in opts.items()}
+        
+        mark_rects = []
+        correct_circles = []
+        wrong_crosses = []
+        blank_rects = []
+        multi_rects = []
+        markers = {"blank": [], "multi": [], "correct": [], "wrong": []}
+        q_labels = []
+        
+        for q_num, q_key, rx, ry, mw, mh, cell_width, option_index, q_label in mark_geom:
+            x = int(rx - off_x)
+            y = int(ry - off_y)
+            mark_rects.append(QRectF(x, y, mw, mh))
+            
+            # Get student answer and correct answer, both already normalized
+            student_clean = opts_norm.get(q_key, "")
+            correct_clean = answer_key_norm.get(q_key, "")
+            is_blank = student_clean == ""
+            is_multi = len(student_clean) > 1
+            is_correct = bool(correct_clean) and student_clean == correct_clean
+            if correct_clean:
+                page_total += 1
+                if is_correct:
+                    page_score += 1
+            
+            if correct_clean:
+                log.debug("Q%s: correct=%s", q_num, correct_clean)
+            
+            # Cell centres of the options (A, B, C, D, ...) that get a mark
+            cell_center_y = y + mh // 2
+            
+            # Red dot for correct answer
+            i = option_index.get(correct_clean)
+            if i is not None:
+                correct_circles.append((x + i * cell_width + cell_width // 2, cell_center_y))
+            
+            # X mark for student's wrong answer
+            i = option_index.get(student_clean)
+            if i is not None and correct_clean and student_clean != correct_clean:
+                wrong_crosses.append((x + i * cell_width + cell_width // 2, cell_center_y))
+            
+            # Highlight blank vs multi-selection, plus a correctness marker on the right
+            marker_pos = (x + mw + 8, y + mh // 2 + 5)
+            if is_blank:
+                blank_rects.append(QRectF(x, y, mw, mh))
+                markers["blank"].append(marker_pos)
+            elif is_multi:
+                multi_rects.append(QRectF(x, y, mw, mh))
+                markers["multi"].append(marker_pos)
+            else:
+                markers["correct" if is_correct else "wrong"].append(marker_pos)
+            
+            q_labels.append((x - 30, y + mh // 2 + 5, q_label))
+        
+        styles = self._get_overlay_styles()
+        
+        # Mark borders
+        painter.setPen(styles["border"])
+        if mark_rects:
+            painter.drawRects(mark_rects)
+        
+        # Correct-answer dots and wrong-answer crosses, blitted from sprites
+        if correct_circles or wrong_crosses:
+            dot_pm, cross_pm = self._get_overlay_sprites()
+            for cx, cy in correct_circles:
+                painter.drawPixmap(cx - 10, cy - 10, dot_pm)
+            for cx, cy in wrong_crosses:
+                painter.drawPixmap(cx - 11, cy - 11, cross_pm)
+        
+        # Blank / multi-selection highlights
+        if blank_rects:
+            painter.setPen(styles["blank_rect"])
+            painter.drawRects(blank_rects)
+        if multi_rects:
+            painter.setPen(styles["multi_rect"])
+            painter.drawRects(multi_rects)
+        
+        # Per-question correctness markers
+        painter.setFont(styles["marker_font"])
+        for kind, symbol in (("blank", "Ø"), ("multi", "!"), ("correct", "✓"), ("wrong", "✗")):
+            if markers[kind]:
+                painter.setPen(styles["marker_" + kind])
+                for mx, my in markers[kind]:
+                    painter.drawText(mx, my, symbol)
+        
+        # Question numbers
+        painter.setPen(styles["label"])
+        painter.setFont(styles["label_font"])
+        for lx, ly, text in q_labels:
+            painter.drawText(lx, ly, text)
+        
+        # Score at top-right (inside page bounds)
+        painter.setFont(styles["score_font"])
+        painter.setPen(styles["score"])
+        score_text = f"Score: {page_score}/{page_total}"
+        metrics = painter.fontMetrics()
+        text_width = metrics.horizontalAdvance(score_text)
+        x_pos = max(10, img_w - text_width - 10)
+        painter.drawText(x_pos, 30, score_text)
+        
+        return page_score, page_total
+
+    @staticmethod
+    def _queue_image_save(pool, pending, qimg, path, max_pending):
+        """Save a finished export page on a pool thread.
+
+        PNG encoding is a large share of the per-page export time and
+        QImage.save is safe off the GUI thread, so it overlaps with
+        rendering the next page. pending is a deque of save futures; at
+        most max_pending pages wait to be written, which bounds memory.
+        """
+        pending.append(pool.submit(qimg.save, path, "PNG", EXPORT_PNG_QUALITY))
+        while len(pending) > max_pending:
+            pending.popleft().result()
+
     def export_images(self):
         """Export scanned pages as images with answer overlay (red dots for correct answers)"""
         if not hasattr(self, 'pdf_document') or self.pdf_document is None:
@@ -4092,45 +5631,38 @@ class OMRSoftware(QMainWindow):
         # Reset alignment template for export
         self._reset_align_templates()
         
-        from PyQt5.QtWidgets import QProgressDialog
         progress = QProgressDialog("Exporting images...", "Cancel", 0, len(self.pdf_document), self)
         progress.setWindowModality(Qt.WindowModal)
         progress.show()
         
-        for page_idx in range(len(self.pdf_document)):
-            if progress.wasCanceled(): break
-            progress.setValue(page_idx)
-            QtWidgets.QApplication.processEvents()
-
-            # Skip absent pages
-            is_absent = self.student_absence.get(page_idx, False) if hasattr(self, 'student_absence') else False
-            if is_absent:
-                continue
-            
-            # Render page at 2x scale
-            page = self.pdf_document[page_idx]
-            mat = fitz.Matrix(2, 2)
-            pix = page.get_pixmap(matrix=mat)
-
-            # Convert to numpy array for processing
-            img_pil = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            img_np = np.array(img_pil)
-
-            # Apply auto-deskew if enabled
-            if self.check_auto_deskew.isChecked():
-                img_np, skew_angle = deskew_image(img_np)
-                if skew_angle != 0.0:
-                    print(f"Export page {page_idx + 1}: Corrected skew angle: {skew_angle:.2f}°")
-
-            # Apply auto-align (shift) if enabled
-            if self.check_auto_align.isChecked():
-                img_np, (dx, dy), response = self.align_image(img_np, page_idx)
-                if dx != 0.0 or dy != 0.0:
-                    print(f"Export page {page_idx + 1}: Aligned shift dx={dx:.1f}, dy={dy:.1f} (score={response:.3f})")
-
-            # Convert to QImage for drawing
-            img_h, img_w = img_np.shape[:2]
-            qimg = QImage(img_np.data, img_w, img_h, img_np.strides[0], QImage.Format_RGB888).copy()
+        # Answer key does not change between pages; normalize its keys once
+        answer_key_norm = {str(k): _normalize_answer(v) for k, v in self.answer_key.items()}
+        mark_geom = self._option_mark_geometry()
+        
+        # Rendering and painting stay on this thread (PyMuPDF is not
+        # thread-safe); page corrections run ahead on the page pipeline and
+        # PNG encoding runs on a small pool
+        workers = max(1, min(4, os.cpu_count() or 1))
+        saver = ThreadPoolExecutor(max_workers=workers)
+        saves = deque()
+        
+        # Skip absent pages
+        absence = getattr(self, 'student_absence', {})
+        page_indices = [i for i in range(len(self.pdf_document)) if not absence.get(i, False)]
+        
+        # Pages arrive rendered at 2x scale (with deskew/align if enabled)
+        pages = self._iter_export_qimages(page_indices)
+        last_pump = 0.0
+        for page_idx, qimg in pages:
+            # Throttle progress updates; setValue on the modal dialog also
+            # processes pending events, so no separate processEvents() call
+            now = time.monotonic()
+            if now - last_pump >= PROGRESS_PUMP_INTERVAL:
+                last_pump = now
+                progress.setValue(page_idx)
+                if progress.wasCanceled(): break
+            
+            img_w = qimg.width()
             
             # Create painter to draw overlay
             painter = QPainter(qimg)
@@ -4143,126 +5675,22 @@ class OMRSoftware(QMainWindow):
             # Offset for this page (if the PDF was moved in the scene)
             off_x, off_y = self.page_offsets.get(page_idx, (0, 0))
             
-            # Draw marks and answers
-            page_score = 0
-            page_total = 0
-            for mark in self.view.option_marks:
-                rect = mark.sceneBoundingRect()
-                q_num = mark.question_num
-                
-                if rect:
-                    x = int(rect.x() - off_x)
-                    y = int(rect.y() - off_y)
-                    mw = int(rect.width())
-                    mh = int(rect.height())
-                    
-                    # Draw rectangle border
-                    painter.setPen(QPen(QColor(0, 100, 255), 2))
-                    painter.drawRect(x, y, mw, mh)
-                    
-                    # Get student answer and correct answer
-                    # Ensure q_num is int for consistent key lookup
-                    q_num_int = int(q_num) if isinstance(q_num, (int, str)) and str(q_num).isdigit() else q_num
-                    student_answer = opts.get(q_num_int, "") or opts.get(q_num, "") or opts.get(str(q_num), "")
-                    correct_answer = self.answer_key.get(q_num_int, "") or self.answer_key.get(q_num, "") or self.answer_key.get(str(q_num), "")
-                    
-                    student_clean = "".join(str(student_answer).split()).upper()
-                    correct_clean = "".join(str(correct_answer).split()).upper()
-                    is_blank = student_clean == ""
-                    is_multi = len(student_clean) > 1
-                    is_correct = bool(correct_clean) and student_clean == correct_clean
-                    if correct_clean:
-                        page_total += 1
-                        if is_correct:
-                            page_score += 1
-                    
-                    # Debug print
-                    if correct_answer:
-                        print(f"Q{q_num}: correct={correct_answer}")
-                    
-                    # Calculate cell positions for A, B, C, D
-                    num_options = getattr(mark, "options_count", 4)
-                    cell_width = mw // num_options
-                    option_labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:num_options]
-                    
-                    for i, opt_label in enumerate(option_labels):
-                        cell_x = x + i * cell_width
-                        cell_center_x = cell_x + cell_width // 2
-                        cell_center_y = y + mh // 2
-                        
-                        # Draw red dot for correct answer
-                        if correct_answer and opt_label.upper() == correct_answer.upper():
-                            # Must set both brush and pen before each ellipse
-                            painter.save()
-                            painter.setBrush(QBrush(QColor(255, 0, 0)))
-                            painter.setPen(QPen(QColor(255, 0, 0), 2))
-                            painter.drawEllipse(cell_center_x - 8, cell_center_y - 8, 16, 16)
-                            painter.restore()
-                        
-                        # Draw X mark for student's wrong answer
-                        if student_answer and opt_label.upper() == student_answer.upper():
-                            if correct_answer and student_answer.upper() != correct_answer.upper():
-                                # Wrong answer - draw X mark
-                                painter.save()
-                                painter.setPen(QPen(QColor(255, 0, 0), 3))
-                                painter.drawLine(cell_center_x - 8, cell_center_y - 8, cell_center_x + 8, cell_center_y + 8)
-                                painter.drawLine(cell_center_x + 8, cell_center_y - 8, cell_center_x - 8, cell_center_y + 8)
-                                painter.restore()
-                    
-                    # Highlight blank vs multi-selection
-                    if is_blank:
-                        painter.save()
-                        painter.setPen(QPen(QColor(255, 193, 7), 3))
-                        painter.drawRect(x, y, mw, mh)
-                        painter.restore()
-                    elif is_multi:
-                        painter.save()
-                        painter.setPen(QPen(QColor(255, 140, 0), 3))
-                        painter.drawRect(x, y, mw, mh)
-                        painter.restore()
-                    
-                    # Draw per-question correctness marker on the right
-                    marker_x = x + mw + 8
-                    marker_y = y + mh // 2 + 5
-                    painter.save()
-                    painter.setFont(QFont("Arial", 11, QFont.Bold))
-                    if is_blank:
-                        painter.setPen(QPen(QColor(255, 193, 7), 2))
-                        painter.drawText(marker_x, marker_y, "Ø")
-                    elif is_multi:
-                        painter.setPen(QPen(QColor(255, 140, 0), 2))
-                        painter.drawText(marker_x, marker_y, "!")
-                    else:
-                        painter.setPen(QPen(QColor(40, 167, 69), 2) if is_correct else QPen(QColor(220, 53, 69), 2))
-                        painter.drawText(marker_x, marker_y, "✓" if is_correct else "✗")
-                    painter.restore()
-                    
-                    # Draw question number
-                    painter.setPen(QPen(QColor(0, 0, 0), 1))
-                    painter.setFont(QFont("Arial", 10, QFont.Bold))
-                    painter.drawText(x - 30, y + mh // 2 + 5, f"Q{q_num}")
-            
-            # Draw score at top-right (inside page bounds)
-            painter.save()
-            painter.setFont(QFont("Arial", 14, QFont.Bold))
-            painter.setPen(QPen(QColor(0, 0, 0), 2))
-            score_text = f"Score: {page_score}/{page_total}"
-            metrics = painter.fontMetrics()
-            text_width = metrics.horizontalAdvance(score_text)
-            x_pos = max(10, img_w - text_width - 10)
-            painter.drawText(x_pos, 30, score_text)
-            painter.restore()
+            # Draw marks, answers and the page score
+            self._paint_answer_overlay(painter, opts, off_x, off_y, img_w, answer_key_norm, mark_geom)
             painter.end()
             
             # Save image
             output_path = os.path.join(folder, f"page_{page_idx + 1:03d}.png")
-            qimg.save(output_path)
+            self._queue_image_save(saver, saves, qimg, output_path, workers)
+        pages.close()
+        saver.shutdown()  # waits for the remaining saves
         
         progress.setValue(len(self.pdf_document))
         QMessageBox.information(self, "Done", f"Exported {len(self.pdf_document)} images to:\n{folder}")
 
     def export_debug_pack(self):
         """Export debug images and scoring records into a folder for easy sharing."""
+        self._flush_crop_store()
         has_records = bool(getattr(self, "debug_records", []))
         debug_dir = "debug_crops"
         has_debug_images = os.path.isdir(debug_dir) and any(os.scandir(debug_dir))
@@ -4291,7 +5719,7 @@ class OMRSoftware(QMainWindow):
 
             if hasattr(self, "pdf_path") and self.pdf_path and os.path.isfile(self.pdf_path):
                 try:
-                    shutil.copy2(self.pdf_path, os.path.join(out_folder, os.path.basename(self.pdf_path)))
+                    _fast_copy(self.pdf_path, os.path.join(out_folder, os.path.basename(self.pdf_path)))
                 except Exception:
                     pass
 
@@ -4305,12 +5733,26 @@ class OMRSoftware(QMainWindow):
                 progress.setMinimumDuration(0)
                 progress.show()
 
-                for idx, entry in enumerate(files):
-                    if progress.wasCanceled():
-                        break
-                    progress.setValue(idx)
-                    QtWidgets.QApplication.processEvents()
-                    shutil.copy2(entry.path, os.path.join(out_debug_dir, entry.name))
+                # Copying is pure I/O (the GIL is released), so several files
+                # are copied at once to overlap their syscalls
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    futures = [pool.submit(_fast_copy, entry.path, os.path.join(out_debug_dir, entry.name))
+                               for entry in files]
+                    last_pump = 0.0
+                    try:
+                        for idx, fut in enumerate(as_completed(futures)):
+                            fut.result()
+                            now = time.monotonic()
+                            if now - last_pump >= PROGRESS_PUMP_INTERVAL:
+                                last_pump = now
+                                progress.setValue(idx)  # modal: also processes events
+                            if progress.wasCanceled():
+                                break
+                    finally:
+                        # On cancel or a failed copy, drop the copies that have
+                        # not started so leaving the pool doesn't wait for them
+                        for f in futures:
+                            f.cancel()
 
                 progress.setValue(len(files))
 
@@ -4352,8 +5794,7 @@ class OMRSoftware(QMainWindow):
         
         # Load template once
         try:
-            with open(template_file, 'r') as f:
-                template_data = json.load(f)
+            template_data = _load_json_file(template_file)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load template:\n{e}")
             return
@@ -4421,6 +5862,15 @@ class OMRSoftware(QMainWindow):
         success_count = 0
         error_files = []
         
+        # Every file uses the same marks, so they are created once; nothing
+        # in the per-file steps changes them
+        try:
+            self._load_template_data(template_data)
+        except Exception as e:
+            progress.close()
+            QMessageBox.warning(self, "Error", f"Failed to load template {template_name}:\n{e}")
+            return
+        
         for idx, pdf_path in enumerate(pdf_files):
             QtWidgets.QApplication.processEvents()
             if progress.wasCanceled():
@@ -4430,45 +5880,16 @@ class OMRSoftware(QMainWindow):
             progress.setLabelText(f"Processing: {os.path.basename(pdf_path)}")
             
             try:
-                # Load template
-                self._load_template_data(template_data)
-                
-                # Load PDF
-                self.pdf_path = pdf_path
-                self.pdf_document = fitz.open(pdf_path)
-                self.current_page = 0
-                self.align_reference_gray = None
-                self.load_page(0)
-                
-                # Reset alignment template for new PDF
-                self._reset_align_templates()
-                
-                # Run recognition
-                self._run_recognition_internal()
-
-                # Use first page as answer key for this PDF (per-file)
-                if self.first_page_key and 0 in self.results:
-                    self.answer_key = self.results[0]["options"]
-                
-                # Export results to same folder as PDF
-                output_folder = os.path.dirname(pdf_path)
-                pdf_basename = os.path.splitext(os.path.basename(pdf_path))[0]
-                timestamp = self._get_timestamp()
-                
-                # Export Excel
-                excel_path = os.path.join(output_folder, f"{pdf_basename}_{timestamp}.xlsx")
-                self._export_excel_internal(excel_path)
-                
-                # Export Images
-                img_folder = os.path.join(output_folder, f"{pdf_basename}_{timestamp}")
-                self._export_images_internal(img_folder)
-                
+                self._process_batch_pdf(pdf_path)
                 success_count += 1
                 print(f"✓ Processed: {os.path.basename(pdf_path)}")
                 
             except Exception as e:
                 error_files.append((pdf_path, str(e)))
                 print(f"✗ Error processing {os.path.basename(pdf_path)}: {e}")
+            
+            # Keep MuPDF's resource store from growing across files
+            fitz.TOOLS.store_shrink(100)
         
         progress.setValue(len(pdf_files))
         
@@ -4505,46 +5926,19 @@ class OMRSoftware(QMainWindow):
             
             try:
                 # Load template for this PDF
-                with open(template_path, 'r') as f:
-                    template_data = json.load(f)
+                template_data = _load_json_file(template_path)
                 self._load_template_data(template_data)
                 
-                # Load PDF
-                self.pdf_path = pdf_path
-                self.pdf_document = fitz.open(pdf_path)
-                self.current_page = 0
-                self.align_reference_gray = None
-                self.load_page(0)
-                
-                # Reset alignment template for new PDF
-                self._reset_align_templates()
-                
-                # Run recognition
-                self._run_recognition_internal()
-
-                # Use first page as answer key for this PDF (per-file)
-                if self.first_page_key and 0 in self.results:
-                    self.answer_key = self.results[0]["options"]
-                
-                # Export results to same folder as PDF
-                output_folder = os.path.dirname(pdf_path)
-                pdf_basename = os.path.splitext(os.path.basename(pdf_path))[0]
-                timestamp = self._get_timestamp()
-                
-                # Export Excel
-                excel_path = os.path.join(output_folder, f"{pdf_basename}_{timestamp}.xlsx")
-                self._export_excel_internal(excel_path)
-                
-                # Export Images
-                img_folder = os.path.join(output_folder, f"{pdf_basename}_{timestamp}")
-                self._export_images_internal(img_folder)
-                
+                self._process_batch_pdf(pdf_path)
                 success_count += 1
                 print(f"✓ Processed: {os.path.basename(pdf_path)}")
                 
             except Exception as e:
                 error_files.append((pdf_path, str(e)))
                 print(f"✗ Error processing {os.path.basename(pdf_path)}: {e}")
+            
+            # Keep MuPDF's resource store from growing across files
+            fitz.TOOLS.store_shrink(100)
         
         progress.setValue(len(matched_pairs))
         
@@ -4559,6 +5953,41 @@ class OMRSoftware(QMainWindow):
         
         QMessageBox.information(self, "Batch Complete", msg)
     
+    def _process_batch_pdf(self, pdf_path):
+        """Open one PDF of a batch, recognize it with the loaded template and
+        export Excel and page images next to it."""
+        self.pdf_path = pdf_path
+        self.pdf_document = fitz.open(pdf_path)
+        self.skew_angles = {}
+        self.current_page = 0
+        self.align_reference_gray = None
+        # Shown for feedback only; neighbours are not prefetched, since
+        # recognition renders every page itself right after this
+        self.load_page(0, prefetch=False)
+        
+        # Reset alignment template for new PDF
+        self._reset_align_templates()
+        
+        # Run recognition
+        self._run_recognition_internal()
+
+        # Use first page as answer key for this PDF (per-file)
+        if self.first_page_key and 0 in self.results:
+            self.answer_key = self.results[0]["options"]
+        
+        # Export results to same folder as PDF
+        output_folder = os.path.dirname(pdf_path)
+        pdf_basename = os.path.splitext(os.path.basename(pdf_path))[0]
+        timestamp = self._get_timestamp()
+        
+        # Export Excel
+        excel_path = os.path.join(output_folder, f"{pdf_basename}_{timestamp}.xlsx")
+        self._export_excel_internal(excel_path)
+        
+        # Export Images
+        img_folder = os.path.join(output_folder, f"{pdf_basename}_{timestamp}")
+        self._export_images_internal(img_folder)
+
     def _load_template_data(self, data):
         """Internal method to load template data without file dialog."""
         self.clear_all_marks()
@@ -4597,7 +6026,7 @@ class OMRSoftware(QMainWindow):
         if not self.pdf_document or (not self.view.option_marks and not self.view.text_marks):
             return
         
-        self.results = {}
+        self.results = _ResultsDict()
         self.debug_records = []
         
         # Save current page's image offset before processing
@@ -4607,129 +6036,188 @@ class OMRSoftware(QMainWindow):
         # Reset alignment template for new recognition run
         self._reset_align_templates()
         
+        # Mark geometry and attributes are fixed for the whole run; snapshot
+        # them once instead of querying the mark items on every page
+        option_arr = self.view.get_marks_array(self.view.option_marks)
+        option_specs = self._option_mark_specs(self.view.option_marks)
+        text_arr = self.view.get_marks_array(self.view.text_marks)
+        text_keys = [m.label or f"Field_{m.question_num}" for m in self.view.text_marks]
+        box_cache = {}  # crop boxes per (offset, image size), see _page_crop_boxes
+        
+        deskew = self.check_auto_deskew.isChecked()
+        align = self.check_auto_align.isChecked()
+        # Without deskew/align nothing outside the marks is ever read, so
+        # only the marks' bounding box is rendered; corrections need the
+        # whole page. Rotated pages are rendered whole as well, since their
+        # clip coordinates would not match the displayed page
+        crop_to_marks = not deskew and not align
+        
+        last_pump = 0.0
         for p_idx in range(len(self.pdf_document)):
-            QtWidgets.QApplication.processEvents()
+            # Keep the batch window responsive without pumping on every page
+            now = time.monotonic()
+            if now - last_pump >= PROGRESS_PUMP_INTERVAL:
+                last_pump = now
+                QtWidgets.QApplication.processEvents()
             
             page = self.pdf_document[p_idx]
-            mat = fitz.Matrix(2, 2)
-            pix = page.get_pixmap(matrix=mat)
+            off_x, off_y = self.page_offsets.get(p_idx, (0, 0))
+            clip = None
+            if crop_to_marks and page.rotation == 0:
+                full = (page.rect * RENDER_MATRIX).irect
+                clip = self._boxes_bbox(self._page_crop_boxes(
+                    box_cache, (option_arr, text_arr), off_x, off_y, full.width, full.height))
+            if clip is not None:
+                # Clip is in page units, so map the pixel box back through
+                # the render matrix; whole-pixel bounds keep the render on
+                # the full page's pixel grid
+                x0, y0, x1, y1 = clip
+                pix = page.get_pixmap(matrix=RENDER_MATRIX, clip=fitz.Rect(clip) * ~RENDER_MATRIX)
+                # Crop boxes below are relative to the rendered area
+                off_x += x0
+                off_y += y0
+            else:
+                pix = page.get_pixmap(matrix=RENDER_MATRIX)
 
-            img_pil = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            img_np = np.array(img_pil)
+            # Zero-copy view; pix stays alive for the whole iteration
+            img_np = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, 3)
 
             # Apply auto-deskew if enabled
-            if self.check_auto_deskew.isChecked():
-                img_np, skew = deskew_image(img_np)
+            if deskew:
+                img_np, skew = deskew_image(img_np, skew_angle=self._page_skew_angle(img_np, p_idx))
 
             # Apply auto-align (shift) if enabled
-            if self.check_auto_align.isChecked():
+            if align:
                 img_np, (dx, dy), response = self.align_image(img_np, p_idx)
 
             h, w = img_np.shape[:2]
-            off_x, off_y = self.page_offsets.get(p_idx, (0, 0))
 
             page_result = {"text": {}, "options": {}}
 
             # Process text marks
-            for mark in self.view.text_marks:
-                rect = mark.sceneBoundingRect()
-                x1 = max(0, int(rect.x() - off_x))
-                y1 = max(0, int(rect.y() - off_y))
-                x2 = min(w, int(rect.x() + rect.width() - off_x))
-                y2 = min(h, int(rect.y() + rect.height() - off_y))
-                
+            option_boxes, text_boxes = self._page_crop_boxes(box_cache, (option_arr, text_arr),
+                                                             off_x, off_y, w, h)
+            for key, (x1, y1, x2, y2) in zip(text_keys, text_boxes):
                 if x2 > x1 and y2 > y1:
-                    crop = img_np[y1:y2, x1:x2]
-                    crop_pil = Image.fromarray(crop)
-                    text = self.recognize_text(crop_pil)
-                    page_result["text"][mark.label or f"Field_{mark.question_num}"] = text
+                    # get_ocr_result takes the NumPy crop directly
+                    page_result["text"][key] = self.get_ocr_result(img_np[y1:y2, x1:x2])
 
             # Process option marks
-            for mark in self.view.option_marks:
-                rect = mark.sceneBoundingRect()
-                x1 = max(0, int(rect.x() - off_x))
-                y1 = max(0, int(rect.y() - off_y))
-                x2 = min(w, int(rect.x() + rect.width() - off_x))
-                y2 = min(h, int(rect.y() + rect.height() - off_y))
-                
+            for (q_num, options_count, label), (x1, y1, x2, y2) in zip(option_specs, option_boxes):
                 if x2 > x1 and y2 > y1:
                     crop = img_np[y1:y2, x1:x2]
-                    crop_pil = Image.fromarray(crop)
-                    opt = mark.options_count
                     result_opt = self.detect_filled_option(
-                        crop_pil,
-                        opt,
+                        crop,
+                        options_count,
                         context={
                             "page": p_idx + 1,
-                            "question": mark.question_num,
-                            "label": f"Q{mark.question_num}"
+                            "question": q_num,
+                            "label": label
                         }
                     )
-                    page_result["options"][mark.question_num] = result_opt
+                    page_result["options"][q_num] = result_opt
 
             self.results[p_idx] = page_result
     
+    @staticmethod
+    def _grade_answer_matrix(answer_rows, key_values):
+        """Grade answer rows against the key as boolean matrices.
+
+        answer_rows is a list of per-row answer lists aligned with key_values.
+        Returns (blank, multi, correct, key_set): blank/multi/correct have one
+        row per answer row and one column per question; key_set marks the
+        questions that have a key answer. Answers and key are compared with
+        whitespace removed and case folded.
+        """
+        n_q = len(key_values)
+        answers = np.array([["" if v is None else str(v) for v in vals] for vals in answer_rows],
+                           dtype=str).reshape(len(answer_rows), n_q)
+        key = np.array([str(k) for k in key_values], dtype=str).reshape(n_q)
+
+        def normalize(arr):
+            # Same rules as _normalize_answer
+            return np.char.lower(np.char.translate(arr, _WS_TABLE))
+
+        blank = answers == ""
+        multi = ~blank & (np.char.str_len(answers) > 1)
+        key_set = key != ""
+        correct = (normalize(answers) == normalize(key)[None, :]) & key_set[None, :]
+        return blank, multi, correct, key_set
+
     def _export_excel_internal(self, output_path):
-        """Internal method to export Excel without file dialog."""
-        if not hasattr(self, 'results'):
-            return
+        """Internal method to export Excel without file dialog.
+
+        Returns False, without creating a workbook or file, when there are no
+        results or no question/text columns to write.
+        """
+        if not getattr(self, 'results', None):
+            print(f"  Excel skipped (no results): {output_path}")
+            return False
+
+        # Text keys also come from extra students (absent students without PDF pages)
+        extra_students = getattr(self, 'extra_students', [])
+        page_results = self.results.values()
+        sorted_qs = sorted(set().union(*(p_res.get("options", {}) for p_res in page_results)))
+        sorted_texts = sorted(set().union(*(p_res.get("text", {}) for p_res in page_results),
+                                          *(extra.get("text", {}) for extra in extra_students)))
+        if not sorted_qs and not sorted_texts:
+            print(f"  Excel skipped (no marks recognized): {output_path}")
+            return False
 
         include_summary = self.check_include_summary.isChecked() if hasattr(self, "check_include_summary") else True
         include_topics = self.check_include_topics.isChecked() if hasattr(self, "check_include_topics") else True
         
-        from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-        from openpyxl.utils import get_column_letter
-        
-        yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-        orange_fill = PatternFill(start_color="FFA500", end_color="FFA500", fill_type="solid")
-        green_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
-        header_font = Font(bold=True)
-        center_align = Alignment(horizontal='center')
-        
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "OMR Results"
-        
-        all_qs = set()
-        all_texts = set()
-        
-        for p_res in self.results.values():
-            all_qs.update(p_res.get("options", {}).keys())
-            all_texts.update(p_res.get("text", {}).keys())
-
-        # Also collect text keys from extra students (absent students without PDF pages)
-        extra_students = getattr(self, 'extra_students', [])
-        for extra in extra_students:
-            all_texts.update(extra.get("text", {}).keys())
-            
-        sorted_qs = sorted(list(all_qs))
-        sorted_texts = sorted(list(all_texts))
+        # Write-only workbook: rows are streamed out as they are appended, so
+        # styled cells are built up front as WriteOnlyCells instead of being
+        # looked up and restyled afterwards
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("OMR Results")
+        blank_style, multi_style, stats_style = _add_xl_named_styles(wb)
+
+        def styled(sheet, value, font=None, fill=None, alignment=None, number_format=None, style=None):
+            cell = WriteOnlyCell(sheet, value=value)
+            if style is not None:
+                cell.style = style
+            if font is not None:
+                cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            if alignment is not None:
+                cell.alignment = alignment
+            if number_format is not None:
+                cell.number_format = number_format
+            return cell
         
         text_start_col = 2
         absent_col_num = text_start_col + len(sorted_texts)
         q_start_col = absent_col_num + 1
-        score_col = q_start_col + len(sorted_qs)
         
         absent_label = tr("dlg_student_absent")
         headers = ["Page"] + sorted_texts + [absent_label] + [f"Q{q}" for q in sorted_qs] + ["Score"]
-        ws.append(headers)
-        
-        key_row = ["Key"] + [""] * len(sorted_texts) + [""]
-        for q in sorted_qs:
-            key_row.append(self.answer_key.get(q, ""))
-        key_row.append("")
-        ws.append(key_row)
-        
-        data_row_num = 3
-        first_data_row = 3
-        empty_cells = []
-        multiple_cells = []
-        page_scores = []
-        page_totals = []
-        page_blank_counts = []
-        page_multi_counts = []
+        ws.append([styled(ws, h, font=XL_HEADER_FONT, alignment=XL_CENTER_ALIGN) for h in headers])
+        
+        # Key answers in column order, shared by the key row and grading
+        key_values = [self.answer_key.get(q, "") for q in sorted_qs]
+        ws.append(["Key"] + [""] * len(sorted_texts) + [""] + key_values + [""])
+        
+        # Data rows are collected first and appended once scores and the
+        # blank/multi highlighting are known. Graded (non-absent) rows are
+        # also recorded as (index into data_rows, answers in sorted_qs order)
+        # so blank/multi/correct are worked out for all of them at once
+        data_rows = []
+        graded_row_idx = []
+        graded_answers = []
         
         student_order = getattr(self, 'student_order', [])
+        student_absence = getattr(self, 'student_absence', {})
+        skip_key_page = self.first_page_key
+
+        # Student pages (answer-key page excluded) in page order, built once
+        graded_pages = sorted(
+            ((p_idx, res) for p_idx, res in self.results.items()
+             if not (skip_key_page and p_idx == 0)),
+            key=lambda item: item[0]
+        )
 
         if student_order:
             # ── Use student_order to preserve user's original input order ──
@@ -4738,7 +6226,7 @@ class OMRSoftware(QMainWindow):
                 is_absent = entry.get("absent", False)
 
                 # Skip answer-key page if applicable
-                if p_idx is not None and self.first_page_key and p_idx == 0:
+                if skip_key_page and p_idx == 0:
                     continue
 
                 row = [p_idx + 1 if p_idx is not None else "-"]
@@ -4756,93 +6244,35 @@ class OMRSoftware(QMainWindow):
                 else:
                     opts = {}
 
-                page_blank = 0
-                page_multi = 0
-                page_score = 0
-                page_total = 0
-                for q_idx, q in enumerate(sorted_qs):
-                    val = opts.get(q, "") if not is_absent else ""
-                    row.append(val)
-                    if not is_absent and p_idx is not None:
-                        col_letter = get_column_letter(q_start_col + q_idx)
-                        if val == "" or val is None:
-                            empty_cells.append(f"{col_letter}{data_row_num}")
-                            page_blank += 1
-                        elif len(str(val)) > 1:
-                            multiple_cells.append(f"{col_letter}{data_row_num}")
-                            page_multi += 1
-                        correct_val = self.answer_key.get(q, "")
-                        if correct_val != "":
-                            page_total += 1
-                            if "".join(str(val).split()).lower() == "".join(str(correct_val).split()).lower():
-                                page_score += 1
-
-                if sorted_qs and not is_absent and p_idx is not None:
-                    first_q_col = get_column_letter(q_start_col)
-                    last_q_col = get_column_letter(q_start_col + len(sorted_qs) - 1)
-                    score_formula = f'=SUMPRODUCT(({first_q_col}{data_row_num}:{last_q_col}{data_row_num}={first_q_col}$2:{last_q_col}$2)*1)'
-                    row.append(score_formula)
-                else:
-                    row.append("")
+                answers = [opts.get(q, "") for q in sorted_qs]
+                row.extend(answers)
+                # Score column; graded rows get their score after grading
+                row.append("")
 
-                ws.append(row)
                 if not is_absent and p_idx is not None:
-                    page_scores.append(page_score)
-                    page_totals.append(page_total)
-                    page_blank_counts.append(page_blank)
-                    page_multi_counts.append(page_multi)
-                data_row_num += 1
+                    graded_row_idx.append(len(data_rows))
+                    graded_answers.append(answers)
+                data_rows.append(row)
         else:
             # ── Fallback: iterate results by page index, then extra_students ──
-            for p_idx, res in self.results.items():
-                if self.first_page_key and p_idx == 0:
-                    continue
-
+            for p_idx, res in graded_pages:
                 row = [p_idx + 1]
                 texts = res.get("text", {})
                 for t_key in sorted_texts:
                     row.append(texts.get(t_key, ""))
 
-                is_absent = self.student_absence.get(p_idx, False) if hasattr(self, 'student_absence') else False
+                is_absent = student_absence.get(p_idx, False)
                 row.append("✓" if is_absent else "")
 
-                opts = res.get("options", {})
-                page_blank = 0
-                page_multi = 0
-                page_score = 0
-                page_total = 0
-                for q_idx, q in enumerate(sorted_qs):
-                    val = opts.get(q, "") if not is_absent else ""
-                    row.append(val)
-                    if not is_absent:
-                        col_letter = get_column_letter(q_start_col + q_idx)
-                        if val == "" or val is None:
-                            empty_cells.append(f"{col_letter}{data_row_num}")
-                            page_blank += 1
-                        elif len(str(val)) > 1:
-                            multiple_cells.append(f"{col_letter}{data_row_num}")
-                            page_multi += 1
-                        correct_val = self.answer_key.get(q, "")
-                        if correct_val != "":
-                            page_total += 1
-                            if "".join(str(val).split()).lower() == "".join(str(correct_val).split()).lower():
-                                page_score += 1
-
-                if sorted_qs and not is_absent:
-                    first_q_col = get_column_letter(q_start_col)
-                    last_q_col = get_column_letter(q_start_col + len(sorted_qs) - 1)
-                    score_formula = f'=SUMPRODUCT(({first_q_col}{data_row_num}:{last_q_col}{data_row_num}={first_q_col}$2:{last_q_col}$2)*1)'
-                    row.append(score_formula)
-                else:
-                    row.append("")
+                opts = res.get("options", {}) if not is_absent else {}
+                answers = [opts.get(q, "") for q in sorted_qs]
+                row.extend(answers)
+                row.append("")
 
-                ws.append(row)
                 if not is_absent:
-                    page_scores.append(page_score)
-                    page_totals.append(page_total)
-                    page_blank_counts.append(page_blank)
-                    page_multi_counts.append(page_multi)
-                data_row_num += 1
+                    graded_row_idx.append(len(data_rows))
+                    graded_answers.append(answers)
+                data_rows.append(row)
 
             # Append extra students (absent students added beyond PDF pages)
             for extra in extra_students:
@@ -4854,60 +6284,62 @@ class OMRSoftware(QMainWindow):
                 for q in sorted_qs:
                     row.append("")
                 row.append("")
-                ws.append(row)
-                data_row_num += 1
-        
-        last_data_row = data_row_num - 1
-        
-        for cell_ref in empty_cells:
-            ws[cell_ref].fill = yellow_fill
-        for cell_ref in multiple_cells:
-            ws[cell_ref].fill = orange_fill
-        
-        if sorted_qs and last_data_row >= first_data_row:
-            stats_row_num = data_row_num + 1
-            ws.cell(row=stats_row_num, column=1, value="% Correct").fill = green_fill
-            ws.cell(row=stats_row_num, column=1).font = header_font
-            
-            for q_idx, q in enumerate(sorted_qs):
-                col_num = q_start_col + q_idx
-                col_letter = get_column_letter(col_num)
-                data_range = f"{col_letter}{first_data_row}:{col_letter}{last_data_row}"
-                key_cell = f"{col_letter}$2"
-                percent_formula = f'=IF(COUNTA({data_range})>0, COUNTIF({data_range},{key_cell})/COUNTA({data_range})*100, 0)'
-                cell = ws.cell(row=stats_row_num, column=col_num, value=percent_formula)
-                cell.fill = green_fill
-                cell.alignment = center_align
-                cell.number_format = '0.0"%"'
-            
-            if sorted_qs:
-                first_q_col = get_column_letter(q_start_col)
-                last_q_col = get_column_letter(q_start_col + len(sorted_qs) - 1)
-                avg_formula = f'=AVERAGE({first_q_col}{stats_row_num}:{last_q_col}{stats_row_num})'
-                cell = ws.cell(row=stats_row_num, column=score_col, value=avg_formula)
-                cell.fill = green_fill
-                cell.alignment = center_align
-                cell.number_format = '0.0"%"'
-        
-        for col in range(1, len(headers) + 1):
-            ws.cell(row=1, column=col).font = header_font
-            ws.cell(row=1, column=col).alignment = center_align
+                data_rows.append(row)
+        
+        blank, multi, correct, key_set = self._grade_answer_matrix(graded_answers, key_values)
+        # Per graded row; the Summary sheet reduces these arrays directly
+        page_scores = correct.sum(axis=1)
+        page_blank_counts = blank.sum(axis=1)
+        page_multi_counts = multi.sum(axis=1)
+        
+        # Scores are written as numbers rather than SUMPRODUCT formulas, so
+        # opening the file triggers no recalculation
+        if sorted_qs:
+            for idx, score in zip(graded_row_idx, page_scores.tolist()):
+                data_rows[idx][-1] = score
+        for mask, style in ((blank, blank_style), (multi, multi_style)):
+            for r, c in zip(*np.nonzero(mask)):
+                row = data_rows[graded_row_idx[r]]
+                col = q_start_col - 1 + int(c)
+                row[col] = styled(ws, row[col], style=style)
+        for row in data_rows:
+            ws.append(row)
+        
+        if sorted_qs and data_rows:
+            # Per question: share of answered (non-blank) graded rows that
+            # match the key, precomputed like the scores above
+            answered = (~blank).sum(axis=0)
+            pct_correct = np.where(answered > 0, correct.sum(axis=0) * 100.0 / np.maximum(answered, 1), 0.0)
+            
+            # Build the whole stats row up front and append it in one call
+            def stats_cell(value):
+                return styled(ws, value, style=stats_style)
+
+            stats_row = [styled(ws, "% Correct", font=XL_HEADER_FONT, fill=XL_STATS_FILL)]
+            stats_row += [None] * (q_start_col - 2)
+            stats_row += [stats_cell(float(pct)) for pct in pct_correct]
+            stats_row.append(stats_cell(float(pct_correct.mean())))
+            
+            ws.append([])  # Blank spacer row between data and stats
+            ws.append(stats_row)
 
         if include_summary:
             summary = wb.create_sheet("Summary")
-            summary.append(["Metric", "Value"])
-            summary.cell(row=1, column=1).font = header_font
-            summary.cell(row=1, column=2).font = header_font
-
-            total_pages = len(page_scores)
-            total_questions = max(page_totals) if page_totals else 0
-            avg_score = statistics.mean(page_scores) if page_scores else 0
-            median_score = statistics.median(page_scores) if page_scores else 0
-            max_score = max(page_scores) if page_scores else 0
-            min_score = min(page_scores) if page_scores else 0
-            stdev_score = statistics.pstdev(page_scores) if len(page_scores) > 1 else 0
-            avg_blank = statistics.mean(page_blank_counts) if page_blank_counts else 0
-            avg_multi = statistics.mean(page_multi_counts) if page_multi_counts else 0
+            summary.append([styled(summary, h, font=XL_HEADER_FONT) for h in ("Metric", "Value")])
+
+            total_pages = int(page_scores.size)
+            total_questions = int(key_set.sum()) if total_pages else 0
+            if total_pages:
+                avg_score = float(page_scores.mean())
+                median_score = float(np.median(page_scores))
+                max_score = int(page_scores.max())
+                min_score = int(page_scores.min())
+                stdev_score = float(page_scores.std()) if total_pages > 1 else 0
+                avg_blank = float(page_blank_counts.mean())
+                avg_multi = float(page_multi_counts.mean())
+            else:
+                avg_score = median_score = max_score = min_score = stdev_score = 0
+                avg_blank = avg_multi = 0
 
             summary.append(["Total Pages", total_pages])
             summary.append(["Total Questions", total_questions])
@@ -4921,43 +6353,33 @@ class OMRSoftware(QMainWindow):
 
         if include_topics:
             topics_sheet = wb.create_sheet("Topics")
-            topics_sheet.append(["Question", "Topic"])
-            topics_sheet.cell(row=1, column=1).font = header_font
-            topics_sheet.cell(row=1, column=2).font = header_font
-            for q in sorted_qs:
-                topics_sheet.append([f"Q{q}", self.topic_map.get(q, "")])
-
-            topic_groups = {}
-            for q in sorted_qs:
-                topic = self.topic_map.get(q, "").strip() or "Unassigned"
-                topic_groups.setdefault(topic, []).append(q)
+            topics_sheet.append([styled(topics_sheet, h, font=XL_HEADER_FONT) for h in ("Question", "Topic")])
+            # One pass writes the Topics sheet and groups question columns
+            # (indices into sorted_qs) by topic for the analysis below
+            topic_cols = defaultdict(list)
+            for col, q in enumerate(sorted_qs):
+                topic = self.topic_map.get(q, "")
+                topics_sheet.append([f"Q{q}", topic])
+                topic_cols[topic.strip() or "Unassigned"].append(col)
 
             analysis = wb.create_sheet("Topic Analysis")
-            analysis.append(["Topic", "Questions", "Avg Score", "Avg %"])
-            for col in range(1, 5):
-                analysis.cell(row=1, column=col).font = header_font
-
-            pages_count = len(page_scores)
-            for topic, qs in topic_groups.items():
-                total_items = max(1, len(qs) * max(1, pages_count))
-                correct_count = 0
-                for p_idx, res in self.results.items():
-                    if self.first_page_key and p_idx == 0:
-                        continue
-                    opts = res.get("options", {})
-                    for q in qs:
-                        correct_val = self.answer_key.get(q, "")
-                        if correct_val == "":
-                            continue
-                        val = opts.get(q, "")
-                        if "".join(str(val).split()).lower() == "".join(str(correct_val).split()).lower():
-                            correct_count += 1
+            analysis.append([styled(analysis, h, font=XL_HEADER_FONT)
+                             for h in ("Topic", "Questions", "Avg Score", "Avg %")])
+
+            pages_count = int(page_scores.size)
+            # Topics reuse the graded answer matrix of the results sheet:
+            # correct answers per question, summed over each topic's columns
+            q_correct = correct.sum(axis=0)
+            for topic, cols in topic_cols.items():
+                total_items = max(1, len(cols) * max(1, pages_count))
+                correct_count = int(q_correct[cols].sum())
                 avg_score_topic = correct_count / max(1, pages_count)
                 avg_pct = correct_count / total_items * 100
-                analysis.append([topic, ", ".join([f"Q{q}" for q in qs]), avg_score_topic, avg_pct])
+                analysis.append([topic, ", ".join([f"Q{sorted_qs[c]}" for c in cols]), avg_score_topic, avg_pct])
             
         wb.save(output_path)
         print(f"  Excel saved: {output_path}")
+        return True
     
     def _export_images_internal(self, output_folder, progress=None, progress_offset=0):
         """Internal method to export images without file dialog.
@@ -4977,35 +6399,45 @@ class OMRSoftware(QMainWindow):
         # Reset alignment template for export
         self._reset_align_templates()
         
-        total_pages = len(self.pdf_document)
-        for page_idx in range(total_pages):
-            if progress is not None:
-                if progress.wasCanceled():
-                    return
-                progress.setLabelText(tr("progress_exporting_images", current=page_idx + 1, total=total_pages))
-                progress.setValue(progress_offset + page_idx)
-            QtWidgets.QApplication.processEvents()
+        answer_key_norm = {str(k): _normalize_answer(v) for k, v in self.answer_key.items()}
+        mark_geom = self._option_mark_geometry()
+        
+        # PNG encoding runs on a small pool while the next page renders
+        workers = max(1, min(4, os.cpu_count() or 1))
+        saves = deque()
+        saved_paths = set()  # queued saves may not be on disk yet
+        with ThreadPoolExecutor(max_workers=workers) as saver:
+            completed = self._export_page_images(output_folder, progress, progress_offset, answer_key_norm,
+                                                 mark_geom, saver, saves, saved_paths, workers)
+        
+        if completed:
+            print(f"  Images saved: {output_folder}")
 
-            # Skip absent pages
-            is_absent = self.student_absence.get(page_idx, False) if hasattr(self, 'student_absence') else False
-            if is_absent:
-                continue
+    def _export_page_images(self, output_folder, progress, progress_offset, answer_key_norm,
+                            mark_geom, saver, saves, saved_paths, max_pending):
+        """Page loop of _export_images_internal. Returns False if cancelled."""
+        total_pages = len(self.pdf_document)
+        # Skip absent pages
+        absence = getattr(self, 'student_absence', {})
+        pages = self._iter_export_qimages(
+            [i for i in range(total_pages) if not absence.get(i, False)])
+        last_pump = 0.0
+        for page_idx, qimg in pages:
+            # Throttle progress updates; each one re-enters the Qt event loop
+            now = time.monotonic()
+            if now - last_pump >= PROGRESS_PUMP_INTERVAL:
+                last_pump = now
+                if progress is not None:
+                    if progress.wasCanceled():
+                        pages.close()
+                        return False
+                    progress.setLabelText(tr("progress_exporting_images", current=page_idx + 1, total=total_pages))
+                    # Modal dialog: setValue processes pending events itself
+                    progress.setValue(progress_offset + page_idx)
+                else:
+                    QtWidgets.QApplication.processEvents()
             
-            page = self.pdf_document[page_idx]
-            mat = fitz.Matrix(2, 2)
-            pix = page.get_pixmap(matrix=mat)
-
-            img_pil = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            img_np = np.array(img_pil)
-
-            if self.check_auto_deskew.isChecked():
-                img_np, skew_angle = deskew_image(img_np)
-
-            if self.check_auto_align.isChecked():
-                img_np, (dx, dy), response = self.align_image(img_np, page_idx)
-
-            h, w = img_np.shape[:2]
-            qimg = QImage(img_np.data, w, h, img_np.strides[0], QImage.Format_RGB888).copy()
+            w = qimg.width()
             
             painter = QPainter(qimg)
             painter.setRenderHint(QPainter.Antialiasing)
@@ -5013,113 +6445,22 @@ class OMRSoftware(QMainWindow):
             page_results = self.results.get(page_idx, {}) if hasattr(self, 'results') else {}
             opts = page_results.get("options", {})
             off_x, off_y = self.page_offsets.get(page_idx, (0, 0))
-            page_score = 0
-            page_total = 0
-            
-            for mark in self.view.option_marks:
-                rect = mark.sceneBoundingRect()
-                q_num = mark.question_num
-                
-                if rect:
-                    x = int(rect.x() - off_x)
-                    y = int(rect.y() - off_y)
-                    mw = int(rect.width())
-                    mh = int(rect.height())
-                    
-                    painter.setPen(QPen(QColor(0, 100, 255), 2))
-                    painter.drawRect(x, y, mw, mh)
-                    
-                    q_num_int = int(q_num) if isinstance(q_num, (int, str)) and str(q_num).isdigit() else q_num
-                    student_answer = opts.get(q_num_int, "") or opts.get(q_num, "") or opts.get(str(q_num), "")
-                    correct_answer = self.answer_key.get(q_num_int, "") or self.answer_key.get(q_num, "") or self.answer_key.get(str(q_num), "")
-                    
-                    student_clean = "".join(str(student_answer).split()).upper()
-                    correct_clean = "".join(str(correct_answer).split()).upper()
-                    is_blank = student_clean == ""
-                    is_multi = len(student_clean) > 1
-                    is_correct = bool(correct_clean) and student_clean == correct_clean
-                    if correct_clean:
-                        page_total += 1
-                        if is_correct:
-                            page_score += 1
-                    
-                    num_options = getattr(mark, "options_count", 4)
-                    cell_width = mw // num_options
-                    option_labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:num_options]
-                    
-                    for i, opt_label in enumerate(option_labels):
-                        cell_x = x + i * cell_width
-                        cell_center_x = cell_x + cell_width // 2
-                        cell_center_y = y + mh // 2
-                        
-                        if correct_answer and opt_label.upper() == correct_answer.upper():
-                            painter.save()
-                            painter.setBrush(QBrush(QColor(255, 0, 0)))
-                            painter.setPen(QPen(QColor(255, 0, 0), 2))
-                            painter.drawEllipse(cell_center_x - 8, cell_center_y - 8, 16, 16)
-                            painter.restore()
-                        
-                        if student_answer and opt_label.upper() == student_answer.upper():
-                            if correct_answer and student_answer.upper() != correct_answer.upper():
-                                painter.save()
-                                painter.setPen(QPen(QColor(255, 0, 0), 3))
-                                painter.drawLine(cell_center_x - 8, cell_center_y - 8, cell_center_x + 8, cell_center_y + 8)
-                                painter.drawLine(cell_center_x + 8, cell_center_y - 8, cell_center_x - 8, cell_center_y + 8)
-                                painter.restore()
-                    
-                    if is_blank:
-                        painter.save()
-                        painter.setPen(QPen(QColor(255, 193, 7), 3))
-                        painter.drawRect(x, y, mw, mh)
-                        painter.restore()
-                    elif is_multi:
-                        painter.save()
-                        painter.setPen(QPen(QColor(255, 140, 0), 3))
-                        painter.drawRect(x, y, mw, mh)
-                        painter.restore()
-                    
-                    marker_x = x + mw + 8
-                    marker_y = y + mh // 2 + 5
-                    painter.save()
-                    painter.setFont(QFont("Arial", 11, QFont.Bold))
-                    if is_blank:
-                        painter.setPen(QPen(QColor(255, 193, 7), 2))
-                        painter.drawText(marker_x, marker_y, "Ø")
-                    elif is_multi:
-                        painter.setPen(QPen(QColor(255, 140, 0), 2))
-                        painter.drawText(marker_x, marker_y, "!")
-                    else:
-                        painter.setPen(QPen(QColor(40, 167, 69), 2) if is_correct else QPen(QColor(220, 53, 69), 2))
-                        painter.drawText(marker_x, marker_y, "✓" if is_correct else "✗")
-                    painter.restore()
-                    
-                    painter.setPen(QPen(QColor(0, 0, 0), 1))
-                    painter.setFont(QFont("Arial", 10, QFont.Bold))
-                    painter.drawText(x - 30, y + mh // 2 + 5, f"Q{q_num}")
-            
-            painter.save()
-            painter.setFont(QFont("Arial", 14, QFont.Bold))
-            painter.setPen(QPen(QColor(0, 0, 0), 2))
-            score_text = f"Score: {page_score}/{page_total}"
-            metrics = painter.fontMetrics()
-            text_width = metrics.horizontalAdvance(score_text)
-            x_pos = max(10, w - text_width - 10)
-            painter.drawText(x_pos, 30, score_text)
-            painter.restore()
+            self._paint_answer_overlay(painter, opts, off_x, off_y, w, answer_key_norm, mark_geom)
             painter.end()
             
             filename = self._get_page_filename(page_idx)
             # Avoid overwriting if two pages produce the same stem
             candidate = os.path.join(output_folder, f"{filename}.png")
             suffix = 1
-            while os.path.exists(candidate):
+            while candidate in saved_paths or os.path.exists(candidate):
                 candidate = os.path.join(output_folder, f"{filename}_{suffix}.png")
                 suffix += 1
-            qimg.save(candidate)
-        
-        print(f"  Images saved: {output_folder}")
+            saved_paths.add(candidate)
+            self._queue_image_save(saver, saves, qimg, candidate, max_pending)
+        return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     app = QtWidgets.QApplication(sys.argv)
     window = OMRSoftware()
     window.show()